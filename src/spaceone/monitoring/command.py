@@ -0,0 +1,35 @@
+import os
+
+import click
+
+from spaceone.core import config
+from spaceone.core.locator import Locator
+from spaceone.core.transaction import Transaction
+
+
+@click.group()
+def cli():
+    pass
+
+
+@cli.command()
+@click.argument('archive_files', nargs=-1, required=True, type=click.Path(exists=True))
+@click.option('-c', '--config', 'config_file', type=click.Path(exists=True),
+              default=lambda: os.environ.get('SPACEONE_CONFIG_FILE'), help='config file path')
+def restore(archive_files, config_file=None):
+    """Re-import archive files (<collection>-<timestamp>.ndjson.gz) created by the retention task"""
+    config.init_conf(package='spaceone.monitoring')
+    config.set_service_config()
+
+    if config_file:
+        config.set_file_conf(config_file)
+
+    archive_mgr = Locator(Transaction()).get_manager('ArchiveManager')
+
+    for archive_file in archive_files:
+        restored_count = archive_mgr.restore_archive(archive_file)
+        click.echo(f'{archive_file}: {restored_count} documents restored')
+
+
+if __name__ == '__main__':
+    cli()
@@ -50,12 +50,133 @@ WORKERS = {}
 TOKEN = ""
 TOKEN_INFO = {}
 
+# Identity Settings
+# After 'failure_threshold' consecutive connection failures, identity requests fail fast
+# and one trial request is made every 'reset_timeout' seconds.
+IDENTITY_CIRCUIT_BREAKER = {
+    'failure_threshold': 5,
+    'reset_timeout': 30
+}
+
 # Job Settings
 JOB_TIMEOUT = 600
+# Number of alerts checked by one escalation task (JobService.create_alert_notifications)
+ESCALATION_TASK_CHUNK_SIZE = 500
+
+# Maintenance Window Settings
+# Seconds to keep the maintenance index of a domain in process when changes cannot be shared through the cache
+MAINTENANCE_INDEX_TTL = 300
 
 # Event Settings
 SAME_EVENT_TIME = 600
 
+# Event Coalescing
+# Repeats of an event (same event_key, event_type and alert) within 'window' seconds update the latest event
+# (occurrence_count, last_occurred_at) instead of inserting a new one.
+# The latest 'max_occurrences' timestamps are kept in the occurrences field.
+EVENT_COALESCING = {
+    'enabled': False,
+    'window': 600,
+    'max_occurrences': 10
+}
+
+# Write-behind Event Buffer
+# Events are queued per process and written with one unordered insert_many() for up to 'max_documents' events
+# or every 'flush_interval_ms'. Alerts are still created synchronously.
+# Events that fail 'max_retries' times are saved to 'dead_letter_path' in the archive format
+# and can be re-imported with RetentionService.restore.
+EVENT_WRITE_BUFFER = {
+    'enabled': False,
+    'max_documents': 500,
+    'flush_interval_ms': 20,
+    'max_retries': 3,
+    'dead_letter_path': '/var/lib/spaceone/monitoring/dead_letter'
+}
+
+# Compiled global event rules are reloaded after this time (seconds) even without changes
+EVENT_RULE_CACHE_TTL = 300
+
+# Project ingest contexts (alert options, escalation policy and compiled project event rules)
+# are reloaded after this time (seconds) even without changes
+PROJECT_INGEST_CONTEXT_TTL = 300
+
+# Webhook Ingest Settings
+# SYNC: parse and save events in the REST request
+# ASYNC: validate the webhook, queue the payload and reply 202 (events are created by workers)
+EVENT_INGEST_MODE = 'SYNC'
+EVENT_INGEST_QUEUE = 'monitoring_q'
+
+# Webhook Rate Limit
+# Token buckets per webhook and per domain ('rate': tokens per second, 'burst': bucket size).
+# Each payload takes one token. Shed requests are answered with 429 and a Retry-After header.
+# A batch larger than 'burst' is admitted only when the bucket is full and takes a token per payload.
+# A bucket with a 'rate' or 'burst' of 0 does not limit the payloads.
+WEBHOOK_RATE_LIMIT = {
+    'enabled': False,
+    'webhook': {'rate': 50, 'burst': 100},
+    'domain': {'rate': 500, 'burst': 1000}
+}
+
+# Webhook Idempotency
+# Exact re-deliveries of a payload (same webhook and payload, or the same Idempotency-Key header)
+# within 'ttl' seconds are acknowledged without parsing or saving events.
+# Delivery keys are kept in the default cache, or in process ('max_size' keys) when no cache is configured.
+WEBHOOK_IDEMPOTENCY = {
+    'enabled': False,
+    'ttl': 300,
+    'max_size': 100000
+}
+
+# In-process webhook parsers ({plugin_id: parser_name}): alertmanager, grafana, aws_sns
+# A webhook can also select a parser with the 'native_parser' plugin option.
+# Payloads the parser does not recognize are parsed by the webhook plugin.
+WEBHOOK_NATIVE_PARSERS = {}
+
+# Maximum parallel Event.parse calls to a webhook plugin for a batch of payloads
+WEBHOOK_PARSE_CONCURRENCY = 8
+
+# Streaming NDJSON ingest (POST /monitoring/v1/webhook/{webhook_id}/{access_key}/events/stream)
+# The body is ingested in batches of 'batch_size' payloads. Lines longer than 'max_line_size' bytes abort the stream.
+# A rate limited batch is retried after Retry-After while the total wait is at most 'max_retry_wait' seconds.
+WEBHOOK_STREAM_INGEST = {
+    'batch_size': 500,
+    'max_line_size': 1048576,
+    'max_retry_wait': 60
+}
+
+# Ingest Metrics
+# Per-stage latency histograms (seconds) and event counters of EventService, exported at GET /metrics
+INGEST_METRICS = {
+    'enabled': False,
+    'buckets': [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+}
+
+# Plugin gRPC Channel Pool
+# Channels to plugin endpoints are shared by all connectors and closed after 'idle_timeout' seconds
+PLUGIN_CHANNEL_POOL = {
+    'keepalive_time_ms': 30000,
+    'keepalive_timeout_ms': 10000,
+    'max_concurrent_streams': 100,
+    'idle_timeout': 600,
+    'channel_options': []
+}
+
+# Resolved plugin endpoints are cached (seconds) and refreshed by PluginEndpointScheduler
+PLUGIN_ENDPOINT_CACHE_TTL = 600
+
+# Event Retention (RetentionScheduler)
+# Events, resolved alerts and their notes older than 'days' ('domains': {domain_id: days} overrides it)
+# are moved to gzip NDJSON files under 'archive_path'.
+# Restore: python -m spaceone.monitoring.command restore -c <config> <archive files>
+EVENT_RETENTION = {
+    'enabled': False,
+    'days': 90,
+    'domains': {},
+    'archive_enabled': True,
+    'archive_path': '/var/lib/spaceone/monitoring/archive',
+    'chunk_size': 1000
+}
+
 INSTALLED_DATA_SOURCE_PLUGINS = [
     # {
     #     'name': '',
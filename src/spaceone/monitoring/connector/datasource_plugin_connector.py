@@ -3,9 +3,9 @@ import logging
 from google.protobuf.json_format import MessageToDict
 
 from spaceone.core.connector import BaseConnector
-from spaceone.core import pygrpc
 from spaceone.core.utils import parse_endpoint
 from spaceone.core.error import *
+from spaceone.monitoring.connector import plugin_channel_pool
 
 __all__ = ['DataSourcePluginConnector']
 
@@ -25,7 +25,7 @@ class DataSourcePluginConnector(BaseConnector):
             endpoint = static_endpoint
 
         e = parse_endpoint(endpoint)
-        self.client = pygrpc.client(endpoint=f'{e.get("hostname")}:{e.get("port")}', version='plugin')
+        self.client = plugin_channel_pool.get_client(f'{e.get("hostname")}:{e.get("port")}', version='plugin')
 
     def init(self, options):
         response = self.client.DataSource.init({
@@ -0,0 +1,189 @@
+import logging
+import threading
+import time
+
+import grpc
+from spaceone.core import config
+from spaceone.core.error import *
+from spaceone.core.pygrpc.client import _GRPCClient
+
+__all__ = ['get_client', 'get_stats', 'close_all']
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_POOL_CONF = {
+    'keepalive_time_ms': 30000,
+    'keepalive_timeout_ms': 10000,
+    'max_concurrent_streams': 100,
+    'idle_timeout': 600,
+    'channel_options': []
+}
+
+_UNHEALTHY_STATES = [grpc.ChannelConnectivity.TRANSIENT_FAILURE, grpc.ChannelConnectivity.SHUTDOWN]
+
+_POOL = {}
+_ENDPOINT_LOCKS = {}
+_LOCK = threading.Lock()
+_STATS = {
+    'created': 0,
+    'reused': 0,
+    'reconnected': 0,
+    'evicted': 0
+}
+
+
+class _PooledChannel:
+
+    def __init__(self, endpoint, channel, client):
+        self.endpoint = endpoint
+        self.channel = channel
+        self.client = client
+        self.state = None
+        self.reuse_count = 0
+        self.created_at = time.time()
+        self.last_used_at = self.created_at
+
+        channel.subscribe(self._on_state_changed, try_to_connect=False)
+
+    def _on_state_changed(self, state):
+        self.state = state
+
+    def is_healthy(self):
+        return self.state not in _UNHEALTHY_STATES
+
+    def close(self):
+        try:
+            self.channel.unsubscribe(self._on_state_changed)
+            self.channel.close()
+        except Exception as e:
+            _LOGGER.debug(f'[_PooledChannel.close] Failed to close channel: {self.endpoint} ({e})')
+
+    def to_dict(self):
+        return {
+            'state': self.state.name if self.state else None,
+            'reuse_count': self.reuse_count,
+            'created_at': self.created_at,
+            'last_used_at': self.last_used_at
+        }
+
+
+def get_client(endpoint, **client_opts):
+    """Returns the gRPC client of the endpoint from the process-wide channel pool.
+
+    Channels are kept open with keepalive pings and shared by all connector instances.
+    A channel is reconnected when it is in TRANSIENT_FAILURE or SHUTDOWN state
+    and closed when it has not been used for 'idle_timeout' seconds.
+    """
+
+    pool_conf = _get_pool_conf()
+
+    client = _get_pooled_client(endpoint, pool_conf)
+    if client is not None:
+        return client
+
+    # Channels are created outside of the pool lock, so that a slow endpoint does not block the others
+    with _get_endpoint_lock(endpoint):
+        client = _get_pooled_client(endpoint, pool_conf)
+        if client is not None:
+            return client
+
+        pooled_channel = _create_pooled_channel(endpoint, pool_conf, client_opts)
+
+        with _LOCK:
+            pooled_channel.last_used_at = time.time()
+            _POOL[endpoint] = pooled_channel
+            _STATS['created'] += 1
+
+        return pooled_channel.client
+
+
+def get_stats():
+    with _LOCK:
+        stats = {
+            'open_channels': len(_POOL),
+            'endpoints': {endpoint: pooled_channel.to_dict() for endpoint, pooled_channel in _POOL.items()}
+        }
+        stats.update(_STATS)
+        return stats
+
+
+def close_all():
+    with _LOCK:
+        for pooled_channel in _POOL.values():
+            pooled_channel.close()
+
+        _POOL.clear()
+
+
+def _get_pool_conf():
+    pool_conf = _DEFAULT_POOL_CONF.copy()
+    pool_conf.update(config.get_global('PLUGIN_CHANNEL_POOL', {}))
+    return pool_conf
+
+
+def _get_endpoint_lock(endpoint):
+    with _LOCK:
+        return _ENDPOINT_LOCKS.setdefault(endpoint, threading.Lock())
+
+
+def _get_pooled_client(endpoint, pool_conf):
+    now = time.time()
+
+    with _LOCK:
+        _evict_idle_channels(now, pool_conf['idle_timeout'])
+
+        pooled_channel = _POOL.get(endpoint)
+
+        if pooled_channel is None:
+            return None
+
+        if not pooled_channel.is_healthy():
+            _LOGGER.debug(f'[get_client] Reconnect unhealthy channel: {endpoint} ({pooled_channel.state})')
+            pooled_channel.close()
+            del _POOL[endpoint]
+            _STATS['reconnected'] += 1
+            return None
+
+        pooled_channel.reuse_count += 1
+        pooled_channel.last_used_at = now
+        _STATS['reused'] += 1
+        return pooled_channel.client
+
+
+def _evict_idle_channels(now, idle_timeout):
+    for endpoint in list(_POOL.keys()):
+        if now - _POOL[endpoint].last_used_at > idle_timeout:
+            _LOGGER.debug(f'[_evict_idle_channels] Close idle channel: {endpoint}')
+            _POOL.pop(endpoint).close()
+            _STATS['evicted'] += 1
+
+
+def _make_channel_options(pool_conf):
+    options = [
+        ('grpc.keepalive_time_ms', pool_conf['keepalive_time_ms']),
+        ('grpc.keepalive_timeout_ms', pool_conf['keepalive_timeout_ms']),
+        ('grpc.keepalive_permit_without_calls', 1),
+        ('grpc.http2.max_pings_without_data', 0),
+        ('grpc.max_concurrent_streams', pool_conf['max_concurrent_streams'])
+    ]
+
+    for option in pool_conf['channel_options']:
+        options.append(tuple(option))
+
+    return options
+
+
+def _create_pooled_channel(endpoint, pool_conf, client_opts):
+    channel = grpc.insecure_channel(endpoint, options=_make_channel_options(pool_conf))
+
+    try:
+        client = _GRPCClient(channel, client_opts, endpoint)
+    except Exception as e:
+        channel.close()
+
+        if hasattr(e, 'details'):
+            raise ERROR_GRPC_CONNECTION(channel=endpoint, message=e.details())
+        else:
+            raise ERROR_GRPC_CONNECTION(channel=endpoint, message=str(e))
+
+    return _PooledChannel(endpoint, channel, client)
@@ -6,3 +6,4 @@ from spaceone.monitoring.error.event_rule import *
 from spaceone.monitoring.error.maintenance_window import *
 from spaceone.monitoring.error.alert import *
 from spaceone.monitoring.error.webhook import *
+from spaceone.monitoring.error.identity import *
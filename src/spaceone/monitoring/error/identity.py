@@ -0,0 +1,6 @@
+from spaceone.core.error import *
+
+
+class ERROR_IDENTITY_SERVICE_UNAVAILABLE(ERROR_BASE):
+    _status_code = 'UNAVAILABLE'
+    _message = 'Identity service is unavailable. Requests are skipped for {reset_timeout}s after repeated failures.'
@@ -3,3 +3,8 @@ from spaceone.core.error import *
 
 class ERROR_WEBHOOK_STATE_DISABLED(ERROR_INVALID_ARGUMENT):
     _message = 'Webhook state is disabled. (webhook_id = {webhook_id})'
+
+
+class ERROR_WEBHOOK_RATE_LIMIT_EXCEEDED(ERROR_BASE):
+    _status_code = 'RESOURCE_EXHAUSTED'
+    _message = 'Webhook rate limit exceeded. (webhook_id = {webhook_id}, retry_after = {retry_after}s)'
@@ -1,5 +1,9 @@
 import logging
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from spaceone.monitoring.connector import plugin_channel_pool
+from spaceone.monitoring.lib import event_write_buffer, ingest_metrics, rate_limiter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -9,3 +13,23 @@ router = APIRouter()
 @router.get('/check')
 async def check():
     return {'status': 'SERVING'}
+
+
+@router.get('/metrics', response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(ingest_metrics.render_prometheus(), media_type='text/plain; version=0.0.4')
+
+
+@router.get('/stat/plugin-channels')
+async def stat_plugin_channels():
+    return plugin_channel_pool.get_stats()
+
+
+@router.get('/stat/webhook-rate-limit')
+async def stat_webhook_rate_limit():
+    return {'shed_counts': rate_limiter.get_shed_counts()}
+
+
+@router.get('/stat/event-write-buffer')
+async def stat_event_write_buffer():
+    return event_write_buffer.get_stats()
@@ -1,8 +1,13 @@
+import asyncio
 import logging
 from fastapi import APIRouter, Request, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from spaceone.core.error import *
+from spaceone.core import config, utils
 from spaceone.core.locator import Locator
+from spaceone.monitoring.error.webhook import ERROR_WEBHOOK_RATE_LIMIT_EXCEEDED
 from spaceone.monitoring.service import EventService
 
 _LOGGER = logging.getLogger(__name__)
@@ -10,6 +15,20 @@ _LOGGER = logging.getLogger(__name__)
 router = APIRouter()
 
 
+class _RequestStreamingResponse(StreamingResponse):
+    """Streams a response while the request body is still being read.
+
+    StreamingResponse watches the receive channel for a disconnect on older ASGI servers,
+    which would consume the request body that the content generator reads.
+    """
+
+    async def __call__(self, scope, receive, send):
+        await self.stream_response(send)
+
+        if self.background is not None:
+            await self.background()
+
+
 @router.post('/webhook/{webhook_id}/{access_key}/events')
 async def create_event(webhook_id: str, access_key: str, request: Request):
     locator = Locator()
@@ -20,14 +39,294 @@ async def create_event(webhook_id: str, access_key: str, request: Request):
             _LOGGER.debug(f'JSON Parsing Error: {e}')
             raise ERROR_UNKNOWN(message='JSON Parsing Error: Request body requires JSON format.')
 
-        event_service: EventService = locator.get_service('EventService')
-        event_service.create({
+        params = {
             'webhook_id': webhook_id,
             'access_key': access_key,
             'data': data or {}
-        })
-        return {}
+        }
+
+        _set_idempotency_key(params, request)
+
+        event_service: EventService = locator.get_service('EventService')
+
+        if _is_async_ingest_mode():
+            await run_in_threadpool(event_service.accept, params)
+            return JSONResponse(status_code=202, content={})
+        else:
+            await run_in_threadpool(event_service.create, params)
+            return {}
+    except ERROR_WEBHOOK_RATE_LIMIT_EXCEEDED as e:
+        raise HTTPException(status_code=429, detail=e.message, headers={'Retry-After': str(e.meta['retry_after'])})
+    except ERROR_BASE as e:
+        raise HTTPException(status_code=500, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f'Unknown Error: {str(e)}')
+
+
+@router.post('/webhook/{webhook_id}/{access_key}/events/batch')
+async def create_events(webhook_id: str, access_key: str, request: Request):
+    locator = Locator()
+    try:
+        data_list = await _parse_batch_body(request)
+
+        params = {
+            'webhook_id': webhook_id,
+            'access_key': access_key,
+            'data_list': data_list
+        }
+
+        _set_idempotency_key(params, request)
+
+        event_service: EventService = locator.get_service('EventService')
+
+        if _is_async_ingest_mode():
+            await run_in_threadpool(event_service.accept, params)
+            return JSONResponse(status_code=202, content={})
+        else:
+            results = await run_in_threadpool(event_service.create_batch, params)
+            return {'results': results}
+    except ERROR_WEBHOOK_RATE_LIMIT_EXCEEDED as e:
+        raise HTTPException(status_code=429, detail=e.message, headers={'Retry-After': str(e.meta['retry_after'])})
+    except ERROR_BASE as e:
+        raise HTTPException(status_code=500, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f'Unknown Error: {str(e)}')
+
+
+@router.post('/webhook/{webhook_id}/{access_key}/events/stream')
+async def create_events_stream(webhook_id: str, access_key: str, request: Request):
+    """Ingest an NDJSON body of any size in bounded batches.
+
+    The body is read incrementally and only one batch of payloads is held in memory.
+    The response is NDJSON with a progress line per batch (and the failed payloads) followed by a summary line.
+    """
+    locator = Locator()
+    event_service: EventService = locator.get_service('EventService')
+    stream_conf = _get_stream_ingest_conf()
+    batches = _iter_ndjson_batches(request, stream_conf['batch_size'], stream_conf['max_line_size'])
+
+    # The first batch is processed before the response starts, so that an invalid webhook or access key
+    # is answered with an error status instead of a summary line.
+    try:
+        first_batch = await batches.__anext__()
+        first_results = await _ingest_stream_batch(event_service, webhook_id, access_key, first_batch,
+                                                   stream_conf['max_retry_wait'])
+    except StopAsyncIteration:
+        first_batch = None
+        first_results = []
+    except ERROR_WEBHOOK_RATE_LIMIT_EXCEEDED as e:
+        raise HTTPException(status_code=429, detail=e.message, headers={'Retry-After': str(e.meta['retry_after'])})
     except ERROR_BASE as e:
         raise HTTPException(status_code=500, detail=e.message)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f'Unknown Error: {str(e)}')
+
+    async def _generate_results():
+        summary = {'status': 'SUCCESS', 'received': 0, 'succeeded': 0, 'duplicated': 0, 'failed': 0, 'event_count': 0,
+                   'batches': 0}
+
+        def _make_progress(batch, results):
+            summary['batches'] += 1
+            summary['received'] += len(batch)
+
+            failures = []
+            for result in results:
+                summary['event_count'] += result.get('event_count', 0)
+
+                if result['status'] == 'FAILURE':
+                    summary['failed'] += 1
+                    failures.append({
+                        'line': batch[result['index']][0],
+                        'message': result.get('message')
+                    })
+                elif result['status'] == 'DUPLICATE':
+                    summary['duplicated'] += 1
+                else:
+                    summary['succeeded'] += 1
+
+            progress = {
+                'batch': summary['batches'],
+                'received': summary['received'],
+                'succeeded': summary['succeeded'],
+                'duplicated': summary['duplicated'],
+                'failed': summary['failed']
+            }
+
+            if failures:
+                progress['failures'] = failures
+
+            return _dump_ndjson_line(progress)
+
+        if first_batch is not None:
+            yield _make_progress(first_batch, first_results)
+
+            try:
+                async for batch in batches:
+                    results = await _ingest_stream_batch(event_service, webhook_id, access_key, batch,
+                                                         stream_conf['max_retry_wait'])
+                    yield _make_progress(batch, results)
+            except ERROR_BASE as e:
+                summary['status'] = 'FAILURE'
+                summary['message'] = e.message
+            except Exception as e:
+                summary['status'] = 'FAILURE'
+                summary['message'] = f'Unknown Error: {str(e)}'
+
+        yield _dump_ndjson_line(summary)
+
+    return _RequestStreamingResponse(_generate_results(), media_type='application/x-ndjson')
+
+
+def _get_stream_ingest_conf():
+    stream_conf = config.get_global('WEBHOOK_STREAM_INGEST', {})
+
+    return {
+        'batch_size': stream_conf.get('batch_size', 500),
+        'max_line_size': stream_conf.get('max_line_size', 1048576),
+        'max_retry_wait': stream_conf.get('max_retry_wait', 60)
+    }
+
+
+async def _iter_ndjson_batches(request: Request, batch_size, max_line_size):
+    """Yields lists of (line number, payload) from the request body without reading it whole.
+    The payload is None if the line is not a JSON object.
+    """
+    batch = []
+    buffer = b''
+    line_number = 0
+
+    def _flush_line(line):
+        nonlocal line_number
+        line_number += 1
+
+        if line.strip():
+            batch.append((line_number, _load_ndjson_line(line)))
+
+    async for chunk in request.stream():
+        buffer += chunk
+
+        while True:
+            position = buffer.find(b'\n')
+            if position < 0:
+                break
+
+            _flush_line(buffer[:position])
+            buffer = buffer[position + 1:]
+
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if len(buffer) > max_line_size:
+            raise ERROR_UNKNOWN(message=f'NDJSON Parsing Error: Line {line_number + 1} exceeds {max_line_size} bytes.')
+
+    _flush_line(buffer)
+
+    if batch:
+        yield batch
+
+
+def _load_ndjson_line(line):
+    try:
+        data = utils.load_json(line.decode('utf-8'))
+    except Exception as e:
+        _LOGGER.debug(f'JSON Parsing Error: {e}')
+        return None
+
+    if data is None:
+        return {}
+    elif isinstance(data, dict):
+        return data
+    else:
+        return None
+
+
+async def _ingest_stream_batch(event_service, webhook_id, access_key, batch, max_retry_wait):
+    """Ingests the valid payloads of a batch. Lines that are not JSON objects are reported as failures."""
+    results = []
+    data_list = []
+    indexes = []
+    for index, (_, data) in enumerate(batch):
+        if data is None:
+            results.append({'index': index, 'status': 'FAILURE', 'message': 'JSON Parsing Error'})
+        else:
+            data_list.append(data)
+            indexes.append(index)
+
+    if data_list:
+        params = {
+            'webhook_id': webhook_id,
+            'access_key': access_key,
+            'data_list': data_list
+        }
+
+        for result in await _create_events_with_retry(event_service, params, max_retry_wait):
+            result['index'] = indexes[result['index']]
+            results.append(result)
+
+    return sorted(results, key=lambda result: result['index'])
+
+
+async def _create_events_with_retry(event_service, params, max_retry_wait):
+    waited = 0
+    while True:
+        try:
+            if _is_async_ingest_mode():
+                return await run_in_threadpool(event_service.accept, dict(params))
+            else:
+                return await run_in_threadpool(event_service.create_batch, dict(params))
+        except ERROR_WEBHOOK_RATE_LIMIT_EXCEEDED as e:
+            # Slow the upload down instead of dropping the rest of the stream
+            retry_after = e.meta['retry_after']
+            if waited + retry_after > max_retry_wait:
+                raise
+
+            waited += retry_after
+            await asyncio.sleep(retry_after)
+
+
+def _dump_ndjson_line(data):
+    return utils.dump_json(data) + '\n'
+
+
+def _set_idempotency_key(params, request: Request):
+    idempotency_key = request.headers.get('idempotency-key')
+
+    if idempotency_key:
+        params['idempotency_key'] = idempotency_key
+
+
+def _is_async_ingest_mode():
+    return config.get_global('EVENT_INGEST_MODE', 'SYNC') == 'ASYNC'
+
+
+async def _parse_batch_body(request: Request):
+    content_type = request.headers.get('content-type', '')
+
+    try:
+        if 'ndjson' in content_type:
+            body = await request.body()
+            lines = [(line_number, line) for line_number, line in enumerate(body.decode('utf-8').splitlines(), 1)
+                     if line.strip()]
+            return [_check_batch_item(utils.load_json(line), f'Line {line_number}') for line_number, line in lines]
+        else:
+            data_list = await request.json()
+    except ERROR_BASE as e:
+        raise e
+    except Exception as e:
+        _LOGGER.debug(f'JSON Parsing Error: {e}')
+        raise ERROR_UNKNOWN(message='JSON Parsing Error: Request body requires JSON array or NDJSON format.')
+
+    if not isinstance(data_list, list):
+        raise ERROR_UNKNOWN(message='JSON Parsing Error: Request body requires JSON array or NDJSON format.')
+
+    return [_check_batch_item(data, f'Item {index}') for index, data in enumerate(data_list)]
+
+
+def _check_batch_item(data, position):
+    if data is None:
+        return {}
+    elif isinstance(data, dict):
+        return data
+    else:
+        raise ERROR_UNKNOWN(message=f'JSON Parsing Error: {position} of the request body is not a JSON object.')
@@ -0,0 +1,47 @@
+import logging
+
+from spaceone.core import config
+from spaceone.core.token import get_token
+from spaceone.core.locator import Locator
+from spaceone.core.scheduler import IntervalScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PluginEndpointScheduler(IntervalScheduler):
+
+    def __init__(self, queue, interval):
+        super().__init__(queue, interval)
+        self.locator = Locator()
+        self._init_config()
+
+    def _init_config(self):
+        self._token = get_token('TOKEN')
+
+    def _create_metadata(self, resource):
+        return {
+            'token': self._token,
+            'service': 'monitoring',
+            'resource': resource,
+            'verb': 'refresh_plugin_endpoints'
+        }
+
+    def create_task(self):
+        stp_list = []
+        for service, resource in [('WebhookService', 'Webhook'), ('DataSourceService', 'DataSource')]:
+            stp_list.append({
+                'name': 'plugin_endpoint_schedule',
+                'version': 'v1',
+                'executionEngine': 'BaseWorker',
+                'stages': [{
+                    'locator': 'SERVICE',
+                    'name': service,
+                    'metadata': self._create_metadata(resource),
+                    'method': 'refresh_plugin_endpoints',
+                    'params': {
+                        'params': {}
+                    }
+                }]
+            })
+
+        return stp_list
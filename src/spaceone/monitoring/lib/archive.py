@@ -0,0 +1,121 @@
+import gzip
+import os
+from typing import Iterator, List
+
+from bson import json_util
+from pymongo.errors import BulkWriteError
+
+from spaceone.core.error import *
+from spaceone.core.model.mongo_model import MongoModel
+
+__all__ = ['ArchiveWriter', 'iter_document_chunks', 'delete_documents', 'iter_archive_chunks', 'restore_documents']
+
+_DUPLICATE_KEY_ERROR = 11000
+
+
+class ArchiveWriter:
+    """Appends raw documents to a gzip compressed NDJSON file (MongoDB extended JSON).
+
+    The file is created on the first write, so no empty archive is left behind.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.count = 0
+        self._file = None
+
+    def write(self, documents: List[dict]):
+        if len(documents) == 0:
+            return
+
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            self._file = gzip.open(self.file_path, 'at', encoding='utf-8')
+
+        for document in documents:
+            self._file.write(json_util.dumps(document))
+            self._file.write('\n')
+
+        self._file.flush()
+        self.count += len(documents)
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def iter_document_chunks(model: MongoModel, query: dict, chunk_size=1000) -> Iterator[List[dict]]:
+    """Yields raw documents matching the query in _id order, at most chunk_size documents at a time."""
+    collection = model._get_collection()
+    last_id = None
+
+    while True:
+        chunk_query = dict(query)
+        if last_id is not None:
+            chunk_query['_id'] = {'$gt': last_id}
+
+        documents = list(collection.find(chunk_query).sort('_id', 1).limit(chunk_size))
+
+        if len(documents) == 0:
+            break
+
+        yield documents
+
+        if len(documents) < chunk_size:
+            break
+
+        last_id = documents[-1]['_id']
+
+
+def delete_documents(model: MongoModel, documents: List[dict]):
+    if len(documents) == 0:
+        return 0
+
+    try:
+        result = model._get_collection().delete_many({'_id': {'$in': [document['_id'] for document in documents]}})
+    except Exception as e:
+        raise ERROR_DB_QUERY(reason=e)
+
+    return result.deleted_count
+
+
+def iter_archive_chunks(file_path, chunk_size=1000) -> Iterator[List[dict]]:
+    documents = []
+
+    with gzip.open(file_path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                documents.append(json_util.loads(line))
+
+            if len(documents) >= chunk_size:
+                yield documents
+                documents = []
+
+    if documents:
+        yield documents
+
+
+def restore_documents(model: MongoModel, documents: List[dict]):
+    """Re-inserts archived documents. Documents that already exist are skipped, so a restore can be rerun."""
+    if len(documents) == 0:
+        return 0
+
+    try:
+        result = model._get_collection().insert_many(documents, ordered=False)
+        return len(result.inserted_ids)
+    except BulkWriteError as e:
+        write_errors = e.details.get('writeErrors', [])
+
+        if any(error.get('code') != _DUPLICATE_KEY_ERROR for error in write_errors):
+            raise ERROR_DB_QUERY(reason=e)
+
+        return e.details.get('nInserted', 0)
+    except Exception as e:
+        raise ERROR_DB_QUERY(reason=e)
@@ -0,0 +1,73 @@
+from datetime import datetime
+from typing import List, Tuple
+
+from bson import ObjectId
+from pymongo import UpdateOne
+from spaceone.core import utils
+from spaceone.core.error import *
+from spaceone.core.model.mongo_model import MongoModel
+
+__all__ = ['make_document', 'insert_documents', 'update_fields']
+
+
+def make_document(model, data: dict) -> MongoModel:
+    """Build an unsaved document the same way MongoModel.create() does.
+
+    Generated ids and auto_now(_add) fields are filled in client side so that the document
+    can be written with insert_many() and referenced before it is saved.
+    """
+    create_data = {}
+
+    for name, field in model._fields.items():
+        if name in data:
+            create_data[name] = data[name]
+        else:
+            generate_id = getattr(field, 'generate_id', None)
+            if generate_id:
+                create_data[name] = utils.generate_id(generate_id)
+
+            if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+                create_data[name] = datetime.utcnow()
+
+    return model(**create_data)
+
+
+def insert_documents(model, documents: List[MongoModel], ordered=True) -> List[MongoModel]:
+    """Write documents with a single insert_many() and set their primary keys in place."""
+    if len(documents) == 0:
+        return []
+
+    raw_documents = [document.to_mongo() for document in documents]
+
+    try:
+        result = model._get_collection().insert_many(raw_documents, ordered=ordered)
+    except Exception as e:
+        raise ERROR_DB_QUERY(reason=e)
+
+    for document, document_id in zip(documents, result.inserted_ids):
+        document.pk = document_id
+
+    return documents
+
+
+def update_fields(model, updates: List[Tuple[ObjectId, dict]]):
+    """Set fields of many documents with a single unordered bulk_write() of $set operations.
+
+    Values must already be in their raw form. auto_now fields are refreshed the same way MongoModel.update() does.
+    """
+    if len(updates) == 0:
+        return
+
+    now = datetime.utcnow()
+    auto_now_fields = {field.db_field: now for field in model._fields.values() if getattr(field, 'auto_now', False)}
+
+    operations = []
+    for document_id, data in updates:
+        raw_data = {model._fields[name].db_field: value for name, value in data.items()}
+        raw_data.update(auto_now_fields)
+        operations.append(UpdateOne({'_id': document_id}, {'$set': raw_data}))
+
+    try:
+        model._get_collection().bulk_write(operations, ordered=False)
+    except Exception as e:
+        raise ERROR_DB_QUERY(reason=e)
@@ -0,0 +1,67 @@
+import threading
+import time
+
+__all__ = ['allow', 'record_success', 'record_failure', 'get_state', 'reset']
+
+# name -> {'failures': int, 'opened_at': float}
+_CIRCUITS = {}
+_LOCK = threading.Lock()
+
+
+def allow(name, reset_timeout):
+    """Returns whether a call may be made.
+
+    An open circuit lets one trial call through every 'reset_timeout' seconds (half-open).
+    Circuits are kept in process, so each worker finds out about an outage by itself.
+    """
+
+    with _LOCK:
+        circuit = _CIRCUITS.get(name)
+
+        if circuit is None or circuit['opened_at'] is None:
+            return True
+
+        if time.time() - circuit['opened_at'] >= reset_timeout:
+            circuit['opened_at'] = time.time()
+            return True
+
+        return False
+
+
+def record_success(name):
+    with _LOCK:
+        _CIRCUITS.pop(name, None)
+
+
+def record_failure(name, failure_threshold):
+    """Counts a failed call.
+
+    Returns:
+        is_opened (bool): True if this failure opened the circuit
+    """
+
+    with _LOCK:
+        circuit = _CIRCUITS.setdefault(name, {'failures': 0, 'opened_at': None})
+        circuit['failures'] += 1
+
+        if circuit['failures'] >= failure_threshold:
+            is_opened = circuit['opened_at'] is None
+            circuit['opened_at'] = time.time()
+            return is_opened
+
+        return False
+
+
+def get_state(name):
+    with _LOCK:
+        circuit = _CIRCUITS.get(name)
+
+        if circuit is None or circuit['opened_at'] is None:
+            return 'CLOSED'
+        else:
+            return 'OPEN'
+
+
+def reset():
+    with _LOCK:
+        _CIRCUITS.clear()
@@ -0,0 +1,132 @@
+from datetime import datetime, timedelta
+from typing import List, NamedTuple, Optional
+
+__all__ = ['ESCALATION_FIELDS', 'EscalationDecision', 'evaluate_escalations']
+
+# Alert fields needed to decide escalations, loaded as raw rows instead of documents
+ESCALATION_FIELDS = ['alert_id', 'project_id', 'escalation_policy_id', 'state', 'urgency', 'is_snoozed',
+                     'snoozed_end_time', 'escalation_step', 'escalation_ttl', 'escalated_at', 'next_escalation_at']
+
+
+class EscalationDecision(NamedTuple):
+    row: dict
+    # Alert fields to set, None if the alert is not changed
+    update: Optional[dict]
+    is_notify: bool
+    notification_level: Optional[str]
+    # SNOOZED, NOTIFICATION_URGENCY, FINISH_CONDITION or MAINTENANCE_WINDOW
+    mute_reason: Optional[str]
+
+
+def evaluate_escalations(rows: List[dict], escalation_policies: dict, alert_options: dict,
+                         maintenance_window_states: dict, now: datetime = None) -> List[EscalationDecision]:
+    """Decides the escalation of a chunk of alert rows.
+
+    Args:
+        rows (list): alert rows with ESCALATION_FIELDS
+        escalation_policies (dict): {escalation_policy_id: (rules, finish_condition)}
+        alert_options (dict): {project_id: project alert options}
+        maintenance_window_states (dict): {project_id: 'OPEN' | 'CLOSED'}
+        now (datetime): evaluation time
+
+    Returns:
+        decisions (list): one EscalationDecision per row
+    """
+
+    now = now or datetime.utcnow()
+
+    # Escalation delays of each step, computed once per policy
+    step_delays = {
+        escalation_policy_id: [timedelta(minutes=rule.get('escalate_minutes', 0)) for rule in rules]
+        for escalation_policy_id, (rules, finish_condition) in escalation_policies.items()
+    }
+
+    decisions = []
+    for row in rows:
+        project_id = row['project_id']
+        escalation_policy_id = row['escalation_policy_id']
+        rules, finish_condition = escalation_policies[escalation_policy_id]
+
+        mute_reason = _get_mute_reason(row, finish_condition, alert_options[project_id],
+                                       maintenance_window_states[project_id], now)
+
+        if mute_reason == 'SNOOZED':
+            # Escalation is resumed when the snooze ends
+            decisions.append(EscalationDecision(row, {'next_escalation_at': row['snoozed_end_time']},
+                                                False, None, mute_reason))
+        elif mute_reason:
+            decisions.append(EscalationDecision(row, {'escalation_ttl': 0, 'next_escalation_at': None},
+                                                False, None, mute_reason))
+        else:
+            is_notify, update = _escalate(row, step_delays[escalation_policy_id], now)
+
+            if is_notify:
+                notification_level = rules[update.get('escalation_step', row['escalation_step']) - 1][
+                    'notification_level']
+            else:
+                notification_level = None
+
+            decisions.append(EscalationDecision(row, update, is_notify, notification_level, None))
+
+    return decisions
+
+
+def _get_mute_reason(row, finish_condition, alert_options, maintenance_window_state, now):
+    snoozed_end_time = row.get('snoozed_end_time')
+
+    if row.get('is_snoozed') and snoozed_end_time and snoozed_end_time > now:
+        return 'SNOOZED'
+    elif alert_options['notification_urgency'] == 'HIGH' and row['urgency'] == 'LOW':
+        return 'NOTIFICATION_URGENCY'
+    elif finish_condition == 'ACKNOWLEDGED' and row['state'] == 'ACKNOWLEDGED':
+        return 'FINISH_CONDITION'
+    elif maintenance_window_state == 'OPEN':
+        return 'MAINTENANCE_WINDOW'
+    else:
+        return None
+
+
+def _escalate(row, step_delays, now):
+    current_step = row.get('escalation_step', 1)
+    escalation_ttl = row.get('escalation_ttl', 0)
+    escalated_at = row.get('escalated_at')
+
+    # First triggered alert
+    if escalated_at is None:
+        return True, {
+            'escalated_at': now,
+            'next_escalation_at': now + step_delays[current_step - 1]
+        }
+
+    next_escalation_at = escalated_at + step_delays[current_step - 1]
+
+    # now > escalated_at + escalate_minutes
+    if now > next_escalation_at:
+        # When the current step is the maximum
+        if len(step_delays) == current_step:
+            if escalation_ttl == 1:
+                return False, {
+                    'escalated_at': now,
+                    'escalation_ttl': 0,
+                    'next_escalation_at': None
+                }
+            else:
+                # Repeat again from the first step
+                return True, {
+                    'escalated_at': now,
+                    'escalation_step': 1,
+                    'escalation_ttl': escalation_ttl - 1,
+                    'next_escalation_at': now + step_delays[0]
+                }
+        else:
+            return True, {
+                'escalated_at': now,
+                'escalation_step': current_step + 1,
+                'next_escalation_at': now + step_delays[current_step]
+            }
+
+    # Not due yet, e.g. acknowledged or checked before the escalation time was recorded
+    if row.get('next_escalation_at') != next_escalation_at:
+        return False, {'next_escalation_at': next_escalation_at}
+
+    return False, None
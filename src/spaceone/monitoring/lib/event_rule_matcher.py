@@ -0,0 +1,291 @@
+from collections import deque
+from typing import List
+
+from spaceone.core import utils
+
+__all__ = ['ConditionMatcher', 'EventRuleMatcher', 'IndexedEventRuleSet', 'AhoCorasickAutomaton',
+           'compile_event_rules']
+
+# Event data fields that are changed by each event rule action
+ACTION_FIELDS = {
+    'change_project': 'project_id',
+    'change_assignee': 'assignee',
+    'change_urgency': 'urgency',
+    'add_project_dependency': 'project_dependencies',
+    'add_responder': 'responders',
+    'add_additional_info': 'additional_info',
+    'no_notification': 'no_notification'
+}
+
+
+class ConditionMatcher:
+    """Event rule condition with the key path split and the operand lowered in advance."""
+
+    __slots__ = ('key', 'keys', 'operator', 'value', 'lower_value')
+
+    def __init__(self, key, operator, value):
+        self.key = key
+        self.keys = tuple(key.split('.'))
+        self.operator = operator
+        self.value = value
+        self.lower_value = value.lower() if isinstance(value, str) else value
+
+    def get_event_value(self, event_data):
+        value = event_data
+        for key in self.keys:
+            if isinstance(value, dict):
+                value = value.get(key)
+            elif isinstance(value, list):
+                # Same behavior as the dotted key lookup of spaceone.core.utils
+                return utils.get_dict_value(event_data, self.key)
+            else:
+                return None
+
+        return value
+
+    def match(self, event_data):
+        return self.match_value(self.get_event_value(event_data))
+
+    def match_value(self, event_value):
+        if event_value is None:
+            return False
+
+        operator = self.operator
+
+        if operator == 'eq':
+            return event_value == self.value
+        elif operator == 'not':
+            return event_value != self.value
+        elif operator == 'contain':
+            return str(event_value).lower().find(self.lower_value) >= 0
+        elif operator == 'not_contain':
+            return str(event_value).lower().find(self.lower_value) < 0
+
+        return False
+
+
+class EventRuleMatcher:
+    """Compiled event rule. Conditions are evaluated lazily so ALL/ANY stop at the first decisive result."""
+
+    __slots__ = ('event_rule_id', 'order', 'conditions', 'match_all', 'actions', 'stop_processing', 'changed_fields')
+
+    def __init__(self, event_rule_id, order, conditions, conditions_policy, actions, stop_processing):
+        self.event_rule_id = event_rule_id
+        self.order = order
+        self.conditions = tuple(ConditionMatcher(condition['key'], condition.get('operator'), condition['value'])
+                                for condition in conditions)
+        self.match_all = conditions_policy == 'ALL'
+        self.actions = actions
+        self.stop_processing = stop_processing
+        self.changed_fields = frozenset(ACTION_FIELDS[action] for action in actions if action in ACTION_FIELDS)
+
+    def match(self, event_data):
+        if self.match_all:
+            return all(condition.match(event_data) for condition in self.conditions)
+        else:
+            return any(condition.match(event_data) for condition in self.conditions)
+
+
+class AhoCorasickAutomaton:
+    """Multi-pattern substring matcher. Search cost depends on the text length, not on the number of patterns."""
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [set()]
+
+        for pattern_id, pattern in enumerate(patterns):
+            self._add_pattern(pattern_id, pattern)
+
+        self._build()
+
+    def _add_pattern(self, pattern_id, pattern):
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+
+            state = next_state
+
+        self._output[state].add(pattern_id)
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fail_state = self._fail[state]
+                while fail_state and char not in self._goto[fail_state]:
+                    fail_state = self._fail[fail_state]
+
+                self._fail[next_state] = self._goto[fail_state].get(char, 0)
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def search(self, text):
+        """Returns the ids of all patterns contained in the text."""
+        matched = set()
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+
+            state = goto[state].get(char, 0)
+
+            if output[state]:
+                matched |= output[state]
+
+        # An empty pattern is contained in every text
+        matched |= output[0]
+        return matched
+
+
+class _KeyIndex:
+    """Conditions of one key, indexed by operator."""
+
+    def __init__(self, key):
+        self.getter = ConditionMatcher(key, 'eq', None)
+        self.eq_index = {}
+        self.not_index = {}
+        self.not_condition_ids = []
+        self.patterns = {}
+        self.contain_condition_ids = {}
+        self.not_contain_condition_ids = {}
+        self.automaton = None
+
+    def add_condition(self, condition_id, condition: ConditionMatcher):
+        if condition.operator == 'eq':
+            self.eq_index.setdefault(condition.value, []).append(condition_id)
+        elif condition.operator == 'not':
+            self.not_index.setdefault(condition.value, []).append(condition_id)
+            self.not_condition_ids.append(condition_id)
+        elif condition.operator in ['contain', 'not_contain']:
+            pattern_id = self.patterns.setdefault(condition.lower_value, len(self.patterns))
+
+            if condition.operator == 'contain':
+                self.contain_condition_ids.setdefault(pattern_id, []).append(condition_id)
+            else:
+                self.not_contain_condition_ids.setdefault(pattern_id, []).append(condition_id)
+
+    def build(self):
+        if self.patterns:
+            self.automaton = AhoCorasickAutomaton(list(self.patterns.keys()))
+
+    def get_satisfied_conditions(self, event_value):
+        satisfied = []
+
+        try:
+            satisfied.extend(self.eq_index.get(event_value, []))
+            unsatisfied_not = set(self.not_index.get(event_value, []))
+        except TypeError:
+            # Unhashable values (dict, list) never equal a condition value
+            unsatisfied_not = set()
+
+        satisfied.extend(condition_id for condition_id in self.not_condition_ids
+                         if condition_id not in unsatisfied_not)
+
+        if self.automaton:
+            matched_patterns = self.automaton.search(str(event_value).lower())
+
+            for pattern_id in matched_patterns:
+                satisfied.extend(self.contain_condition_ids.get(pattern_id, []))
+
+            for pattern_id, condition_ids in self.not_contain_condition_ids.items():
+                if pattern_id not in matched_patterns:
+                    satisfied.extend(condition_ids)
+
+        return satisfied
+
+
+class IndexedEventRuleSet:
+    """Ordered event rules matched through per-key indexes instead of evaluating every condition.
+
+    'eq' and 'not' conditions are looked up in a hash index keyed on the event value.
+    'contain' and 'not_contain' conditions of a key share one Aho-Corasick automaton.
+    """
+
+    def __init__(self, event_rules: List[EventRuleMatcher]):
+        self.event_rules = event_rules
+        self._condition_rules = []
+        self._condition_counts = []
+        self._always_matched = []
+        self._key_indexes = {}
+
+        for rule_index, event_rule in enumerate(event_rules):
+            self._condition_counts.append(len(event_rule.conditions))
+
+            if event_rule.match_all and len(event_rule.conditions) == 0:
+                self._always_matched.append(rule_index)
+
+            for condition in event_rule.conditions:
+                condition_id = len(self._condition_rules)
+                self._condition_rules.append(rule_index)
+
+                if condition.key not in self._key_indexes:
+                    self._key_indexes[condition.key] = _KeyIndex(condition.key)
+
+                self._key_indexes[condition.key].add_condition(condition_id, condition)
+
+        for key_index in self._key_indexes.values():
+            key_index.build()
+
+        self.condition_fields = frozenset(key.split('.', 1)[0] for key in self._key_indexes.keys())
+
+    def __len__(self):
+        return len(self.event_rules)
+
+    def match(self, event_data, start=0):
+        """Returns the indexes (in rule order) of the rules that match the event data."""
+        satisfied_counts = {}
+
+        for key_index in self._key_indexes.values():
+            event_value = key_index.getter.get_event_value(event_data)
+
+            if event_value is None:
+                continue
+
+            for condition_id in key_index.get_satisfied_conditions(event_value):
+                rule_index = self._condition_rules[condition_id]
+                satisfied_counts[rule_index] = satisfied_counts.get(rule_index, 0) + 1
+
+        matched = list(self._always_matched)
+        for rule_index, satisfied_count in satisfied_counts.items():
+            if self.event_rules[rule_index].match_all:
+                if satisfied_count == self._condition_counts[rule_index]:
+                    matched.append(rule_index)
+            else:
+                matched.append(rule_index)
+
+        return sorted(rule_index for rule_index in matched if rule_index >= start)
+
+
+def compile_event_rules(event_rule_vos) -> List[EventRuleMatcher]:
+    event_rule_matchers = []
+    for event_rule_vo in event_rule_vos:
+        event_rule_matchers.append(EventRuleMatcher(
+            event_rule_vo.event_rule_id,
+            event_rule_vo.order,
+            [
+                {
+                    'key': condition.key,
+                    'operator': condition.operator,
+                    'value': condition.value
+                } for condition in event_rule_vo.conditions
+            ],
+            event_rule_vo.conditions_policy,
+            dict(event_rule_vo.actions),
+            event_rule_vo.options.stop_processing if event_rule_vo.options else False
+        ))
+
+    return event_rule_matchers
@@ -0,0 +1,288 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import List
+
+from pymongo.errors import BulkWriteError
+from spaceone.core import config
+
+from spaceone.monitoring.lib.archive import ArchiveWriter
+
+__all__ = ['is_enabled', 'add', 'discard', 'get_pending_alert', 'flush', 'get_stats', 'close']
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_BUFFER_CONF = {
+    'enabled': False,
+    'max_documents': 500,
+    'flush_interval_ms': 20,
+    'max_retries': 3,
+    'dead_letter_path': '/var/lib/spaceone/monitoring/dead_letter'
+}
+
+_DUPLICATE_KEY_ERROR = 11000
+
+# Pending entries are [raw document, attempts]
+_PENDING = []
+# (domain_id, event_key) -> {'event_id': 'str', 'alert_id': 'str', 'alert': ObjectId} of the latest pending event
+_PENDING_ALERTS = {}
+_CONDITION = threading.Condition()
+_FLUSH_LOCK = threading.Lock()
+_STATE = {
+    'model': None,
+    'flusher': None,
+    'pid': None,
+    'closed': False,
+    'is_exit_handler_registered': False
+}
+_STATS = {
+    'buffered': 0,
+    'inserted': 0,
+    'flushes': 0,
+    'retried': 0,
+    'dead_lettered': 0
+}
+
+
+def get_buffer_conf():
+    buffer_conf = _DEFAULT_BUFFER_CONF.copy()
+    buffer_conf.update(config.get_global('EVENT_WRITE_BUFFER', {}))
+    return buffer_conf
+
+
+def is_enabled():
+    return config.get_global('EVENT_WRITE_BUFFER', {}).get('enabled', False)
+
+
+def add(model, documents: List[dict]):
+    """Queues raw event documents to be written by the flusher thread of this process.
+
+    Documents are written with one unordered insert_many() when 'max_documents' are queued
+    or 'flush_interval_ms' has passed.
+    """
+
+    if len(documents) == 0:
+        return
+
+    buffer_conf = get_buffer_conf()
+
+    with _CONDITION:
+        _start_flusher()
+        _STATE['model'] = model
+
+        for document in documents:
+            _PENDING.append([document, 0])
+            _index_pending_alert(document)
+
+        _STATS['buffered'] += len(documents)
+
+        if len(_PENDING) >= buffer_conf['max_documents']:
+            _CONDITION.notify()
+
+
+def discard(event_ids: List[str]):
+    """Removes events that have not been written yet, e.g. on a transaction rollback."""
+
+    event_ids = set(event_ids)
+
+    with _CONDITION:
+        _PENDING[:] = [entry for entry in _PENDING if entry[0].get('event_id') not in event_ids]
+
+        for key, alert_info in list(_PENDING_ALERTS.items()):
+            if alert_info['event_id'] in event_ids:
+                del _PENDING_ALERTS[key]
+
+
+def get_pending_alert(event_key, domain_id):
+    """Returns the alert of the latest event with the event key that has not been written yet.
+
+    Returns:
+        alert_info (dict): {'alert_id': 'str', 'alert': ObjectId} or None
+    """
+
+    with _CONDITION:
+        alert_info = _PENDING_ALERTS.get((domain_id, event_key))
+
+    if alert_info is None:
+        return None
+
+    return {
+        'alert_id': alert_info['alert_id'],
+        'alert': alert_info['alert']
+    }
+
+
+def flush():
+    """Writes all queued documents. Returns the number of inserted documents."""
+
+    buffer_conf = get_buffer_conf()
+    inserted_count = 0
+
+    with _FLUSH_LOCK:
+        while True:
+            with _CONDITION:
+                entries = _PENDING[:buffer_conf['max_documents']]
+                del _PENDING[:len(entries)]
+                model = _STATE['model']
+
+            if len(entries) == 0:
+                break
+
+            failed_entries = _insert_entries(model, entries)
+            inserted_count += len(entries) - len(failed_entries)
+
+            retry_entries, dead_entries = _split_failed_entries(failed_entries, buffer_conf['max_retries'])
+
+            with _CONDITION:
+                _STATS['flushes'] += 1
+                _STATS['inserted'] += len(entries) - len(failed_entries)
+                _STATS['retried'] += len(retry_entries)
+                _STATS['dead_lettered'] += len(dead_entries)
+
+                # Failed documents are retried in the next flush
+                _PENDING[:0] = retry_entries
+
+                retry_entry_ids = set(id(entry) for entry in retry_entries)
+                _unindex_pending_alerts([entry for entry in entries if id(entry) not in retry_entry_ids])
+
+            if dead_entries:
+                _write_dead_letter([entry[0] for entry in dead_entries], buffer_conf['dead_letter_path'])
+
+            if retry_entries:
+                break
+
+    return inserted_count
+
+
+def get_stats():
+    with _CONDITION:
+        stats = dict(_STATS)
+        stats['pending'] = len(_PENDING)
+
+    return stats
+
+
+def close():
+    """Stops the flusher thread and writes the remaining documents."""
+
+    with _CONDITION:
+        _STATE['closed'] = True
+        _CONDITION.notify()
+
+    flush()
+
+
+def _start_flusher():
+    # Flusher threads do not survive a fork, so each worker process starts its own
+    if _STATE['pid'] == os.getpid() and _STATE['flusher'] and _STATE['flusher'].is_alive():
+        return
+
+    if _STATE['pid'] != os.getpid():
+        _PENDING.clear()
+        _PENDING_ALERTS.clear()
+
+    _STATE['pid'] = os.getpid()
+    _STATE['closed'] = False
+    _STATE['flusher'] = threading.Thread(target=_run_flusher, name='event-write-buffer', daemon=True)
+    _STATE['flusher'].start()
+
+    if not _STATE['is_exit_handler_registered']:
+        _STATE['is_exit_handler_registered'] = True
+        atexit.register(close)
+
+
+def _run_flusher():
+    while True:
+        flush_interval = get_buffer_conf()['flush_interval_ms'] / 1000
+
+        with _CONDITION:
+            if _STATE['closed']:
+                break
+
+            _CONDITION.wait(timeout=flush_interval)
+
+        try:
+            flush()
+        except Exception as e:
+            _LOGGER.error(f'[_run_flusher] Failed to flush events: {e}', exc_info=True)
+            time.sleep(flush_interval)
+
+
+def _insert_entries(model, entries):
+    """Returns the entries that failed. Duplicate key errors mean that a retried document is already written."""
+
+    try:
+        model._get_collection().insert_many([entry[0] for entry in entries], ordered=False)
+        return []
+    except BulkWriteError as e:
+        write_errors = e.details.get('writeErrors', [])
+        failed_indexes = sorted(set(error['index'] for error in write_errors
+                                    if error.get('code') != _DUPLICATE_KEY_ERROR))
+
+        if failed_indexes:
+            _LOGGER.warning(f'[_insert_entries] Failed to insert {len(failed_indexes)} of {len(entries)} events: '
+                            f'{write_errors[0].get("errmsg")}')
+
+        return [entries[index] for index in failed_indexes]
+    except Exception as e:
+        _LOGGER.warning(f'[_insert_entries] Failed to insert {len(entries)} events: {e}')
+        return entries
+
+
+def _split_failed_entries(failed_entries, max_retries):
+    retry_entries = []
+    dead_entries = []
+
+    for entry in failed_entries:
+        entry[1] += 1
+
+        if entry[1] > max_retries:
+            dead_entries.append(entry)
+        else:
+            retry_entries.append(entry)
+
+    return retry_entries, dead_entries
+
+
+def _write_dead_letter(documents, dead_letter_path):
+    """Saves events that could not be written in the archive format, so that they can be re-imported
+    with RetentionService.restore."""
+
+    if not dead_letter_path:
+        _LOGGER.error(f'[_write_dead_letter] Drop {len(documents)} events (dead_letter_path is not set)')
+        return
+
+    timestamp = datetime.utcnow().strftime('%Y%m%d%H%M%S%f')
+    file_path = os.path.join(dead_letter_path, f'event-dead-letter-{os.getpid()}-{timestamp}.ndjson.gz')
+
+    try:
+        with ArchiveWriter(file_path) as writer:
+            writer.write(documents)
+
+        _LOGGER.error(f'[_write_dead_letter] Save {len(documents)} events that could not be written: {file_path}')
+    except Exception as e:
+        _LOGGER.error(f'[_write_dead_letter] Drop {len(documents)} events ({file_path}): {e}')
+
+
+def _index_pending_alert(document):
+    if document.get('event_type') == 'RECOVERY' or document.get('alert') is None:
+        return
+
+    _PENDING_ALERTS[(document['domain_id'], document['event_key'])] = {
+        'event_id': document['event_id'],
+        'alert_id': document['alert_id'],
+        'alert': document['alert']
+    }
+
+
+def _unindex_pending_alerts(entries):
+    for entry in entries:
+        document = entry[0]
+        key = (document.get('domain_id'), document.get('event_key'))
+        alert_info = _PENDING_ALERTS.get(key)
+
+        if alert_info and alert_info['event_id'] == document.get('event_id'):
+            del _PENDING_ALERTS[key]
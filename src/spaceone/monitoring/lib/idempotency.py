@@ -0,0 +1,78 @@
+import collections
+import threading
+import time
+
+from spaceone.core import cache, utils
+
+__all__ = ['make_key', 'mark', 'forget', 'reset']
+
+_SEEN_KEYS = collections.OrderedDict()
+_LOCK = threading.Lock()
+
+
+def make_key(webhook_id, data, idempotency_key=None):
+    """Returns the delivery key of a webhook payload.
+
+    The idempotency key of the sender is used when it is given, otherwise the hash of the canonical payload.
+    """
+
+    if idempotency_key:
+        return utils.dict_to_hash({'webhook_id': webhook_id, 'idempotency_key': idempotency_key})
+    else:
+        return utils.dict_to_hash({'webhook_id': webhook_id, 'data': data})
+
+
+def mark(key, ttl, max_size):
+    """Marks the delivery key as seen for 'ttl' seconds.
+
+    Keys are shared through the default cache when it is configured, otherwise the latest 'max_size' keys
+    are kept in process. Two deliveries that arrive at the same moment on different workers may both pass.
+
+    Returns:
+        is_duplicate (bool): True if the key has been seen within 'ttl' seconds
+    """
+
+    if cache.is_set():
+        cache_key = _make_cache_key(key)
+
+        if cache.get(cache_key):
+            return True
+
+        cache.set(cache_key, True, expire=ttl)
+        return False
+
+    now = time.time()
+
+    with _LOCK:
+        # Keys are ordered by expiration time since they share the same ttl
+        while _SEEN_KEYS:
+            oldest_key, expires_at = next(iter(_SEEN_KEYS.items()))
+            if expires_at > now and len(_SEEN_KEYS) < max_size:
+                break
+
+            del _SEEN_KEYS[oldest_key]
+
+        if key in _SEEN_KEYS:
+            return True
+
+        _SEEN_KEYS[key] = now + ttl
+        return False
+
+
+def forget(key):
+    """Unmarks the delivery key, so that a retry of a failed delivery is processed again"""
+
+    if cache.is_set():
+        cache.delete(_make_cache_key(key))
+    else:
+        with _LOCK:
+            _SEEN_KEYS.pop(key, None)
+
+
+def reset():
+    with _LOCK:
+        _SEEN_KEYS.clear()
+
+
+def _make_cache_key(key):
+    return f'idempotency:{key}'
@@ -0,0 +1,165 @@
+import bisect
+import threading
+import time
+
+from spaceone.core import config
+
+__all__ = ['is_enabled', 'timer', 'observe', 'increment', 'render_prometheus', 'reset']
+
+_DEFAULT_BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+_METRIC_PREFIX = 'spaceone_monitoring_ingest'
+
+_COUNTER_HELP = {
+    'events': 'Events created from webhook payloads',
+    'alerts_created': 'Alerts created by events',
+    'dedup_hits': 'Events attached to an open alert with the same event key',
+    'recoveries': 'Recovery events received for an open alert',
+    'coalesced_events': 'Repeated events counted on the latest event instead of being saved',
+    'deliveries': 'Webhook payloads checked for re-delivery',
+    'duplicate_deliveries': 'Exact re-deliveries of webhook payloads dropped without parsing'
+}
+
+# Label values come from the webhook plugins, so they are limited to known values to bound the series
+_LABEL_VALUES = {
+    'event_type': ['ALERT', 'RECOVERY', 'ERROR']
+}
+
+_OTHER_LABEL_VALUE = 'other'
+
+_HISTOGRAMS = {}
+_COUNTERS = {}
+_LOCK = threading.Lock()
+
+
+class _Histogram:
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            self.bucket_counts[index] += 1
+
+        self.count += 1
+        self.sum += value
+
+
+class _Timer:
+
+    def __init__(self, stage):
+        self.stage = stage
+        self.started_at = None
+
+    def __enter__(self):
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        observe(self.stage, time.perf_counter() - self.started_at)
+
+
+class _NullTimer:
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def is_enabled():
+    return config.get_global('INGEST_METRICS', {}).get('enabled', False)
+
+
+def timer(stage):
+    """Measures the duration of an ingest stage. Does nothing when INGEST_METRICS is disabled."""
+    if is_enabled():
+        return _Timer(stage)
+    else:
+        return _NULL_TIMER
+
+
+def observe(stage, seconds):
+    with _LOCK:
+        histogram = _HISTOGRAMS.get(stage)
+
+        if histogram is None:
+            buckets = sorted(config.get_global('INGEST_METRICS', {}).get('buckets', _DEFAULT_BUCKETS))
+            histogram = _HISTOGRAMS[stage] = _Histogram(buckets)
+
+        histogram.observe(seconds)
+
+
+def increment(name, amount=1, **labels):
+    if not is_enabled():
+        return
+
+    key = (name, tuple(sorted((label, _bound_label_value(label, value)) for label, value in labels.items())))
+
+    with _LOCK:
+        _COUNTERS[key] = _COUNTERS.get(key, 0) + amount
+
+
+def render_prometheus():
+    """Returns the metrics of this process in the Prometheus text exposition format (version 0.0.4)."""
+    lines = []
+
+    with _LOCK:
+        if _HISTOGRAMS:
+            name = f'{_METRIC_PREFIX}_stage_seconds'
+            lines.append(f'# HELP {name} Duration of the event ingest stages')
+            lines.append(f'# TYPE {name} histogram')
+
+            for stage, histogram in sorted(_HISTOGRAMS.items()):
+                cumulative_count = 0
+                for bucket, bucket_count in zip(histogram.buckets, histogram.bucket_counts):
+                    cumulative_count += bucket_count
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{bucket}"}} {cumulative_count}')
+
+                lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.sum}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+
+        for counter_name in sorted(set(key[0] for key in _COUNTERS.keys())):
+            name = f'{_METRIC_PREFIX}_{counter_name}_total'
+            lines.append(f'# HELP {name} {_COUNTER_HELP.get(counter_name, counter_name)}')
+            lines.append(f'# TYPE {name} counter')
+
+            for (key_name, labels), value in sorted(_COUNTERS.items()):
+                if key_name == counter_name:
+                    lines.append(f'{name}{_render_labels(labels)} {value}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def reset():
+    with _LOCK:
+        _HISTOGRAMS.clear()
+        _COUNTERS.clear()
+
+
+def _bound_label_value(label, value):
+    if label in _LABEL_VALUES and value not in _LABEL_VALUES[label]:
+        return _OTHER_LABEL_VALUE
+
+    return value
+
+
+def _render_labels(labels):
+    if not labels:
+        return ''
+
+    label_values = ','.join(f'{key}="{_escape_label_value(value)}"' for key, value in labels)
+    return f'{{{label_values}}}'
+
+
+def _escape_label_value(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,70 @@
+import bisect
+from datetime import datetime
+from typing import Iterable, List, Set
+
+__all__ = ['MaintenanceIndex']
+
+
+class MaintenanceIndex:
+    """Active [start_time, end_time) intervals of the open maintenance windows of a domain by project.
+
+    Overlapping windows of a project are merged into sorted, disjoint intervals,
+    so that a point in time is checked with a single binary search.
+    """
+
+    def __init__(self):
+        # maintenance_window_id -> projects
+        self._window_projects = {}
+        # project_id -> {maintenance_window_id: (start_time, end_time)}
+        self._project_windows = {}
+        # project_id -> (start_times, end_times) of merged intervals
+        self._intervals = {}
+
+    def add(self, maintenance_window_id, projects: List[str], start_time: datetime, end_time: datetime):
+        self.remove(maintenance_window_id)
+
+        self._window_projects[maintenance_window_id] = list(projects)
+
+        for project_id in projects:
+            self._project_windows.setdefault(project_id, {})[maintenance_window_id] = (start_time, end_time)
+            self._merge_intervals(project_id)
+
+    def remove(self, maintenance_window_id):
+        for project_id in self._window_projects.pop(maintenance_window_id, []):
+            windows = self._project_windows.get(project_id, {})
+            windows.pop(maintenance_window_id, None)
+
+            if windows:
+                self._merge_intervals(project_id)
+            else:
+                self._project_windows.pop(project_id, None)
+                self._intervals.pop(project_id, None)
+
+    def is_under_maintenance(self, project_id, at: datetime = None) -> bool:
+        intervals = self._intervals.get(project_id)
+
+        if intervals is None:
+            return False
+
+        at = at or datetime.utcnow()
+        start_times, end_times = intervals
+        index = bisect.bisect_right(start_times, at) - 1
+
+        return index >= 0 and at < end_times[index]
+
+    def get_projects_under_maintenance(self, project_ids: Iterable[str], at: datetime = None) -> Set[str]:
+        at = at or datetime.utcnow()
+        return set(project_id for project_id in project_ids if self.is_under_maintenance(project_id, at))
+
+    def _merge_intervals(self, project_id):
+        start_times = []
+        end_times = []
+
+        for start_time, end_time in sorted(self._project_windows[project_id].values()):
+            if start_times and start_time <= end_times[-1]:
+                end_times[-1] = max(end_times[-1], end_time)
+            else:
+                start_times.append(start_time)
+                end_times.append(end_time)
+
+        self._intervals[project_id] = (start_times, end_times)
@@ -0,0 +1,102 @@
+import threading
+import time
+
+from spaceone.core import cache
+
+__all__ = ['consume', 'consume_all', 'add_shed_count', 'get_shed_counts', 'reset']
+
+_BUCKETS = {}
+_SHED_COUNTS = {}
+_LOCK = threading.Lock()
+
+
+def consume(key, rate, burst, count=1):
+    """Takes 'count' tokens from the token bucket of the key.
+
+    The bucket holds up to 'burst' tokens and refills 'rate' tokens per second.
+    Buckets are shared through the default cache when it is configured, otherwise they are kept in process.
+    Concurrent workers may admit a few more requests than the limit, which is acceptable for flood shedding.
+
+    Returns:
+        retry_after (float): 0 if the tokens are taken, otherwise seconds until enough tokens are refilled
+    """
+
+    return consume_all([(key, rate, burst)], count)
+
+
+def consume_all(limits, count=1):
+    """Takes 'count' tokens from every bucket of the limits, or from none of them.
+
+    Args:
+        limits (list): [(key, rate, burst)], a limit with a 'rate' or 'burst' of 0 or less is not applied
+
+    Returns:
+        retry_after (float): 0 if the tokens are taken, otherwise seconds until every bucket has enough tokens
+    """
+
+    limits = [(key, rate, burst) for key, rate, burst in limits if rate > 0 and burst > 0]
+    now = time.time()
+
+    with _LOCK:
+        buckets = []
+        retry_after = 0
+
+        for key, rate, burst in limits:
+            bucket = _get_bucket(key)
+
+            if bucket:
+                tokens = min(burst, bucket['tokens'] + (now - bucket['updated_at']) * rate)
+            else:
+                tokens = burst
+
+            # A batch larger than the bucket is admitted when the bucket is full and is charged in full,
+            # so the bucket goes into debt until the batch is paid off by the refill.
+            required = min(count, burst)
+
+            if tokens < required:
+                retry_after = max(retry_after, (required - tokens) / rate)
+
+            buckets.append((key, rate, burst, tokens))
+
+        for key, rate, burst, tokens in buckets:
+            if retry_after == 0:
+                tokens -= count
+
+            # A missing bucket is full, so it is kept until it is refilled
+            _set_bucket(key, {'tokens': tokens, 'updated_at': now}, expire=int((burst - tokens) / rate) + 1)
+
+    return retry_after
+
+
+def add_shed_count(webhook_id, count=1):
+    with _LOCK:
+        _SHED_COUNTS[webhook_id] = _SHED_COUNTS.get(webhook_id, 0) + count
+
+
+def get_shed_counts():
+    with _LOCK:
+        return dict(_SHED_COUNTS)
+
+
+def reset():
+    with _LOCK:
+        _BUCKETS.clear()
+        _SHED_COUNTS.clear()
+
+
+def _make_cache_key(key):
+    return f'rate-limit:{key}'
+
+
+def _get_bucket(key):
+    if cache.is_set():
+        return cache.get(_make_cache_key(key))
+    else:
+        return _BUCKETS.get(key)
+
+
+def _set_bucket(key, bucket, expire):
+    if cache.is_set():
+        cache.set(_make_cache_key(key), bucket, expire=expire)
+    else:
+        _BUCKETS[key] = bucket
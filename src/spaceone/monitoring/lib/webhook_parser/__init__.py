@@ -0,0 +1,4 @@
+from spaceone.monitoring.lib.webhook_parser.base import *
+from spaceone.monitoring.lib.webhook_parser.alertmanager import *
+from spaceone.monitoring.lib.webhook_parser.grafana import *
+from spaceone.monitoring.lib.webhook_parser.aws_sns import *
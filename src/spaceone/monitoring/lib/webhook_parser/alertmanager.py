@@ -0,0 +1,79 @@
+from spaceone.core import utils
+from spaceone.monitoring.lib.webhook_parser.base import BaseParser, register_parser
+
+__all__ = ['AlertmanagerParser', 'make_alertmanager_event', 'change_severity', 'make_additional_info']
+
+_SEVERITY_MAP = {
+    'critical': 'CRITICAL',
+    'high': 'CRITICAL',
+    'error': 'ERROR',
+    'major': 'ERROR',
+    'warning': 'WARNING',
+    'minor': 'WARNING',
+    'info': 'INFO',
+    'none': 'NONE'
+}
+
+# Labels used to find the resource of an alert
+_RESOURCE_LABELS = ['instance', 'pod', 'node', 'host', 'service', 'job']
+
+
+def change_severity(severity, default='ERROR'):
+    if not severity:
+        return default
+
+    return _SEVERITY_MAP.get(str(severity).lower(), default)
+
+
+def make_additional_info(values: dict):
+    # Same as google.protobuf.Struct values sent by the plugins
+    return {str(key): str(value) for key, value in values.items() if value is not None}
+
+
+def make_alertmanager_event(alert: dict, group: dict):
+    labels = alert.get('labels') or {}
+    annotations = alert.get('annotations') or {}
+    alert_name = labels.get('alertname', group.get('groupKey', 'Unknown'))
+
+    fingerprint = alert.get('fingerprint') or utils.dict_to_hash(labels)
+    event_type = 'RECOVERY' if alert.get('status') == 'resolved' else 'ALERT'
+
+    event_data = {
+        'event_key': fingerprint,
+        'event_type': event_type,
+        'title': annotations.get('summary') or annotations.get('title') or alert_name,
+        'description': annotations.get('description') or annotations.get('message', ''),
+        'severity': change_severity(labels.get('severity')),
+        'rule': alert_name,
+        'additional_info': make_additional_info(labels),
+        'occurred_at': alert.get('endsAt') if event_type == 'RECOVERY' else alert.get('startsAt')
+    }
+
+    if alert.get('generatorURL'):
+        event_data['additional_info']['generator_url'] = alert['generatorURL']
+
+    for label in _RESOURCE_LABELS:
+        if labels.get(label):
+            event_data['resource'] = {
+                'resource_id': labels[label],
+                'resource_type': label,
+                'name': labels[label]
+            }
+            break
+
+    return event_data
+
+
+@register_parser
+class AlertmanagerParser(BaseParser):
+    """Prometheus Alertmanager webhook (version 4)"""
+
+    name = 'alertmanager'
+
+    def parse(self, options, data):
+        if not isinstance(data.get('alerts'), list) or 'groupKey' not in data:
+            return None
+
+        return {
+            'results': [make_alertmanager_event(alert, data) for alert in data['alerts']]
+        }
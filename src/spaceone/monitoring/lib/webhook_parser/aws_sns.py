@@ -0,0 +1,98 @@
+from spaceone.core import utils
+from spaceone.monitoring.lib.webhook_parser.base import BaseParser, register_parser
+from spaceone.monitoring.lib.webhook_parser.alertmanager import make_additional_info
+
+__all__ = ['AWSSNSParser']
+
+# CloudWatch alarm states
+_EVENT_TYPES = {
+    'ALARM': 'ALERT',
+    'INSUFFICIENT_DATA': 'ALERT',
+    'OK': 'RECOVERY'
+}
+
+
+@register_parser
+class AWSSNSParser(BaseParser):
+    """AWS SNS notification. CloudWatch alarm messages are parsed into alarm events.
+
+    Subscription confirmations are left to the plugin, which confirms the subscription.
+    """
+
+    name = 'aws_sns'
+
+    def parse(self, options, data):
+        if data.get('Type') != 'Notification' or 'TopicArn' not in data:
+            return None
+
+        message = self._load_message(data.get('Message'))
+
+        if isinstance(message, dict) and 'AlarmName' in message and 'NewStateValue' in message:
+            event_data = self._make_cloudwatch_alarm_event(message, data)
+        else:
+            event_data = self._make_notification_event(data)
+
+        return {
+            'results': [event_data]
+        }
+
+    @staticmethod
+    def _load_message(message):
+        try:
+            return utils.load_json(message)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _make_cloudwatch_alarm_event(message, data):
+        state = message['NewStateValue']
+        trigger = message.get('Trigger') or {}
+        dimensions = trigger.get('Dimensions') or []
+
+        event_data = {
+            'event_key': utils.dict_to_hash({
+                'alarm': message.get('AlarmArn') or message['AlarmName'],
+                'account_id': message.get('AWSAccountId'),
+                'region': message.get('Region')
+            }),
+            'event_type': _EVENT_TYPES.get(state, 'ALERT'),
+            'title': message['AlarmName'],
+            'description': message.get('NewStateReason') or message.get('AlarmDescription') or '',
+            'severity': 'NOT_AVAILABLE' if state == 'INSUFFICIENT_DATA' else 'ERROR',
+            'rule': trigger.get('MetricName') or message['AlarmName'],
+            'additional_info': make_additional_info({
+                'account_id': message.get('AWSAccountId'),
+                'region': message.get('Region'),
+                'alarm_arn': message.get('AlarmArn'),
+                'namespace': trigger.get('Namespace'),
+                'metric_name': trigger.get('MetricName'),
+                'topic_arn': data['TopicArn']
+            }),
+            'occurred_at': message.get('StateChangeTime') or data.get('Timestamp')
+        }
+
+        if dimensions:
+            event_data['resource'] = {
+                'resource_id': dimensions[0].get('value'),
+                'resource_type': trigger.get('Namespace'),
+                'name': dimensions[0].get('value')
+            }
+
+            for dimension in dimensions:
+                event_data['additional_info'][f'dimension.{dimension.get("name")}'] = str(dimension.get('value'))
+
+        return event_data
+
+    @staticmethod
+    def _make_notification_event(data):
+        return {
+            'event_key': data.get('MessageId') or utils.dict_to_hash(data),
+            'event_type': 'ALERT',
+            'title': data.get('Subject') or data['TopicArn'],
+            'description': data.get('Message', ''),
+            'severity': 'INFO',
+            'additional_info': make_additional_info({
+                'topic_arn': data['TopicArn']
+            }),
+            'occurred_at': data.get('Timestamp')
+        }
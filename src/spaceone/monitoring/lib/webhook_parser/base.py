@@ -0,0 +1,58 @@
+import abc
+import logging
+
+from spaceone.core import config
+
+__all__ = ['BaseParser', 'register_parser', 'get_parser', 'find_parser', 'list_parsers']
+
+_LOGGER = logging.getLogger(__name__)
+
+_PARSERS = {}
+
+
+class BaseParser(abc.ABC):
+    """In-process webhook parser.
+
+    parse() returns the same structure as the Event.parse API of a webhook plugin ({'results': [event_data]}),
+    or None if the payload is not in the format of the parser so that it is parsed by the plugin.
+    """
+
+    name = None
+
+    @abc.abstractmethod
+    def parse(self, options: dict, data: dict):
+        pass
+
+
+def register_parser(parser_cls):
+    _PARSERS[parser_cls.name] = parser_cls()
+    return parser_cls
+
+
+def get_parser(name):
+    return _PARSERS.get(name)
+
+
+def list_parsers():
+    return list(_PARSERS.keys())
+
+
+def find_parser(plugin_id, options):
+    """Returns the native parser of a webhook.
+
+    The 'native_parser' option of the webhook plugin takes precedence over the
+    WEBHOOK_NATIVE_PARSERS ({plugin_id: parser_name}) global config.
+    """
+
+    name = (options or {}).get('native_parser') or config.get_global('WEBHOOK_NATIVE_PARSERS', {}).get(plugin_id)
+
+    if name is None:
+        return None
+
+    parser = _PARSERS.get(name)
+
+    if parser is None:
+        _LOGGER.debug(f'[find_parser] Unknown native parser: {name} (plugin_id = {plugin_id})')
+
+    return parser
+
@@ -0,0 +1,84 @@
+from spaceone.core import utils
+from spaceone.monitoring.lib.webhook_parser.base import BaseParser, register_parser
+from spaceone.monitoring.lib.webhook_parser.alertmanager import make_alertmanager_event, change_severity, \
+    make_additional_info
+
+__all__ = ['GrafanaParser']
+
+# Legacy alerting states
+_EVENT_TYPES = {
+    'alerting': 'ALERT',
+    'no_data': 'ALERT',
+    'ok': 'RECOVERY'
+}
+
+
+@register_parser
+class GrafanaParser(BaseParser):
+    """Grafana webhook notification (unified alerting and legacy dashboard alerts)"""
+
+    name = 'grafana'
+
+    def parse(self, options, data):
+        if isinstance(data.get('alerts'), list):
+            return {
+                'results': [self._make_unified_alert_event(alert, data) for alert in data['alerts']]
+            }
+        elif 'ruleId' in data and 'state' in data:
+            return {
+                'results': self._make_legacy_alert_events(data)
+            }
+        else:
+            return None
+
+    @staticmethod
+    def _make_unified_alert_event(alert, data):
+        event_data = make_alertmanager_event(alert, data)
+
+        for key, name in [('dashboardURL', 'dashboard_url'), ('panelURL', 'panel_url'),
+                          ('valueString', 'value_string')]:
+            if alert.get(key):
+                event_data['additional_info'][name] = alert[key]
+
+        if alert.get('imageURL'):
+            event_data['image_url'] = alert['imageURL']
+
+        return event_data
+
+    @staticmethod
+    def _make_legacy_alert_events(data):
+        # paused and pending states are not events
+        event_type = _EVENT_TYPES.get(data['state'])
+
+        if event_type is None:
+            return []
+
+        tags = data.get('tags') or {}
+
+        event_data = {
+            'event_key': utils.dict_to_hash({
+                'rule_id': data['ruleId'],
+                'dashboard_id': data.get('dashboardId'),
+                'panel_id': data.get('panelId'),
+                'org_id': data.get('orgId')
+            }),
+            'event_type': event_type,
+            'title': data.get('title') or data.get('ruleName', ''),
+            'description': data.get('message', ''),
+            'severity': 'NOT_AVAILABLE' if data['state'] == 'no_data' else change_severity(tags.get('severity')),
+            'rule': data.get('ruleName'),
+            'additional_info': make_additional_info(tags)
+        }
+
+        if data.get('ruleUrl'):
+            event_data['additional_info']['rule_url'] = data['ruleUrl']
+
+        if data.get('imageUrl'):
+            event_data['image_url'] = data['imageUrl']
+
+        eval_matches = data.get('evalMatches') or []
+        if eval_matches:
+            event_data['additional_info']['eval_matches'] = ', '.join(
+                f'{match.get("metric")}={match.get("value")}' for match in eval_matches)
+
+        return [event_data]
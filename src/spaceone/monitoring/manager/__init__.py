@@ -6,6 +6,7 @@ from spaceone.monitoring.manager.plugin_manager import PluginManager
 from spaceone.monitoring.manager.data_source_manager import DataSourceManager
 from spaceone.monitoring.manager.project_alert_config_manager import ProjectAlertConfigManager
 from spaceone.monitoring.manager.escalation_policy_manager import EscalationPolicyManager
+from spaceone.monitoring.manager.project_ingest_context_manager import ProjectIngestContextManager
 from spaceone.monitoring.manager.event_rule_manager import EventRuleManager
 from spaceone.monitoring.manager.webhook_manager import WebhookManager
 from spaceone.monitoring.manager.maintenance_window_manager import MaintenanceWindowManager
@@ -16,3 +17,4 @@ from spaceone.monitoring.manager.webhook_plugin_manager import WebhookPluginMana
 from spaceone.monitoring.manager.event_manager import EventManager
 from spaceone.monitoring.manager.job_manager import JobManager
 from spaceone.monitoring.manager.notification_manager import NotificationManager
+from spaceone.monitoring.manager.archive_manager import ArchiveManager
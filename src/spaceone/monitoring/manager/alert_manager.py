@@ -1,6 +1,10 @@
 import logging
+from datetime import datetime
 
+from spaceone.core import cache
 from spaceone.core.manager import BaseManager
+from spaceone.monitoring.lib.bulk import make_document, insert_documents, update_fields
+from spaceone.monitoring.lib.escalation import ESCALATION_FIELDS
 from spaceone.monitoring.manager.event_manager import EventManager
 from spaceone.monitoring.model.alert_model import Alert
 from spaceone.monitoring.model.event_model import Event
@@ -22,11 +26,28 @@ class AlertManager(BaseManager):
                          f'({alert_vo.alert_id})')
             alert_vo.delete()
 
+        self._set_first_escalation_time(params)
+
         alert_vo: Alert = self.alert_model.create(params)
         self.transaction.add_rollback(_rollback, alert_vo)
 
         return alert_vo
 
+    def create_alerts(self, alerts_data):
+        def _rollback(alert_ids):
+            _LOGGER.info(f'[create_alerts._rollback] '
+                         f'Delete alerts : {len(alert_ids)} alerts')
+            self.alert_model.filter(alert_id=alert_ids).delete()
+
+        for alert_data in alerts_data:
+            self._set_first_escalation_time(alert_data)
+
+        alert_vos = [make_document(self.alert_model, alert_data) for alert_data in alerts_data]
+        alert_vos = insert_documents(self.alert_model, alert_vos)
+        self.transaction.add_rollback(_rollback, [alert_vo.alert_id for alert_vo in alert_vos])
+
+        return alert_vos
+
     def update_alert(self, params):
         alert_vo: Alert = self.get_alert(params['alert_id'], params['domain_id'])
         return self.update_alert_by_vo(params, alert_vo)
@@ -36,10 +57,62 @@ class AlertManager(BaseManager):
             _LOGGER.info(f'[update_alert_by_vo._rollback] Revert Data : '
                          f'{old_data["alert_id"]}')
             alert_vo.update(old_data)
+            self.delete_alert_state_cache(alert_vo.alert_id, alert_vo.domain_id)
 
         self.transaction.add_rollback(_rollback, alert_vo.to_dict())
+
+        if 'state' in params:
+            self.delete_alert_state_cache(alert_vo.alert_id, alert_vo.domain_id)
+
+        # Alerts that finished escalation are excluded from the due escalation index
+        if params.get('escalation_ttl', alert_vo.escalation_ttl) == 0 or params.get('state') == 'RESOLVED':
+            params['next_escalation_at'] = None
+
         return alert_vo.update(params)
 
+    def list_alert_escalation_rows(self, alert_ids, domain_id):
+        """Returns raw rows with the escalation fields of alerts instead of documents."""
+        alert_vos = self.alert_model.filter(alert_id=alert_ids, domain_id=domain_id)
+        return list(alert_vos.only(*ESCALATION_FIELDS).as_pymongo())
+
+    def update_alert_escalations(self, escalation_updates):
+        """Updates the escalation fields of alert rows with a single bulk write.
+
+        Args:
+            escalation_updates (list): [(row, params), ...]
+
+        Returns:
+            None
+        """
+
+        def _rollback(old_updates):
+            _LOGGER.info(f'[update_alert_escalations._rollback] Revert Data : {len(old_updates)} alerts')
+            update_fields(self.alert_model, old_updates)
+
+        updates = [(row['_id'], params) for row, params in escalation_updates]
+        old_updates = [(row['_id'], {key: row.get(key) for key in params.keys()})
+                       for row, params in escalation_updates]
+
+        update_fields(self.alert_model, updates)
+        self.transaction.add_rollback(_rollback, old_updates)
+
+    def reset_escalation_time_by_policy(self, escalation_policy_id, domain_id):
+        """Makes the open alerts of the escalation policy due, so that their escalation time is
+        recomputed with the changed rules or finish condition."""
+
+        def _rollback(old_updates):
+            _LOGGER.info(f'[reset_escalation_time_by_policy._rollback] Revert Data : {len(old_updates)} alerts')
+            update_fields(self.alert_model, old_updates)
+
+        alert_vos = self.alert_model.filter(escalation_policy_id=escalation_policy_id, domain_id=domain_id,
+                                            state=['TRIGGERED', 'ACKNOWLEDGED'], escalation_ttl__gt=0)
+        rows = list(alert_vos.only('next_escalation_at').as_pymongo())
+
+        now = datetime.utcnow()
+        update_fields(self.alert_model, [(row['_id'], {'next_escalation_at': now}) for row in rows])
+        self.transaction.add_rollback(_rollback, [(row['_id'], {'next_escalation_at': row.get('next_escalation_at')})
+                                                  for row in rows])
+
     def add_responder(self, params):
         resource_type = params['resource_type']
         resource_id = params['resource_id']
@@ -94,11 +167,33 @@ class AlertManager(BaseManager):
         alert_vo: Alert = self.get_alert(alert_id, domain_id)
         alert_vo.delete()
 
+        self.delete_alert_state_cache(alert_id, domain_id)
+
     def get_alert(self, alert_id, domain_id, only=None):
         return self.alert_model.get(alert_id=alert_id, domain_id=domain_id, only=only)
 
+    @cache.cacheable(key='alert-state:{domain_id}:{alert_id}', expire=600)
+    def get_alert_state(self, alert_id, domain_id):
+        alert_info = self.alert_model.filter(alert_id=alert_id, domain_id=domain_id).only('state').as_pymongo().first()
+
+        if alert_info:
+            return alert_info.get('state')
+        else:
+            return None
+
+    @staticmethod
+    def delete_alert_state_cache(alert_id, domain_id):
+        if cache.is_set():
+            cache.delete(f'alert-state:{domain_id}:{alert_id}')
+
     def list_alerts(self, query={}):
         return self.alert_model.query(**query)
 
     def stat_alerts(self, query):
         return self.alert_model.stat(**query)
+
+    @staticmethod
+    def _set_first_escalation_time(params):
+        if params.get('escalation_ttl', 0) > 0:
+            params.setdefault('next_escalation_at', datetime.utcnow())
+
@@ -0,0 +1,173 @@
+import json
+import logging
+import os
+import zlib
+from datetime import datetime
+
+from spaceone.core import config
+from spaceone.core.manager import BaseManager
+from spaceone.monitoring.error import *
+from spaceone.monitoring.lib.archive import *
+from spaceone.monitoring.model.alert_model import Alert
+from spaceone.monitoring.model.event_model import Event
+from spaceone.monitoring.model.event_raw_data_model import EventRawData
+from spaceone.monitoring.model.note_model import Note
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_RETENTION_CONF = {
+    'enabled': False,
+    'days': 90,
+    'domains': {},
+    'archive_enabled': True,
+    'archive_path': '/var/lib/spaceone/monitoring/archive',
+    'chunk_size': 1000
+}
+
+
+class ArchiveManager(BaseManager):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.alert_model: Alert = self.locator.get_model('Alert')
+        self.event_model: Event = self.locator.get_model('Event')
+        self.event_raw_data_model: EventRawData = self.locator.get_model('EventRawData')
+        self.note_model: Note = self.locator.get_model('Note')
+        self.retention_conf = self.get_retention_conf()
+
+    @staticmethod
+    def get_retention_conf():
+        retention_conf = _DEFAULT_RETENTION_CONF.copy()
+        retention_conf.update(config.get_global('EVENT_RETENTION', {}))
+        return retention_conf
+
+    def get_retention_days(self, domain_id):
+        return self.retention_conf['domains'].get(domain_id, self.retention_conf['days'])
+
+    def archive_expired_data(self, domain_id, expired_at: datetime):
+        """ Move resolved alerts, events and notes created before expired_at to the archive files
+
+        Returns:
+            archived_count (dict): {'alert': int, 'event': int, 'note': int, 'event_raw_data': int}
+        """
+
+        timestamp = datetime.utcnow().strftime('%Y%m%d%H%M%S')
+        archived_count = {}
+
+        with self._create_writer('event', domain_id, timestamp) as event_writer, \
+                self._create_writer('alert', domain_id, timestamp) as alert_writer, \
+                self._create_writer('note', domain_id, timestamp) as note_writer:
+
+            # Events of open alerts expire as well. The alerts are kept.
+            self._archive_events({'domain_id': domain_id, 'created_at': {'$lt': expired_at}}, event_writer)
+
+            alert_query = {'domain_id': domain_id, 'state': 'RESOLVED', 'created_at': {'$lt': expired_at}}
+            for alert_documents in iter_document_chunks(self.alert_model, alert_query, self._chunk_size):
+                alert_ids = [document['_id'] for document in alert_documents]
+
+                self._archive_events({'alert': {'$in': alert_ids}}, event_writer)
+                self._archive_documents(self.note_model, {'alert': {'$in': alert_ids}}, note_writer)
+
+                alert_writer.write(alert_documents)
+                delete_documents(self.alert_model, alert_documents)
+
+            archived_count['event'] = event_writer.count
+            archived_count['alert'] = alert_writer.count
+            archived_count['note'] = note_writer.count
+
+        # Raw payloads are copied into the archived events, so expired ones are only deleted.
+        archived_count['event_raw_data'] = self._delete_expired_raw_data(domain_id, expired_at)
+
+        return archived_count
+
+    def restore_archive(self, file_path):
+        """ Re-import an archive file created by archive_expired_data
+
+        Returns:
+            restored_count (int)
+        """
+
+        model = self._get_model_by_file_path(file_path)
+        restored_count = 0
+
+        for documents in iter_archive_chunks(file_path, self._chunk_size):
+            restored_count += restore_documents(model, documents)
+
+        _LOGGER.debug(f'[restore_archive] {file_path}: {restored_count} documents')
+        return restored_count
+
+    @property
+    def _chunk_size(self):
+        return self.retention_conf['chunk_size']
+
+    def _create_writer(self, collection, domain_id, timestamp):
+        if self.retention_conf['archive_enabled']:
+            return ArchiveWriter(os.path.join(self.retention_conf['archive_path'], domain_id,
+                                              f'{collection}-{timestamp}.ndjson.gz'))
+        else:
+            return _NullWriter()
+
+    def _archive_documents(self, model, query, writer):
+        for documents in iter_document_chunks(model, query, self._chunk_size):
+            writer.write(documents)
+            delete_documents(model, documents)
+
+    def _archive_events(self, query, writer):
+        for documents in iter_document_chunks(self.event_model, query, self._chunk_size):
+            self._inline_raw_data(documents)
+            writer.write(documents)
+            delete_documents(self.event_model, documents)
+
+    def _inline_raw_data(self, event_documents):
+        raw_data_ids = list(set(document['raw_data_id'] for document in event_documents
+                                if document.get('raw_data_id')))
+
+        if len(raw_data_ids) == 0:
+            return
+
+        raw_data_map = {}
+        for raw_data_vo in self.event_raw_data_model.filter(raw_data_id=raw_data_ids):
+            raw_data_map[(raw_data_vo.raw_data_id, raw_data_vo.domain_id)] = raw_data_vo.data
+
+        for document in event_documents:
+            data = raw_data_map.get((document.get('raw_data_id'), document.get('domain_id')))
+            if data:
+                document['raw_data'] = json.loads(zlib.decompress(data))
+                del document['raw_data_id']
+
+    def _delete_expired_raw_data(self, domain_id, expired_at):
+        query = {'domain_id': domain_id, 'updated_at': {'$lt': expired_at}}
+        deleted_count = 0
+
+        for documents in iter_document_chunks(self.event_raw_data_model, query, self._chunk_size):
+            deleted_count += delete_documents(self.event_raw_data_model, documents)
+
+        return deleted_count
+
+    def _get_model_by_file_path(self, file_path):
+        collection = os.path.basename(file_path).split('-', 1)[0]
+
+        if collection == 'event':
+            return self.event_model
+        elif collection == 'alert':
+            return self.alert_model
+        elif collection == 'note':
+            return self.note_model
+        else:
+            raise ERROR_INVALID_PARAMETER(key='file_path', reason=f'Unknown archive file: {file_path}')
+
+
+class _NullWriter:
+    """Writer used when archiving is disabled. Expired documents are deleted without a copy."""
+
+    def __init__(self):
+        self.count = 0
+
+    def write(self, documents):
+        self.count += len(documents)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
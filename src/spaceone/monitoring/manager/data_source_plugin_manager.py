@@ -81,14 +81,18 @@ class DataSourcePluginManager(BaseManager):
 
     def get_data_source_plugin_endpoint_by_vo(self, data_source_vo: DataSource):
         plugin_info = data_source_vo.plugin_info.to_dict()
-        endpoint, updated_version = self.get_data_source_plugin_endpoint(plugin_info, data_source_vo.domain_id)
-
-        if updated_version:
-            _LOGGER.debug(f'[get_data_source_plugin_endpoint_by_vo] upgrade plugin version: {plugin_info["version"]} -> {updated_version}')
-            self.upgrade_data_source_plugin_version(data_source_vo, endpoint, updated_version)
+        return self.get_cached_data_source_plugin_endpoint(plugin_info, data_source_vo.domain_id)
 
+    def get_cached_data_source_plugin_endpoint(self, plugin_info, domain_id):
+        # Version upgrades are applied by the refresh task, not on the request path.
+        plugin_mgr: PluginManager = self.locator.get_manager('PluginManager')
+        endpoint, updated_version = plugin_mgr.get_cached_plugin_endpoint(plugin_info, domain_id)
         return endpoint
 
+    def refresh_data_source_plugin_endpoint(self, plugin_info, domain_id):
+        plugin_mgr: PluginManager = self.locator.get_manager('PluginManager')
+        return plugin_mgr.refresh_plugin_endpoint(plugin_info, domain_id)
+
     def get_data_source_plugin_endpoint(self, plugin_info, domain_id):
         plugin_mgr: PluginManager = self.locator.get_manager('PluginManager')
         return plugin_mgr.get_plugin_endpoint(plugin_info, domain_id)
@@ -4,6 +4,7 @@ import logging
 from spaceone.core import cache
 from spaceone.core.manager import BaseManager
 from spaceone.monitoring.error.escalation_policy import *
+from spaceone.monitoring.manager.project_ingest_context_manager import ProjectIngestContextManager
 from spaceone.monitoring.model.escalation_policy_model import EscalationPolicy
 from spaceone.monitoring.conf.default_escalation_policy import DEFAULT_ESCALATION_POLICY
 
@@ -38,12 +39,16 @@ class EscalationPolicyManager(BaseManager):
             _LOGGER.info(f'[update_escalation_policy_by_vo._rollback] Revert Data : '
                          f'{old_data["escalation_policy_id"]}')
             escalation_policy_vo.update(old_data)
+            self._reset_project_ingest_contexts(escalation_policy_vo)
 
         self.transaction.add_rollback(_rollback, escalation_policy_vo.to_dict())
 
         updated_vo: EscalationPolicy = escalation_policy_vo.update(params)
 
-        cache.delete(f'escalation-policy-condition:{updated_vo.domain_id}:{updated_vo.escalation_policy_id}')
+        if cache.is_set():
+            cache.delete(f'escalation-policy-condition:{updated_vo.domain_id}:{updated_vo.escalation_policy_id}')
+
+        self._reset_project_ingest_contexts(updated_vo)
 
         return updated_vo
 
@@ -79,6 +84,12 @@ class EscalationPolicyManager(BaseManager):
         return self.escalation_policy_model.get(escalation_policy_id=escalation_policy_id,
                                                 domain_id=domain_id, only=only)
 
+    def _reset_project_ingest_contexts(self, escalation_policy_vo):
+        project_ingest_context_mgr: ProjectIngestContextManager = \
+            self.locator.get_manager('ProjectIngestContextManager')
+        project_ingest_context_mgr.reset_project_ingest_contexts_by_escalation_policy(
+            escalation_policy_vo.escalation_policy_id, escalation_policy_vo.domain_id)
+
     def list_escalation_policies(self, query={}):
         return self.escalation_policy_model.query(**query)
 
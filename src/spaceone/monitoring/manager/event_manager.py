@@ -1,18 +1,32 @@
+import json
 import logging
+import zlib
 from datetime import datetime, timedelta
+from bson import Binary, ObjectId
+from mongoengine import Document
 
-from spaceone.core import config
+from spaceone.core import config, cache, utils
 from spaceone.core.manager import BaseManager
+from spaceone.monitoring.lib import event_write_buffer
+from spaceone.monitoring.lib.bulk import make_document, insert_documents
 from spaceone.monitoring.model.event_model import Event
+from spaceone.monitoring.model.event_raw_data_model import EventRawData
 
 _LOGGER = logging.getLogger(__name__)
 
+_DEFAULT_COALESCING_CONF = {
+    'enabled': False,
+    'window': 600,
+    'max_occurrences': 10
+}
+
 
 class EventManager(BaseManager):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.event_model: Event = self.locator.get_model('Event')
+        self.event_raw_data_model: EventRawData = self.locator.get_model('EventRawData')
 
     def create_event(self, params):
         def _rollback(event_vo):
@@ -20,11 +34,54 @@ class EventManager(BaseManager):
                          f'Delete event : {event_vo.event_id}')
             event_vo.delete()
 
-        event_vo: Event = self.event_model.create(params)
-        self.transaction.add_rollback(_rollback, event_vo)
+        self._save_raw_data([params])
+        self._set_occurrences([params])
+
+        if event_write_buffer.is_enabled():
+            event_vo: Event = self._buffer_events([params])[0]
+        else:
+            event_vo: Event = self.event_model.create(params)
+            self.transaction.add_rollback(_rollback, event_vo)
+
+        self._set_alert_by_key([params])
 
         return event_vo
 
+    def create_events(self, events_data):
+        def _rollback(event_ids):
+            _LOGGER.info(f'[create_events._rollback] '
+                         f'Delete events : {len(event_ids)} events')
+            self.event_model.filter(event_id=event_ids).delete()
+
+        self._save_raw_data(events_data)
+        self._set_occurrences(events_data)
+
+        if event_write_buffer.is_enabled():
+            event_vos = self._buffer_events(events_data)
+        else:
+            event_vos = [make_document(self.event_model, event_data) for event_data in events_data]
+            event_vos = insert_documents(self.event_model, event_vos)
+            self.transaction.add_rollback(_rollback, [event_vo.event_id for event_vo in event_vos])
+
+        self._set_alert_by_key(events_data)
+
+        return event_vos
+
+    def _buffer_events(self, events_data):
+        """ Queue events in the write-behind buffer. The returned documents are written by the buffer. """
+
+        def _rollback(event_ids):
+            _LOGGER.info(f'[_buffer_events._rollback] '
+                         f'Delete events : {len(event_ids)} events')
+            event_write_buffer.discard(event_ids)
+            self.event_model.filter(event_id=event_ids).delete()
+
+        event_vos = [make_document(self.event_model, event_data) for event_data in events_data]
+        event_write_buffer.add(self.event_model, [event_vo.to_mongo().to_dict() for event_vo in event_vos])
+        self.transaction.add_rollback(_rollback, [event_vo.event_id for event_vo in event_vos])
+
+        return event_vos
+
     def update_event(self, params):
         event_vo: Event = self.get_event(params['event_id'], params['domain_id'])
         return self.update_event_by_vo(params, event_vo)
@@ -46,6 +103,78 @@ class EventManager(BaseManager):
     def get_event(self, event_id, domain_id, only=None):
         return self.event_model.get(event_id=event_id, domain_id=domain_id, only=only)
 
+    def load_raw_data(self, event_vo: Event):
+        """ Set the raw data of an event stored in the EventRawData collection """
+
+        if event_vo.raw_data_id and not event_vo.raw_data:
+            raw_data_vos = self.event_raw_data_model.filter(raw_data_id=event_vo.raw_data_id,
+                                                            domain_id=event_vo.domain_id)
+
+            if raw_data_vos.count() > 0:
+                event_vo.raw_data = json.loads(zlib.decompress(raw_data_vos[0].data))
+
+        return event_vo
+
+    @staticmethod
+    def get_coalescing_conf():
+        coalescing_conf = _DEFAULT_COALESCING_CONF.copy()
+        coalescing_conf.update(config.get_global('EVENT_COALESCING', {}))
+        return coalescing_conf
+
+    def coalesce_event(self, event_data):
+        """ Count the event as a repeat of the latest event with the same key, type and alert seen within the window
+
+        The latest event is changed by a single atomic update, so repeats received by
+        concurrent workers are all counted.
+
+        Returns:
+            event_id (str): event_id of the updated event or None if there is no event to coalesce with
+        """
+
+        coalescing_conf = self.get_coalescing_conf()
+        occurred_at = self._get_occurred_at(event_data)
+        now = datetime.utcnow()
+        window_datetime = now - timedelta(seconds=coalescing_conf['window'])
+
+        # Served by COMPOUND_INDEX_FOR_LAST_SEEN
+        event_info = self.event_model._get_collection().find_one_and_update(
+            {
+                'domain_id': event_data['domain_id'],
+                'event_key': event_data['event_key'],
+                'event_type': event_data.get('event_type', 'ALERT'),
+                'alert_id': event_data['alert_id'],
+                '$or': self._make_last_seen_condition(window_datetime)
+            },
+            {
+                '$inc': {'occurrence_count': 1},
+                '$set': {'last_occurred_at': occurred_at, 'last_seen_at': now},
+                '$push': {'occurrences': {'$each': [occurred_at], '$slice': -coalescing_conf['max_occurrences']}}
+            },
+            sort=[('last_seen_at', -1), ('created_at', -1)],
+            projection={'event_id': 1}
+        )
+
+        if event_info is None:
+            return None
+
+        # The repeat keeps the alert of the event key alive as a new event would
+        self._set_alert_by_key([event_data])
+
+        _LOGGER.debug(f'[coalesce_event] Coalesce event: {event_info["event_id"]} ({event_data["event_key"]})')
+        return event_info['event_id']
+
+    def merge_occurrence(self, event_data, repeat_event_data):
+        """ Count a repeat on an event that has not been saved yet """
+
+        self._set_occurrences([event_data])
+
+        occurred_at = self._get_occurred_at(repeat_event_data)
+        max_occurrences = self.get_coalescing_conf()['max_occurrences']
+
+        event_data['occurrence_count'] += 1
+        event_data['last_occurred_at'] = occurred_at
+        event_data['occurrences'] = (event_data['occurrences'] + [occurred_at])[-max_occurrences:]
+
     def filter_events(self, **conditions):
         return self.event_model.filter(**conditions)
 
@@ -55,41 +184,128 @@ class EventManager(BaseManager):
     def stat_events(self, query):
         return self.event_model.stat(**query)
 
-    def get_event_by_key(self, event_key, domain_id):
+    def _save_raw_data(self, events_data):
+        # Events parsed from one payload share the raw data dict, so it is hashed and saved only once.
+        saved_raw_data = {}
+
+        for event_data in events_data:
+            raw_data = event_data.pop('raw_data', None)
+
+            if not raw_data:
+                continue
+
+            if id(raw_data) not in saved_raw_data:
+                saved_raw_data[id(raw_data)] = (raw_data, self._upsert_raw_data(raw_data, event_data['domain_id']))
+
+            event_data['raw_data_id'] = saved_raw_data[id(raw_data)][1]
+
+    def _upsert_raw_data(self, raw_data, domain_id):
+        raw_data_id = utils.dict_to_hash(raw_data)
+        data = zlib.compress(json.dumps(raw_data).encode('utf-8'))
+
+        self.event_raw_data_model.filter(raw_data_id=raw_data_id, domain_id=domain_id).update_one(
+            upsert=True,
+            set_on_insert__data=Binary(data),
+            set_on_insert__data_size=len(data),
+            set_on_insert__created_at=datetime.utcnow(),
+            set__updated_at=datetime.utcnow()
+        )
+
+        return raw_data_id
+
+    @staticmethod
+    def _get_occurred_at(event_data):
+        return event_data.get('occurred_at') or datetime.utcnow()
+
+    def _set_occurrences(self, events_data):
+        if not self.get_coalescing_conf()['enabled']:
+            return
+
+        for event_data in events_data:
+            if 'occurrences' not in event_data:
+                occurred_at = self._get_occurred_at(event_data)
+                event_data['occurrence_count'] = 1
+                event_data['last_occurred_at'] = occurred_at
+                event_data['occurrences'] = [occurred_at]
+
+    def get_alert_by_key(self, event_key, domain_id):
+        """ Find the alert of the latest event with the same event key seen within SAME_EVENT_TIME
+
+        The result is kept in the cache and refreshed whenever an event with the key is created,
+        so repeated events resolve their alert without loading Event and Alert documents.
+
+        Returns:
+            alert_info (dict): {'alert_id': 'str', 'alert': ObjectId} or None
+        """
+
+        if cache.is_set():
+            alert_info = cache.get(self._make_event_key_cache_key(event_key, domain_id))
+            if alert_info:
+                return {
+                    'alert_id': alert_info['alert_id'],
+                    'alert': ObjectId(alert_info['alert'])
+                }
+
+        # Events in the write-behind buffer are newer than the saved events
+        if event_write_buffer.is_enabled():
+            alert_info = event_write_buffer.get_pending_alert(event_key, domain_id)
+            if alert_info:
+                return alert_info
+
         same_event_time = config.get_global('SAME_EVENT_TIME', 600)
         same_event_datetime = datetime.utcnow() - timedelta(seconds=same_event_time)
 
-        query = {
-            'filter': [
-                {
-                    'k': 'event_key',
-                    'v': event_key,
-                    'o': 'eq'
-                },
-                {
-                    'k': 'domain_id',
-                    'v': domain_id,
-                    'o': 'eq'
-                },
-                {
-                    'k': 'event_type',
-                    'v': 'RECOVERY',
-                    'o': 'not'
-                },
-                {
-                    'k': 'created_at',
-                    'v': same_event_datetime,
-                    'o': 'gte'
-                }
-            ],
-            'sort': {
-                'key': 'created_at',
-                'desc': True
-            }
-        }
+        # Projection only query served by COMPOUND_INDEX_FOR_LAST_SEEN
+        event_info = self.event_model._get_collection().find_one(
+            {
+                'domain_id': domain_id,
+                'event_key': event_key,
+                'event_type': {'$ne': 'RECOVERY'},
+                '$or': self._make_last_seen_condition(same_event_datetime)
+            },
+            sort=[('last_seen_at', -1), ('created_at', -1)],
+            projection={'alert': 1, 'alert_id': 1}
+        )
 
-        event_vos, total_count = self.list_events(query)
-        if event_vos.count() > 0:
-            return event_vos[0]
-        else:
+        if event_info is None or event_info.get('alert') is None:
             return None
+
+        return {
+            'alert_id': event_info['alert_id'],
+            'alert': event_info['alert']
+        }
+
+    def delete_alert_by_key(self, event_key, domain_id):
+        if cache.is_set():
+            cache.delete(self._make_event_key_cache_key(event_key, domain_id))
+
+    def _set_alert_by_key(self, events_data):
+        if not cache.is_set():
+            return
+
+        same_event_time = config.get_global('SAME_EVENT_TIME', 600)
+
+        for event_data in events_data:
+            if event_data.get('event_type') == 'RECOVERY' or event_data.get('alert') is None:
+                continue
+
+            alert = event_data['alert']
+            if isinstance(alert, Document):
+                alert = alert.pk
+
+            cache.set(self._make_event_key_cache_key(event_data['event_key'], event_data['domain_id']), {
+                'alert_id': event_data['alert_id'],
+                'alert': str(alert)
+            }, expire=same_event_time)
+
+    @staticmethod
+    def _make_last_seen_condition(window_datetime):
+        # Events saved before last_seen_at was recorded are matched by their creation time
+        return [
+            {'last_seen_at': {'$gte': window_datetime}},
+            {'last_seen_at': None, 'created_at': {'$gte': window_datetime}}
+        ]
+
+    @staticmethod
+    def _make_event_key_cache_key(event_key, domain_id):
+        return f'event-key:{domain_id}:{event_key}'
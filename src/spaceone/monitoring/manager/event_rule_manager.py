@@ -1,14 +1,20 @@
 import logging
-import functools
+import time
 from typing import List
 
-from spaceone.core import utils
+from spaceone.core import cache, config, utils
 from spaceone.core.manager import BaseManager
 from spaceone.monitoring.error.event_rule import *
-from spaceone.monitoring.model.event_rule_model import EventRule, EventRuleCondition
+from spaceone.monitoring.lib.event_rule_matcher import EventRuleMatcher, IndexedEventRuleSet, compile_event_rules
+from spaceone.monitoring.manager.project_ingest_context_manager import ProjectIngestContextManager
+from spaceone.monitoring.model.event_rule_model import EventRule
 
 _LOGGER = logging.getLogger(__name__)
 
+# domain_id -> {'version': str, 'expired_at': float, 'event_rules': IndexedEventRuleSet}
+# Compiled project event rules are kept in the project ingest context (ProjectIngestContextManager).
+_COMPILED_EVENT_RULES = {}
+
 
 class EventRuleManager(BaseManager):
 
@@ -26,6 +32,8 @@ class EventRuleManager(BaseManager):
         event_rule_vo: EventRule = self.event_rule_model.create(params)
         self.transaction.add_rollback(_rollback, event_rule_vo)
 
+        self.reset_compiled_event_rules(event_rule_vo.project_id, event_rule_vo.domain_id)
+
         return event_rule_vo
 
     def update_event_rule(self, params):
@@ -37,18 +45,28 @@ class EventRuleManager(BaseManager):
             _LOGGER.info(f'[update_event_rule_by_vo._rollback] Revert Data : '
                          f'{old_data["event_rule_id"]}')
             event_rule_vo.update(old_data)
+            self.reset_compiled_event_rules(event_rule_vo.project_id, event_rule_vo.domain_id)
 
         self.transaction.add_rollback(_rollback, event_rule_vo.to_dict())
 
-        return event_rule_vo.update(params)
+        updated_vo: EventRule = event_rule_vo.update(params)
+
+        self.reset_compiled_event_rules(updated_vo.project_id, updated_vo.domain_id)
+
+        return updated_vo
 
     def delete_event_rule(self, event_rule_id, domain_id):
         event_rule_vo: EventRule = self.get_event_rule(event_rule_id, domain_id)
         self.delete_event_rule_by_vo(event_rule_vo)
 
     def delete_event_rule_by_vo(self, event_rule_vo):
+        project_id = event_rule_vo.project_id
+        domain_id = event_rule_vo.domain_id
+
         event_rule_vo.delete()
 
+        self.reset_compiled_event_rules(project_id, domain_id)
+
     def get_event_rule(self, event_rule_id, domain_id, only=None):
         return self.event_rule_model.get(event_rule_id=event_rule_id, domain_id=domain_id, only=only)
 
@@ -59,18 +77,57 @@ class EventRuleManager(BaseManager):
         return self.event_rule_model.stat(**query)
 
     def change_event_data(self, event_data, project_id, domain_id):
-        event_rule_vos: List[EventRule] = self._get_project_event_rules(project_id, domain_id)
+        event_rules: List[EventRuleMatcher] = self._get_compiled_project_event_rules(project_id, domain_id)
 
-        for event_rule_vo in event_rule_vos:
-            is_match = self._change_event_data_by_event_rule(event_data, event_rule_vo)
+        for event_rule in event_rules:
+            is_match = event_rule.match(event_data)
 
             if is_match:
-                event_data = self._change_event_data_with_actions(event_data, event_rule_vo.actions)
+                event_data = self._change_event_data_with_actions(event_data, event_rule.actions)
 
-            if is_match and event_rule_vo.options.stop_processing:
+            if is_match and event_rule.stop_processing:
                 break
 
-        # TODO: Check Global Event Rule
+        global_event_rule_set: IndexedEventRuleSet = self._get_compiled_global_event_rules(domain_id)
+
+        if len(global_event_rule_set) > 0:
+            event_data = self._change_event_data_by_global_event_rules(event_data, global_event_rule_set)
+
+        return event_data
+
+    @staticmethod
+    def reset_compiled_event_rules(project_id, domain_id):
+        if project_id:
+            ProjectIngestContextManager.reset_project_ingest_context(project_id, domain_id)
+            return
+
+        _COMPILED_EVENT_RULES.pop(domain_id, None)
+
+        # Let the other processes know that their compiled rules are outdated
+        if cache.is_set():
+            cache.set(EventRuleManager._make_version_key(domain_id), utils.random_string())
+
+    def _change_event_data_by_global_event_rules(self, event_data, event_rule_set: IndexedEventRuleSet):
+        start = 0
+
+        while start < len(event_rule_set):
+            is_rematch = False
+
+            for rule_index in event_rule_set.match(event_data, start):
+                event_rule = event_rule_set.event_rules[rule_index]
+                event_data = self._change_event_data_with_actions(event_data, event_rule.actions)
+
+                if event_rule.stop_processing:
+                    return event_data
+
+                # The actions changed a field used by the conditions, so the next rules must be matched again.
+                if event_rule.changed_fields & event_rule_set.condition_fields:
+                    start = rule_index + 1
+                    is_rematch = True
+                    break
+
+            if not is_rematch:
+                break
 
         return event_data
 
@@ -101,54 +158,63 @@ class EventRuleManager(BaseManager):
 
         return event_data
 
-    def _change_event_data_by_event_rule(self, event_data, event_rule_vo: EventRule):
-        conditions_policy = event_rule_vo.conditions_policy
+    def list_project_event_rules(self, project_id, domain_id):
+        query = {
+            'filter': [
+                {
+                    'k': 'project_id',
+                    'v': project_id,
+                    'o': 'eq'
+                },
+                {
+                    'k': 'domain_id',
+                    'v': domain_id,
+                    'o': 'eq'
+                }
+            ],
+            'sort': {
+                'key': 'order'
+            }
+        }
+
+        event_rule_vos, total_count = self.list_event_rules(query)
+        return event_rule_vos
+
+    def _get_compiled_project_event_rules(self, project_id, domain_id):
+        project_ingest_context_mgr: ProjectIngestContextManager = \
+            self.locator.get_manager('ProjectIngestContextManager')
+        return project_ingest_context_mgr.get_project_ingest_context(project_id, domain_id).event_rules
 
-        results = list(map(functools.partial(self._check_condition, event_data), event_rule_vo.conditions))
+    def _get_compiled_global_event_rules(self, domain_id):
+        compiled = _COMPILED_EVENT_RULES.get(domain_id)
 
-        if conditions_policy == 'ALL':
-            return all(results)
+        if cache.is_set():
+            version = cache.get(self._make_version_key(domain_id))
         else:
-            return any(results)
+            version = None
+
+        if compiled is None or compiled['version'] != version or compiled['expired_at'] < time.time():
+            event_rule_vos = self._get_global_event_rules(domain_id)
+
+            compiled = {
+                'version': version,
+                'expired_at': time.time() + config.get_global('EVENT_RULE_CACHE_TTL', 300),
+                'event_rules': IndexedEventRuleSet(compile_event_rules(event_rule_vos))
+            }
+            _COMPILED_EVENT_RULES[domain_id] = compiled
+
+        return compiled['event_rules']
 
     @staticmethod
-    def _check_condition(event_data, condition: EventRuleCondition):
-        event_value = utils.get_dict_value(event_data, condition.key)
-        condition_value = condition.value
-        operator = condition.operator
-
-        if event_value is None:
-            return False
-
-        if operator == 'eq':
-            if event_value == condition_value:
-                return True
-            else:
-                return False
-        elif operator == 'contain':
-            if event_value.lower().find(condition_value.lower()) >= 0:
-                return True
-            else:
-                return False
-        elif operator == 'not':
-            if event_value != condition_value:
-                return True
-            else:
-                return False
-        elif operator == 'not_contain':
-            if event_value.lower().find(condition_value.lower()) < 0:
-                return True
-            else:
-                return False
-
-        return False
-
-    def _get_project_event_rules(self, project_id, domain_id):
+    def _make_version_key(domain_id):
+        return f'event-rule-version:{domain_id}:global'
+
+    def _get_global_event_rules(self, domain_id):
         query = {
             'filter': [
                 {
-                    'k': 'project_id',
-                    'v': project_id,
+                    'k': 'scope',
+                    'v': 'GLOBAL',
                     'o': 'eq'
                 },
                 {
@@ -1,8 +1,10 @@
 import logging
 
+from spaceone.core import config
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
-
+from spaceone.monitoring.error.identity import *
+from spaceone.monitoring.lib import circuit_breaker
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -11,6 +13,11 @@ _GET_RESOURCE_METHODS = {
     'identity.ServiceAccount': 'get_service_account',
 }
 
+_DEFAULT_CIRCUIT_BREAKER_CONF = {
+    'failure_threshold': 5,
+    'reset_timeout': 30
+}
+
 
 class IdentityManager(BaseManager):
 
@@ -19,17 +26,58 @@ class IdentityManager(BaseManager):
         self.identity_connector: SpaceConnector = self.locator.get_connector('SpaceConnector', service='identity')
 
     def get_user(self, user_id, domain_id):
-        return self.identity_connector.dispatch('User.get', {'user_id': user_id, 'domain_id': domain_id})
+        return self._dispatch('User.get', {'user_id': user_id, 'domain_id': domain_id})
+
+    def list_users(self, query, domain_id):
+        return self._dispatch('User.list', {'query': query, 'domain_id': domain_id})
 
     def get_project(self, project_id, domain_id):
-        return self.identity_connector.dispatch('Project.get', {'project_id': project_id, 'domain_id': domain_id})
+        return self._dispatch('Project.get', {'project_id': project_id, 'domain_id': domain_id})
+
+    def list_projects(self, query, domain_id):
+        return self._dispatch('Project.list', {'query': query, 'domain_id': domain_id})
 
     def get_service_account(self, service_account_id, domain_id):
-        return self.identity_connector.dispatch('ServiceAccount.get', {'service_account_id': service_account_id,
-                                                                       'domain_id': domain_id})
+        return self._dispatch('ServiceAccount.get', {'service_account_id': service_account_id,
+                                                     'domain_id': domain_id})
 
     def get_resource(self, resource_type, resource_id, domain_id):
         if resource_type == 'identity.Project':
             return self.get_project(resource_id, domain_id)
         elif resource_type == 'identity.ServiceAccount':
             return self.get_service_account(resource_id, domain_id)
+
+    def _dispatch(self, method, params):
+        """Calls the identity service through a circuit breaker.
+
+        After 'failure_threshold' consecutive connection failures, calls fail fast with
+        ERROR_IDENTITY_SERVICE_UNAVAILABLE until a trial call succeeds. Error responses of the
+        identity service (e.g. not found) do not count as failures.
+        """
+
+        breaker_conf = _DEFAULT_CIRCUIT_BREAKER_CONF.copy()
+        breaker_conf.update(config.get_global('IDENTITY_CIRCUIT_BREAKER', {}))
+
+        if not circuit_breaker.allow('identity', breaker_conf['reset_timeout']):
+            raise ERROR_IDENTITY_SERVICE_UNAVAILABLE(reset_timeout=breaker_conf['reset_timeout'])
+
+        try:
+            response = self.identity_connector.dispatch(method, params)
+        except ERROR_GRPC_CONNECTION as e:
+            self._record_failure(breaker_conf, e)
+            raise e
+        except ERROR_BASE as e:
+            circuit_breaker.record_success('identity')
+            raise e
+        except Exception as e:
+            self._record_failure(breaker_conf, e)
+            raise e
+
+        circuit_breaker.record_success('identity')
+        return response
+
+    @staticmethod
+    def _record_failure(breaker_conf, e):
+        if circuit_breaker.record_failure('identity', breaker_conf['failure_threshold']):
+            _LOGGER.error(f'[_dispatch] Identity service is unavailable. Skip requests for '
+                          f'{breaker_conf["reset_timeout"]}s: {e}')
@@ -80,7 +80,7 @@ class JobManager(BaseManager):
             'message': e.message
         })
 
-    def push_task(self, task_name, class_name, method, params):
+    def push_task(self, task_name, class_name, method, params, queue_name='monitoring_q'):
         task = {
             'name': task_name,
             'version': 'v1',
@@ -96,4 +96,4 @@ class JobManager(BaseManager):
             }]
         }
 
-        queue.put('monitoring_q', utils.dump_json(task))
+        queue.put(queue_name, utils.dump_json(task))
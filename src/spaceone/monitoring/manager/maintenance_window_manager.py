@@ -1,10 +1,19 @@
 import logging
+import threading
+import time
+from datetime import datetime
 
+from spaceone.core import cache, config, utils
 from spaceone.core.manager import BaseManager
+from spaceone.monitoring.lib.maintenance_index import MaintenanceIndex
 from spaceone.monitoring.model.maintenance_window_model import MaintenanceWindow
 
 _LOGGER = logging.getLogger(__name__)
 
+# domain_id -> {'version': str, 'expired_at': float, 'index': MaintenanceIndex}
+_MAINTENANCE_INDEXES = {}
+_LOCK = threading.Lock()
+
 
 class MaintenanceWindowManager(BaseManager):
 
@@ -18,10 +27,13 @@ class MaintenanceWindowManager(BaseManager):
                          f'Delete maintenance_window : {maintenance_window_vo.title} '
                          f'({maintenance_window_vo.maintenance_window_id})')
             maintenance_window_vo.delete()
+            self.reset_maintenance_index(maintenance_window_vo.domain_id)
 
         maintenance_window_vo: MaintenanceWindow = self.maintenance_window_model.create(params)
         self.transaction.add_rollback(_rollback, maintenance_window_vo)
 
+        self._update_maintenance_index(maintenance_window_vo)
+
         return maintenance_window_vo
 
     def update_maintenance_window(self, params):
@@ -34,15 +46,40 @@ class MaintenanceWindowManager(BaseManager):
             _LOGGER.info(f'[update_maintenance_window_by_vo._rollback] Revert Data : '
                          f'{old_data["maintenance_window_id"]}')
             maintenance_window_vo.update(old_data)
+            self.reset_maintenance_index(maintenance_window_vo.domain_id)
 
         self.transaction.add_rollback(_rollback, maintenance_window_vo.to_dict())
 
-        return maintenance_window_vo.update(params)
+        updated_vo: MaintenanceWindow = maintenance_window_vo.update(params)
+        self._update_maintenance_index(updated_vo)
+
+        return updated_vo
 
     def close_maintenance_window(self, maintenance_window_id, domain_id):
         maintenance_window_vo: MaintenanceWindow = self.get_maintenance_window(maintenance_window_id, domain_id)
 
-        return self.update_maintenance_window_by_vo({'state': 'CLOSED'}, maintenance_window_vo)
+        return self.update_maintenance_window_by_vo({'state': 'CLOSED', 'closed_at': datetime.utcnow()},
+                                                    maintenance_window_vo)
+
+    def close_expired_maintenance_windows(self):
+        """Closes the open maintenance windows whose end time has passed with a single update.
+
+        Returns:
+            closed_count (int)
+        """
+
+        now = datetime.utcnow()
+        expired_filter = {'state': 'OPEN', 'end_time': {'$lt': now}}
+        collection = self.maintenance_window_model._get_collection()
+
+        domain_ids = collection.distinct('domain_id', expired_filter)
+        result = collection.update_many(expired_filter, {'$set': {'state': 'CLOSED', 'closed_at': now,
+                                                                  'updated_at': now}})
+
+        for domain_id in domain_ids:
+            self.reset_maintenance_index(domain_id)
+
+        return result.modified_count
 
     def get_maintenance_window(self, maintenance_window_id, domain_id, only=None):
         return self.maintenance_window_model.get(maintenance_window_id=maintenance_window_id,
@@ -56,3 +93,78 @@ class MaintenanceWindowManager(BaseManager):
 
     def stat_maintenance_windows(self, query):
         return self.maintenance_window_model.stat(**query)
+
+    def is_project_under_maintenance(self, project_id, domain_id, at=None):
+        return self.get_maintenance_index(domain_id).is_under_maintenance(project_id, at)
+
+    def get_projects_under_maintenance(self, project_ids, domain_id, at=None):
+        return self.get_maintenance_index(domain_id).get_projects_under_maintenance(project_ids, at)
+
+    def get_maintenance_index(self, domain_id) -> MaintenanceIndex:
+        cached = _MAINTENANCE_INDEXES.get(domain_id)
+        version = self._get_maintenance_index_version(domain_id)
+
+        if cached is None or cached['version'] != version or cached['expired_at'] < time.time():
+            cached = {
+                'version': version,
+                'expired_at': time.time() + config.get_global('MAINTENANCE_INDEX_TTL', 300),
+                'index': self._load_maintenance_index(domain_id)
+            }
+
+            with _LOCK:
+                _MAINTENANCE_INDEXES[domain_id] = cached
+
+        return cached['index']
+
+    @staticmethod
+    def reset_maintenance_index(domain_id):
+        with _LOCK:
+            _MAINTENANCE_INDEXES.pop(domain_id, None)
+
+        # Let the other processes know that their indexes are outdated
+        if cache.is_set():
+            cache.set(MaintenanceWindowManager._make_version_key(domain_id), utils.random_string())
+
+    def _update_maintenance_index(self, maintenance_window_vo: MaintenanceWindow):
+        domain_id = maintenance_window_vo.domain_id
+
+        with _LOCK:
+            cached = _MAINTENANCE_INDEXES.get(domain_id)
+
+            # The index of this process is changed in place instead of being reloaded
+            if cached:
+                if maintenance_window_vo.state == 'OPEN':
+                    cached['index'].add(maintenance_window_vo.maintenance_window_id, maintenance_window_vo.projects,
+                                        maintenance_window_vo.start_time, maintenance_window_vo.end_time)
+                else:
+                    cached['index'].remove(maintenance_window_vo.maintenance_window_id)
+
+            if cache.is_set():
+                version = utils.random_string()
+                cache.set(self._make_version_key(domain_id), version)
+
+                if cached:
+                    cached['version'] = version
+
+    def _load_maintenance_index(self, domain_id):
+        maintenance_index = MaintenanceIndex()
+        maintenance_window_vos = self.maintenance_window_model.filter(state='OPEN', domain_id=domain_id)
+
+        for maintenance_window_info in maintenance_window_vos.only('maintenance_window_id', 'projects',
+                                                                   'start_time', 'end_time').as_pymongo():
+            maintenance_index.add(maintenance_window_info['maintenance_window_id'],
+                                  maintenance_window_info.get('projects', []),
+                                  maintenance_window_info['start_time'], maintenance_window_info['end_time'])
+
+        return maintenance_index
+
+    @staticmethod
+    def _get_maintenance_index_version(domain_id):
+        if cache.is_set():
+            return cache.get(MaintenanceWindowManager._make_version_key(domain_id))
+        else:
+            return None
+
+    @staticmethod
+    def _make_version_key(domain_id):
+        return f'maintenance-index-version:{domain_id}'
@@ -1,10 +1,17 @@
 import logging
+import threading
+import time
 
+from spaceone.core import cache, config
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
 
 _LOGGER = logging.getLogger(__name__)
 
+# Process-local endpoint cache used when the default cache is not configured
+_ENDPOINTS = {}
+_LOCK = threading.Lock()
+
 
 class PluginManager(BaseManager):
 
@@ -25,3 +32,52 @@ class PluginManager(BaseManager):
         )
 
         return response['endpoint'], response.get('updated_version')
+
+    def get_cached_plugin_endpoint(self, plugin_info, domain_id):
+        """ Resolve the plugin endpoint from the cache (refreshed by PluginEndpointScheduler)
+
+        Returns:
+            endpoint (str), updated_version (str)
+        """
+
+        endpoint_info = self._get_endpoint_info(self._make_endpoint_cache_key(plugin_info, domain_id))
+        if endpoint_info:
+            return endpoint_info['endpoint'], endpoint_info.get('updated_version')
+
+        return self.refresh_plugin_endpoint(plugin_info, domain_id)
+
+    def refresh_plugin_endpoint(self, plugin_info, domain_id):
+        endpoint, updated_version = self.get_plugin_endpoint(plugin_info, domain_id)
+
+        self._set_endpoint_info(self._make_endpoint_cache_key(plugin_info, domain_id), {
+            'endpoint': endpoint,
+            'updated_version': updated_version
+        }, expire=config.get_global('PLUGIN_ENDPOINT_CACHE_TTL', 600))
+
+        return endpoint, updated_version
+
+    @staticmethod
+    def _get_endpoint_info(key):
+        if cache.is_set():
+            return cache.get(key)
+
+        with _LOCK:
+            endpoint_info, expires_at = _ENDPOINTS.get(key, (None, 0))
+            if expires_at > time.time():
+                return endpoint_info
+
+            _ENDPOINTS.pop(key, None)
+            return None
+
+    @staticmethod
+    def _set_endpoint_info(key, endpoint_info, expire):
+        if cache.is_set():
+            cache.set(key, endpoint_info, expire=expire)
+        else:
+            with _LOCK:
+                _ENDPOINTS[key] = (endpoint_info, time.time() + expire)
+
+    @staticmethod
+    def _make_endpoint_cache_key(plugin_info, domain_id):
+        return f'plugin-endpoint:{domain_id}:{plugin_info["plugin_id"]}:{plugin_info.get("version")}:' \
+               f'{plugin_info.get("upgrade_mode", "AUTO")}'
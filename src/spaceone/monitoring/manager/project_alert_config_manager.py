@@ -3,6 +3,7 @@ import logging
 from spaceone.core import cache
 from spaceone.core.manager import BaseManager
 from spaceone.monitoring.error.project_alert_config import *
+from spaceone.monitoring.manager.project_ingest_context_manager import ProjectIngestContextManager
 from spaceone.monitoring.model.project_alert_config_model import ProjectAlertConfig
 
 _LOGGER = logging.getLogger(__name__)
@@ -19,10 +20,15 @@ class ProjectAlertConfigManager(BaseManager):
             _LOGGER.info(f'[create_project_alert_config._rollback] '
                          f'Delete project alert config : {project_alert_config_vo.project_id}')
             project_alert_config_vo.delete()
+            ProjectIngestContextManager.reset_project_ingest_context(project_alert_config_vo.project_id,
+                                                                     project_alert_config_vo.domain_id)
 
         project_alert_config_vo: ProjectAlertConfig = self.project_alert_config_model.create(params)
         self.transaction.add_rollback(_rollback, project_alert_config_vo)
 
+        ProjectIngestContextManager.reset_project_ingest_context(project_alert_config_vo.project_id,
+                                                                 project_alert_config_vo.domain_id)
+
         return project_alert_config_vo
 
     def update_project_alert_config(self, params):
@@ -35,26 +41,30 @@ class ProjectAlertConfigManager(BaseManager):
             _LOGGER.info(f'[update_project_alert_config_by_vo._rollback] Revert Data : '
                          f'{old_data["project_id"]}')
             project_alert_config_vo.update(old_data)
+            ProjectIngestContextManager.reset_project_ingest_context(project_alert_config_vo.project_id,
+                                                                     project_alert_config_vo.domain_id)
 
         self.transaction.add_rollback(_rollback, project_alert_config_vo.to_dict())
 
         updated_vo: ProjectAlertConfig = project_alert_config_vo.update(params)
 
-        cache.delete(f'project-alert-options:{updated_vo.domain_id}:{updated_vo.project_id}')
-        cache.delete(f'escalation-policy-info:{updated_vo.domain_id}:{updated_vo.project_id}')
-        cache.delete(f'auto-recovery:{updated_vo.domain_id}:{updated_vo.project_id}')
+        if cache.is_set():
+            cache.delete(f'project-alert-options:{updated_vo.domain_id}:{updated_vo.project_id}')
+
+        ProjectIngestContextManager.reset_project_ingest_context(updated_vo.project_id, updated_vo.domain_id)
 
         return updated_vo
 
     def delete_project_alert_config(self, project_id, domain_id):
         project_alert_config_vo: ProjectAlertConfig = self.get_project_alert_config(project_id, domain_id)
 
-        cache.delete(f'project-alert-options:{domain_id}:{project_id}')
-        cache.delete(f'escalation-policy-info:{domain_id}:{project_id}')
-        cache.delete(f'auto-recovery::{domain_id}:{project_id}')
+        if cache.is_set():
+            cache.delete(f'project-alert-options:{domain_id}:{project_id}')
 
         project_alert_config_vo.delete()
 
+        ProjectIngestContextManager.reset_project_ingest_context(project_id, domain_id)
+
     def get_project_alert_config(self, project_id, domain_id, only=None):
         try:
             return self.project_alert_config_model.get(project_id=project_id, domain_id=domain_id, only=only)
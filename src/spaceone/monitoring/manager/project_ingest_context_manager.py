@@ -0,0 +1,105 @@
+import logging
+import time
+from typing import NamedTuple, Optional, Tuple
+
+from spaceone.core import cache, config, utils
+from spaceone.core.manager import BaseManager
+from spaceone.monitoring.error.project_alert_config import *
+from spaceone.monitoring.lib.event_rule_matcher import EventRuleMatcher, compile_event_rules
+from spaceone.monitoring.model.project_alert_config_model import ProjectAlertConfig
+
+_LOGGER = logging.getLogger(__name__)
+
+# (domain_id, project_id) -> {'version': str, 'expired_at': float, 'context': ProjectIngestContext}
+_PROJECT_INGEST_CONTEXTS = {}
+
+
+class ProjectIngestContext(NamedTuple):
+    """Project settings used to ingest events, loaded at once and shared by all events of the project."""
+
+    project_id: str
+    domain_id: str
+    is_alert_activated: bool
+    recovery_mode: Optional[str]
+    notification_urgency: Optional[str]
+    escalation_policy_id: Optional[str]
+    escalation_repeat_count: int
+    event_rules: Tuple[EventRuleMatcher, ...]
+
+
+class ProjectIngestContextManager(BaseManager):
+
+    def get_project_ingest_context(self, project_id, domain_id) -> ProjectIngestContext:
+        key = (domain_id, project_id)
+        cached = _PROJECT_INGEST_CONTEXTS.get(key)
+
+        if cache.is_set():
+            version = cache.get(self._make_version_key(project_id, domain_id))
+        else:
+            version = None
+
+        if cached is None or cached['version'] != version or cached['expired_at'] < time.time():
+            cached = {
+                'version': version,
+                'expired_at': time.time() + config.get_global('PROJECT_INGEST_CONTEXT_TTL', 300),
+                'context': self._load_project_ingest_context(project_id, domain_id)
+            }
+            _PROJECT_INGEST_CONTEXTS[key] = cached
+
+        return cached['context']
+
+    @staticmethod
+    def reset_project_ingest_context(project_id, domain_id):
+        _PROJECT_INGEST_CONTEXTS.pop((domain_id, project_id), None)
+
+        # Let the other processes know that their contexts are outdated
+        if cache.is_set():
+            cache.set(ProjectIngestContextManager._make_version_key(project_id, domain_id), utils.random_string())
+
+    def reset_project_ingest_contexts_by_escalation_policy(self, escalation_policy_id, domain_id):
+        project_alert_config_model: ProjectAlertConfig = self.locator.get_model('ProjectAlertConfig')
+        project_alert_config_vos = project_alert_config_model.filter(escalation_policy_id=escalation_policy_id,
+                                                                     domain_id=domain_id)
+
+        for project_alert_config_vo in project_alert_config_vos:
+            self.reset_project_ingest_context(project_alert_config_vo.project_id, domain_id)
+
+    def _load_project_ingest_context(self, project_id, domain_id):
+        project_alert_config_mgr = self.locator.get_manager('ProjectAlertConfigManager')
+        event_rule_mgr = self.locator.get_manager('EventRuleManager')
+
+        context = {
+            'project_id': project_id,
+            'domain_id': domain_id,
+            'is_alert_activated': False,
+            'recovery_mode': None,
+            'notification_urgency': None,
+            'escalation_policy_id': None,
+            'escalation_repeat_count': 0
+        }
+
+        try:
+            project_alert_config_vo: ProjectAlertConfig = \
+                project_alert_config_mgr.get_project_alert_config(project_id, domain_id)
+        except ERROR_ALERT_FEATURE_IS_NOT_ACTIVATED:
+            project_alert_config_vo = None
+
+        if project_alert_config_vo:
+            escalation_policy_vo = project_alert_config_vo.escalation_policy
+
+            context.update({
+                'is_alert_activated': True,
+                'recovery_mode': project_alert_config_vo.options.recovery_mode,
+                'notification_urgency': project_alert_config_vo.options.notification_urgency,
+                'escalation_policy_id': escalation_policy_vo.escalation_policy_id,
+                'escalation_repeat_count': escalation_policy_vo.repeat_count
+            })
+
+        event_rule_vos = event_rule_mgr.list_project_event_rules(project_id, domain_id)
+        context['event_rules'] = tuple(compile_event_rules(event_rule_vos))
+
+        return ProjectIngestContext(**context)
+
+    @staticmethod
+    def _make_version_key(project_id, domain_id):
+        return f'project-ingest-context-version:{domain_id}:{project_id}'
@@ -1,5 +1,7 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
+from spaceone.core import config
 from spaceone.core.manager import BaseManager
 from spaceone.monitoring.model.webhook_model import Webhook
 from spaceone.monitoring.manager.plugin_manager import PluginManager
@@ -32,16 +34,41 @@ class WebhookPluginManager(BaseManager):
     def parse_event(self, options, data):
         return self.wp_connector.parse_event(options, data)
 
+    def parse_events(self, options, data_list):
+        """ Parse multiple payloads with parallel unary calls over the shared plugin channel
+
+        Returns:
+            responses (list): response or raised exception of each payload, in the order of data_list
+        """
+
+        if len(data_list) == 1:
+            return [self._parse_event_safely(options, data_list[0])]
+
+        max_workers = min(config.get_global('WEBHOOK_PARSE_CONCURRENCY', 8), len(data_list))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda data: self._parse_event_safely(options, data), data_list))
+
+    def _parse_event_safely(self, options, data):
+        try:
+            return self.parse_event(options, data)
+        except Exception as e:
+            return e
+
     def get_webhook_plugin_endpoint_by_vo(self, webhook_vo: Webhook):
         plugin_info = webhook_vo.plugin_info.to_dict()
-        endpoint, updated_version = self.get_webhook_plugin_endpoint(plugin_info, webhook_vo.domain_id)
-
-        if updated_version:
-            _LOGGER.debug(f'[get_webhook_plugin_endpoint_by_vo] upgrade plugin version: {plugin_info["version"]} -> {updated_version}')
-            self.upgrade_webhook_plugin_version(webhook_vo, endpoint, updated_version)
+        return self.get_cached_webhook_plugin_endpoint(plugin_info, webhook_vo.domain_id)
 
+    def get_cached_webhook_plugin_endpoint(self, plugin_info, domain_id):
+        # Version upgrades are applied by the refresh task, not on the request path.
+        plugin_mgr: PluginManager = self.locator.get_manager('PluginManager')
+        endpoint, updated_version = plugin_mgr.get_cached_plugin_endpoint(plugin_info, domain_id)
         return endpoint
 
+    def refresh_webhook_plugin_endpoint(self, plugin_info, domain_id):
+        plugin_mgr: PluginManager = self.locator.get_manager('PluginManager')
+        return plugin_mgr.refresh_plugin_endpoint(plugin_info, domain_id)
+
     def get_webhook_plugin_endpoint(self, plugin_info, domain_id):
         plugin_mgr: PluginManager = self.locator.get_manager('PluginManager')
         return plugin_mgr.get_plugin_endpoint(plugin_info, domain_id)
@@ -8,4 +8,5 @@ from spaceone.monitoring.model.maintenance_window_model import MaintenanceWindow
 from spaceone.monitoring.model.alert_model import Alert
 from spaceone.monitoring.model.note_model import Note
 from spaceone.monitoring.model.event_model import Event
+from spaceone.monitoring.model.event_raw_data_model import EventRawData
 from spaceone.monitoring.model.job_model import Job
@@ -45,6 +45,7 @@ class Alert(MongoModel):
     acknowledged_at = DateTimeField(default=None, null=True)
     resolved_at = DateTimeField(default=None, null=True)
     escalated_at = DateTimeField(default=None, null=True)
+    next_escalation_at = DateTimeField(default=None, null=True)
 
     meta = {
         'updatable_fields': [
@@ -64,7 +65,8 @@ class Alert(MongoModel):
             'project_id',
             'acknowledged_at',
             'resolved_at',
-            'escalated_at'
+            'escalated_at',
+            'next_escalation_at'
         ],
         'minimal_fields': [
             'alert_number',
@@ -115,5 +117,9 @@ class Alert(MongoModel):
                            'escalation_policy_id', 'escalated_at'],
                 "name": "COMPOUND_INDEX_FOR_ESCALATION"
             },
+            {
+                "fields": ['domain_id', 'next_escalation_at', 'state', 'escalation_ttl'],
+                "name": "COMPOUND_INDEX_FOR_DUE_ESCALATION"
+            },
         ]
     }
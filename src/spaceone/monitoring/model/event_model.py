@@ -21,6 +21,7 @@ class Event(MongoModel):
     image_url = StringField(default=None, null=True)
     resource = EmbeddedDocumentField(EventResource, default=None, null=True)
     raw_data = DictField()
+    raw_data_id = StringField(max_length=40, default=None, null=True)
     additional_info = DictField()
     alert = ReferenceField('Alert', reverse_delete_rule=CASCADE)
     alert_id = StringField(max_length=40)
@@ -29,6 +30,10 @@ class Event(MongoModel):
     domain_id = StringField(max_length=40)
     created_at = DateTimeField(auto_now_add=True)
     occurred_at = DateTimeField(default=None, null=True)
+    occurrence_count = IntField(default=1)
+    last_occurred_at = DateTimeField(default=None, null=True)
+    last_seen_at = DateTimeField(auto_now_add=True)
+    occurrences = ListField(DateTimeField())
 
     meta = {
         'updatable_fields': [
@@ -66,6 +71,14 @@ class Event(MongoModel):
             'project_id',
             'domain_id',
             'created_at',
-            'occurred_at'
+            'occurred_at',
+            {
+                "fields": ['domain_id', 'event_key', '-created_at'],
+                "name": "COMPOUND_INDEX_FOR_EVENT_KEY"
+            },
+            {
+                "fields": ['domain_id', 'event_key', '-last_seen_at'],
+                "name": "COMPOUND_INDEX_FOR_LAST_SEEN"
+            }
         ]
     }
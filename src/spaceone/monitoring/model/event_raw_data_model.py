@@ -0,0 +1,24 @@
+from mongoengine import *
+
+from spaceone.core.model.mongo_model import MongoModel
+
+
+class EventRawData(MongoModel):
+    raw_data_id = StringField(max_length=40, unique_with='domain_id')
+    data = BinaryField()
+    data_size = IntField(default=0)
+    domain_id = StringField(max_length=40)
+    created_at = DateTimeField(auto_now_add=True)
+    updated_at = DateTimeField(auto_now=True)
+
+    meta = {
+        'updatable_fields': [],
+        'ordering': [
+            '-created_at'
+        ],
+        'indexes': [
+            'domain_id',
+            'created_at',
+            'updated_at'
+        ]
+    }
@@ -48,6 +48,14 @@ class MaintenanceWindow(MongoModel):
             'start_time',
             'end_time',
             'created_by',
-            'domain_id'
+            'domain_id',
+            {
+                "fields": ['state', 'end_time'],
+                "name": "COMPOUND_INDEX_FOR_CLOSE"
+            },
+            {
+                "fields": ['domain_id', 'state'],
+                "name": "COMPOUND_INDEX_FOR_MAINTENANCE_INDEX"
+            }
         ]
     }
@@ -10,3 +10,4 @@ from spaceone.monitoring.service.alert_service import AlertService
 from spaceone.monitoring.service.note_service import NoteService
 from spaceone.monitoring.service.event_service import EventService
 from spaceone.monitoring.service.job_service import JobService
+from spaceone.monitoring.service.retention_service import RetentionService
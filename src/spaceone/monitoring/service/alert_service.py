@@ -118,6 +118,7 @@ class AlertService(BaseService):
             params['escalation_ttl'] = escalation_policy_vo.repeat_count
             params['escalation_step'] = 1
             params['escalated_at'] = None
+            params['next_escalation_at'] = datetime.utcnow()
             params['assignee'] = None
             assignee = None
 
@@ -125,12 +126,14 @@ class AlertService(BaseService):
             if state == 'ACKNOWLEDGED':
                 params['acknowledged_at'] = datetime.utcnow()
                 params['resolved_at'] = None
+                params['next_escalation_at'] = datetime.utcnow()
             elif state == 'RESOLVED':
                 params['escalation_ttl'] = 0
                 params['resolved_at'] = datetime.utcnow()
             elif state == 'TRIGGERED':
                 params['acknowledged_at'] = None
                 params['resolved_at'] = None
+                params['next_escalation_at'] = datetime.utcnow()
 
         alert_vo = self.alert_mgr.get_alert(alert_id, domain_id)
 
@@ -208,6 +211,7 @@ class AlertService(BaseService):
 
         if state == 'ACKNOWLEDGED':
             update_params['acknowledged_at'] = datetime.utcnow()
+            update_params['next_escalation_at'] = datetime.utcnow()
         elif state == 'RESOLVED':
             update_params['resolved_at'] = datetime.utcnow()
 
@@ -254,6 +258,7 @@ class AlertService(BaseService):
 
         for event_vo in events:
             self.event_mgr.update_event_by_vo(params=update_event_params, event_vo=event_vo)
+            self.event_mgr.delete_alert_by_key(event_vo.event_key, domain_id)
 
         for alert_id in alerts:
             self.alert_mgr.delete_alert(alert_id=alert_id, domain_id=params['domain_id'])
@@ -287,6 +292,9 @@ class AlertService(BaseService):
         params['is_snoozed'] = True
         params['snoozed_end_time'] = params['end_time']
 
+        # Escalation is resumed when the snooze ends
+        params['next_escalation_at'] = params['end_time']
+
         return self.alert_mgr.update_alert_by_vo(params, alert_vo)
 
     @transaction(append_meta={'authorization.scope': 'PROJECT'})
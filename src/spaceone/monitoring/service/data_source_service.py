@@ -225,6 +225,51 @@ class DataSourceService(BaseService):
 
         return self.data_source_mgr.update_data_source_by_vo(params, data_source_vo)
 
+    @transaction(append_meta={'authorization.scope': 'SYSTEM'})
+    def refresh_plugin_endpoints(self, params):
+        """ Refresh cached plugin endpoints of enabled data sources and apply AUTO upgrades
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None
+        """
+
+        query = {
+            'filter': [
+                {
+                    'k': 'state',
+                    'v': 'ENABLED',
+                    'o': 'eq'
+                }
+            ]
+        }
+
+        data_source_vos, total_count = self.data_source_mgr.list_data_sources(query)
+
+        endpoints = {}
+        for data_source_vo in data_source_vos:
+            plugin_info = data_source_vo.plugin_info.to_dict()
+            plugin_key = (plugin_info['plugin_id'], plugin_info.get('version'), plugin_info.get('upgrade_mode'),
+                          data_source_vo.domain_id)
+
+            try:
+                if plugin_key not in endpoints:
+                    endpoints[plugin_key] = self.ds_plugin_mgr.refresh_data_source_plugin_endpoint(
+                        plugin_info, data_source_vo.domain_id)
+
+                endpoint, updated_version = endpoints[plugin_key]
+
+                if updated_version:
+                    _LOGGER.debug(f'[refresh_plugin_endpoints] upgrade plugin version: '
+                                  f'{data_source_vo.data_source_id} ({plugin_info.get("version")} -> {updated_version})')
+                    self.ds_plugin_mgr.upgrade_data_source_plugin_version(data_source_vo, endpoint, updated_version)
+
+            except Exception as e:
+                _LOGGER.error(f'[refresh_plugin_endpoints] Failed to refresh plugin endpoint: '
+                              f'{data_source_vo.data_source_id} ({e})', exc_info=True)
+
     @transaction(append_meta={'authorization.scope': 'DOMAIN'})
     @check_required(['data_source_id', 'domain_id'])
     def get(self, params):
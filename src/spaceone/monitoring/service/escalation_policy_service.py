@@ -7,6 +7,7 @@ from spaceone.monitoring.error.escalation_policy import *
 from spaceone.monitoring.model.escalation_policy_model import EscalationPolicy
 from spaceone.monitoring.manager.identity_manager import IdentityManager
 from spaceone.monitoring.manager.escalation_policy_manager import EscalationPolicyManager
+from spaceone.monitoring.manager.alert_manager import AlertManager
 from spaceone.monitoring.conf.default_escalation_policy import DEFAULT_ESCALATION_POLICY
 
 _LOGGER = logging.getLogger(__name__)
@@ -85,7 +86,13 @@ class EscalationPolicyService(BaseService):
             params['repeat_count'] = params.get('repeat_count', 0)
 
         escalation_policy_vo = self.escalation_policy_mgr.get_escalation_policy(escalation_policy_id, domain_id)
-        return self.escalation_policy_mgr.update_escalation_policy_by_vo(params, escalation_policy_vo)
+        escalation_policy_vo = self.escalation_policy_mgr.update_escalation_policy_by_vo(params, escalation_policy_vo)
+
+        if 'rules' in params or 'finish_condition' in params:
+            alert_mgr: AlertManager = self.locator.get_manager('AlertManager')
+            alert_mgr.reset_escalation_time_by_policy(escalation_policy_id, domain_id)
+
+        return escalation_policy_vo
 
     @transaction(append_meta={'authorization.scope': 'PROJECT'})
     @check_required(['escalation_policy_id', 'domain_id'])
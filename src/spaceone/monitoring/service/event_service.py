@@ -1,27 +1,32 @@
 import logging
-import copy
+import math
 
 from spaceone.core.service import *
 from spaceone.core import utils, cache, config
 from spaceone.monitoring.error.webhook import *
+from spaceone.monitoring.error.project_alert_config import ERROR_ALERT_FEATURE_IS_NOT_ACTIVATED
+from spaceone.monitoring.lib import idempotency, ingest_metrics, rate_limiter, webhook_parser
 from spaceone.monitoring.model.event_model import Event
 from spaceone.monitoring.model.alert_model import Alert
 from spaceone.monitoring.model.webhook_model import Webhook
-from spaceone.monitoring.model.project_alert_config_model import ProjectAlertConfig
-from spaceone.monitoring.model.escalation_policy_model import EscalationPolicy
 from spaceone.monitoring.manager.alert_manager import AlertManager
 from spaceone.monitoring.manager.webhook_manager import WebhookManager
 from spaceone.monitoring.manager.event_manager import EventManager
 from spaceone.monitoring.manager.event_rule_manager import EventRuleManager
 from spaceone.monitoring.manager.job_manager import JobManager
 from spaceone.monitoring.manager.webhook_plugin_manager import WebhookPluginManager
-from spaceone.monitoring.manager.project_alert_config_manager import ProjectAlertConfigManager
+from spaceone.monitoring.manager.project_ingest_context_manager import ProjectIngestContextManager, \
+    ProjectIngestContext
 
 _LOGGER = logging.getLogger(__name__)
 
+# Event data fields copied to a new alert
+_ALERT_FIELDS = ['title', 'description', 'assignee', 'urgency', 'severity', 'rule', 'image_url', 'resource',
+                 'additional_info', 'responders', 'project_dependencies', 'webhook_id', 'project_id', 'domain_id']
 
-@authentication_handler(exclude=['create'])
-@authorization_handler(exclude=['create'])
+
+@authentication_handler(exclude=['create', 'create_accepted', 'create_batch', 'create_batch_accepted', 'accept'])
+@authorization_handler(exclude=['create', 'create_accepted', 'create_batch', 'create_batch_accepted', 'accept'])
 @mutation_handler
 @event_handler
 class EventService(BaseService):
@@ -40,47 +45,161 @@ class EventService(BaseService):
             params (dict): {
                 'webhook_id': 'str',
                 'access_key': 'str',
-                'data': 'str'
+                'data': 'str',
+                'idempotency_key': 'str'
             }
 
         Returns:
             event_vo (object)
         """
 
-        webhook_data = self._get_webhook_data(params['webhook_id'])
+        webhook_data = self._get_checked_webhook_data(params)
+        self._check_rate_limit(webhook_data)
 
-        self._check_access_key(params['access_key'], webhook_data['access_key'])
-        self._check_webhook_state(webhook_data)
+        new_indexes, delivery_keys = self._check_deliveries(webhook_data, params, [params['data']])
 
-        try:
-            webhook_plugin_mgr: WebhookPluginManager = self.locator.get_manager('WebhookPluginManager')
-            endpoint, updated_version = webhook_plugin_mgr.get_webhook_plugin_endpoint({
-                'plugin_id': webhook_data['plugin_id'],
-                'version': webhook_data['plugin_version'],
-                'upgrade_mode': webhook_data['plugin_upgrade_mode']
-            }, webhook_data['domain_id'])
+        if len(new_indexes) == 0:
+            _LOGGER.debug(f'[Event.create] Drop the re-delivered payload: {params["webhook_id"]}')
+            return
 
-            if updated_version:
-                _LOGGER.debug(f'[create] upgrade plugin version: {webhook_data["plugin_version"]} -> {updated_version}')
-                webhook_vo: Webhook = self.webhook_mgr.get_webhook(webhook_data['webhook_id'], webhook_data['domain_id'])
-                webhook_plugin_mgr.upgrade_webhook_plugin_version(webhook_vo, endpoint, updated_version)
-                cache.delete(f'webhook-data:{webhook_data["webhook_id"]}')
+        self._create_from_payload(webhook_data, params['data'], delivery_keys)
 
-            webhook_plugin_mgr.initialize(endpoint)
-            response = webhook_plugin_mgr.parse_event(webhook_data['plugin_options'], params['data'])
+    @transaction(append_meta={'authorization.scope': 'PROJECT'})
+    @check_required(['webhook_id', 'access_key', 'data'])
+    def create_accepted(self, params):
+        """Create event from a payload queued by accept()
 
-        except Exception as e:
-            if not isinstance(e, ERROR_BASE):
-                e = ERROR_UNKNOWN(message=str(e))
+        The rate limit and re-deliveries are checked by accept(), so they are not checked again.
+        This method is only called by the workers and is not exposed by the API.
+
+        Args:
+            params (dict): {
+                'webhook_id': 'str',
+                'access_key': 'str',
+                'data': 'str'
+            }
+
+        Returns:
+            None
+        """
+
+        webhook_data = self._get_checked_webhook_data(params)
+        self._create_from_payload(webhook_data, params['data'], [])
+
+    @transaction(append_meta={'authorization.scope': 'PROJECT'})
+    @check_required(['webhook_id', 'access_key', 'data_list'])
+    def create_batch(self, params):
+        """Create events from multiple webhook payloads
+
+        Args:
+            params (dict): {
+                'webhook_id': 'str',
+                'access_key': 'str',
+                'data_list': 'list',
+                'idempotency_key': 'str'
+            }
+
+        Returns:
+            results (list)
+        """
+
+        webhook_data = self._get_checked_webhook_data(params)
+        self._check_rate_limit(webhook_data, len(params['data_list']))
+
+        new_indexes, delivery_keys = self._check_deliveries(webhook_data, params, params['data_list'])
+
+        return self._create_from_payloads(webhook_data, params['data_list'], new_indexes, delivery_keys)
+
+    @transaction(append_meta={'authorization.scope': 'PROJECT'})
+    @check_required(['webhook_id', 'access_key', 'data_list'])
+    def create_batch_accepted(self, params):
+        """Create events from multiple webhook payloads queued by accept()
+
+        The rate limit and re-deliveries are checked by accept(), so they are not checked again.
+        This method is only called by the workers and is not exposed by the API.
+
+        Args:
+            params (dict): {
+                'webhook_id': 'str',
+                'access_key': 'str',
+                'data_list': 'list'
+            }
+
+        Returns:
+            results (list)
+        """
+
+        webhook_data = self._get_checked_webhook_data(params)
+        data_list = params['data_list']
+
+        return self._create_from_payloads(webhook_data, data_list, list(range(len(data_list))), [])
+
+    @transaction(append_meta={'authorization.scope': 'PROJECT'})
+    @check_required(['webhook_id', 'access_key'])
+    def accept(self, params):
+        """Accept webhook payloads and queue them for the workers
+
+        Args:
+            params (dict): {
+                'webhook_id': 'str',
+                'access_key': 'str',
+                'data': 'dict',
+                'data_list': 'list',
+                'idempotency_key': 'str'
+            }
+
+        Returns:
+            results (list): SUCCESS for the queued payloads and DUPLICATE for the re-delivered payloads
+        """
+
+        webhook_data = self._get_checked_webhook_data(params)
+
+        # Payloads are counted and checked here, so the workers create them without checking them again
+        task_params = {
+            'webhook_id': params['webhook_id'],
+            'access_key': params['access_key']
+        }
+
+        if 'data_list' in params:
+            method = 'create_batch_accepted'
+            data_count = len(params['data_list'])
+            self._check_rate_limit(webhook_data, data_count)
+            new_indexes, delivery_keys = self._check_deliveries(webhook_data, params, params['data_list'])
+            task_params['data_list'] = [params['data_list'][index] for index in new_indexes]
+        else:
+            method = 'create_accepted'
+            data_count = 1
+            params['data'] = params.get('data') or {}
+            self._check_rate_limit(webhook_data)
+            new_indexes, delivery_keys = self._check_deliveries(webhook_data, params, [params['data']])
+            task_params['data'] = params['data']
+
+        queued_indexes = set(new_indexes)
+        results = [{'index': index, 'status': 'SUCCESS' if index in queued_indexes else 'DUPLICATE'}
+                   for index in range(data_count)]
+
+        if len(new_indexes) == 0:
+            _LOGGER.debug(f'[Event.accept] Drop the re-delivered payloads: {params["webhook_id"]}')
+            return results
 
-            _LOGGER.error(f'[create] Event parsing failed: {e.message}', exc_info=True)
-            response = self._create_error_event(webhook_data['name'], e.message)
+        self._set_transaction_token()
 
-        for event_data in response.get('results', []):
-            # TODO: Check event data using schematics
+        job_mgr: JobManager = self.locator.get_manager('JobManager')
 
-            _LOGGER.debug(f'[Event.create] event_data: {event_data}')
-            self._create_event(event_data, params['data'], webhook_data)
+        try:
+            with ingest_metrics.timer('queue_task'):
+                job_mgr.push_task(
+                    'monitoring_event_ingest',
+                    'EventService',
+                    method,
+                    task_params,
+                    queue_name=config.get_global('EVENT_INGEST_QUEUE', 'monitoring_q')
+                )
+        except Exception as e:
+            self._forget_deliveries(delivery_keys)
+            raise e
+
+        return results
 
     @transaction(append_meta={'authorization.scope': 'PROJECT'})
     @check_required(['event_id', 'domain_id'])
@@ -98,7 +217,18 @@ class EventService(BaseService):
             event_vo (object)
         """
 
-        return self.event_mgr.get_event(params['event_id'], params['domain_id'], params.get('only'))
+        only = params.get('only')
+
+        if only and 'raw_data' in only:
+            only = only + ['domain_id', 'raw_data_id']
+
+        event_vo: Event = self.event_mgr.get_event(params['event_id'], params['domain_id'], only)
+
+        # Raw data is stored separately and loaded only when requested
+        if not only or 'raw_data' in only:
+            self.event_mgr.load_raw_data(event_vo)
+
+        return event_vo
 
     @transaction(append_meta={
         'authorization.scope': 'PROJECT',
@@ -174,6 +304,75 @@ class EventService(BaseService):
             'plugin_options': webhook_vo.plugin_info.options
         }
 
+    def _get_checked_webhook_data(self, params):
+        with ingest_metrics.timer('webhook_data'):
+            webhook_data = self._get_webhook_data(params['webhook_id'])
+
+        self._check_access_key(params['access_key'], webhook_data['access_key'])
+        self._check_webhook_state(webhook_data)
+
+        return webhook_data
+
+    def _create_from_payload(self, webhook_data, data, delivery_keys):
+        try:
+            response = self._parse_event_natively(webhook_data, data)
+
+            if response is None:
+                webhook_plugin_mgr: WebhookPluginManager = self._initialize_webhook_plugin(webhook_data)
+
+                with ingest_metrics.timer('parse_event'):
+                    response = webhook_plugin_mgr.parse_event(webhook_data['plugin_options'], data)
+
+        except Exception as e:
+            response = self._create_error_response(webhook_data, e)
+
+        try:
+            for event_data in response.get('results', []):
+                # TODO: Check event data using schematics
+
+                _LOGGER.debug(f'[Event.create] event_data: {event_data}')
+                self._create_event(event_data, data, webhook_data)
+
+        except Exception as e:
+            self._forget_deliveries(delivery_keys)
+            raise e
+
+    def _create_from_payloads(self, webhook_data, data_list, new_indexes, delivery_keys):
+        """ Creates events from the payloads of new_indexes. Other payloads are reported as DUPLICATE. """
+
+        responses = self._parse_events(webhook_data, [data_list[index] for index in new_indexes])
+        responses = dict(zip(new_indexes, responses))
+
+        results = []
+        events = []
+        for index, data in enumerate(data_list):
+            if index not in responses:
+                results.append({'index': index, 'status': 'DUPLICATE', 'event_count': 0})
+                continue
+
+            response = responses[index]
+
+            if isinstance(response, Exception):
+                response = self._create_error_response(webhook_data, response)
+                results.append({'index': index, 'status': 'FAILURE', 'message': response['results'][0]['description']})
+            else:
+                results.append({'index': index, 'status': 'SUCCESS'})
+
+            event_results = response.get('results', [])
+            results[-1]['event_count'] = len(event_results)
+
+            for event_data in event_results:
+                _LOGGER.debug(f'[Event.create_batch] event_data: {event_data}')
+                events.append((event_data, data))
+
+        try:
+            self._create_events(events, webhook_data)
+        except Exception as e:
+            self._forget_deliveries(delivery_keys)
+            raise e
+
+        return results
+
     @staticmethod
     def _check_access_key(request_access_key, webhook_access_key):
         if request_access_key != webhook_access_key:
@@ -184,28 +383,171 @@ class EventService(BaseService):
         if webhook_data['state'] == 'DISABLED':
             raise ERROR_WEBHOOK_STATE_DISABLED(webhook_id=webhook_data['webhook_id'])
 
-    def _create_event(self, event_data, raw_data, webhook_data):
-        event_data['raw_data'] = copy.deepcopy(raw_data)
-        event_data['occurred_at'] = utils.iso8601_to_datetime(event_data.get('occurred_at'))
-        event_data['webhook_id'] = webhook_data['webhook_id']
-        event_data['project_id'] = webhook_data['project_id']
-        event_data['domain_id'] = webhook_data['domain_id']
-        event_data['severity'] = event_data.get('severity', 'NONE')
+    @staticmethod
+    def _check_rate_limit(webhook_data, count=1):
+        rate_limit_conf = config.get_global('WEBHOOK_RATE_LIMIT', {})
 
-        event_rule_mgr: EventRuleManager = self.locator.get_manager('EventRuleManager')
+        if not rate_limit_conf.get('enabled', False):
+            return
 
-        # Change event data by event rule
-        event_data = event_rule_mgr.change_event_data(event_data, webhook_data['project_id'], webhook_data['domain_id'])
+        webhook_id = webhook_data['webhook_id']
+        limits = []
+
+        if 'webhook' in rate_limit_conf:
+            limits.append((f'webhook:{webhook_id}', rate_limit_conf['webhook']['rate'],
+                           rate_limit_conf['webhook']['burst']))
+
+        if 'domain' in rate_limit_conf:
+            limits.append((f'domain:{webhook_data["domain_id"]}', rate_limit_conf['domain']['rate'],
+                           rate_limit_conf['domain']['burst']))
+
+        # Tokens are taken from both buckets or from neither, so that a shed payload does not spend any of them
+        retry_after = rate_limiter.consume_all(limits, count=count)
+
+        if retry_after > 0:
+            rate_limiter.add_shed_count(webhook_id, count)
+            _LOGGER.debug(f'[_check_rate_limit] Shed {count} payloads: {webhook_id} (retry_after = {retry_after})')
+
+            retry_after = math.ceil(retry_after)
+            raise ERROR_WEBHOOK_RATE_LIMIT_EXCEEDED(webhook_id=webhook_id, retry_after=retry_after,
+                                                    _meta={'retry_after': retry_after})
+
+    @staticmethod
+    def _check_deliveries(webhook_data, params, data_list):
+        """ Marks the payloads as delivered and finds exact re-deliveries of recent payloads
+
+        Returns:
+            new_indexes (list): indexes of the payloads which are not re-deliveries
+            delivery_keys (list): delivery keys marked by this call
+        """
+
+        idempotency_conf = config.get_global('WEBHOOK_IDEMPOTENCY', {})
+
+        if not idempotency_conf.get('enabled', False):
+            return list(range(len(data_list))), []
+
+        webhook_id = webhook_data['webhook_id']
+        idempotency_key = params.get('idempotency_key')
+        new_indexes = []
+        delivery_keys = []
+
+        for index, data in enumerate(data_list):
+            # The idempotency key of a batch request identifies each payload by its index
+            if idempotency_key and 'data_list' in params:
+                delivery_key = idempotency.make_key(webhook_id, data, f'{idempotency_key}:{index}')
+            else:
+                delivery_key = idempotency.make_key(webhook_id, data, idempotency_key)
+
+            if not idempotency.mark(delivery_key, idempotency_conf.get('ttl', 300),
+                                    idempotency_conf.get('max_size', 100000)):
+                new_indexes.append(index)
+                delivery_keys.append(delivery_key)
+
+        duplicate_count = len(data_list) - len(new_indexes)
+
+        ingest_metrics.increment('deliveries', len(data_list))
+
+        if duplicate_count > 0:
+            ingest_metrics.increment('duplicate_deliveries', duplicate_count)
+            _LOGGER.debug(f'[_check_deliveries] Drop {duplicate_count} re-delivered payloads: {webhook_id}')
+
+        return new_indexes, delivery_keys
+
+    @staticmethod
+    def _forget_deliveries(delivery_keys):
+        # A retry of a failed delivery should be processed again
+        for delivery_key in delivery_keys:
+            idempotency.forget(delivery_key)
+
+    def _parse_events(self, webhook_data, data_list):
+        """ Returns the parse response or the raised exception of each payload, in the order of data_list """
+
+        responses = {}
+        plugin_indexes = []
+
+        for index, data in enumerate(data_list):
+            try:
+                response = self._parse_event_natively(webhook_data, data)
+            except Exception as e:
+                response = e
 
-        event_vo: Event = self.event_mgr.get_event_by_key(event_data['event_key'], event_data['domain_id'])
+            if response is None:
+                plugin_indexes.append(index)
+            else:
+                responses[index] = response
 
-        if event_vo and event_vo.alert.state != 'RESOLVED':
+        # The plugin is initialized only when some payloads are not parsed natively
+        if plugin_indexes:
+            try:
+                webhook_plugin_mgr: WebhookPluginManager = self._initialize_webhook_plugin(webhook_data)
+
+                with ingest_metrics.timer('parse_event'):
+                    plugin_responses = webhook_plugin_mgr.parse_events(webhook_data['plugin_options'],
+                                                                       [data_list[index] for index in plugin_indexes])
+            except Exception as e:
+                plugin_responses = [e] * len(plugin_indexes)
+
+            responses.update(zip(plugin_indexes, plugin_responses))
+
+        return [responses[index] for index in range(len(data_list))]
+
+    @staticmethod
+    def _parse_event_natively(webhook_data, data):
+        native_parser = webhook_parser.find_parser(webhook_data['plugin_id'], webhook_data['plugin_options'])
+
+        if native_parser is None:
+            return None
+
+        with ingest_metrics.timer('native_parse'):
+            response = native_parser.parse(webhook_data['plugin_options'], data)
+
+        if response is None:
+            _LOGGER.debug(f'[_parse_event_natively] Unknown payload format for {native_parser.name} parser. '
+                          f'Fall back to the webhook plugin: {webhook_data["webhook_id"]}')
+
+        return response
+
+    def _initialize_webhook_plugin(self, webhook_data):
+        webhook_plugin_mgr: WebhookPluginManager = self.locator.get_manager('WebhookPluginManager')
+
+        with ingest_metrics.timer('plugin_endpoint'):
+            endpoint = webhook_plugin_mgr.get_cached_webhook_plugin_endpoint({
+                'plugin_id': webhook_data['plugin_id'],
+                'version': webhook_data['plugin_version'],
+                'upgrade_mode': webhook_data['plugin_upgrade_mode']
+            }, webhook_data['domain_id'])
+
+        webhook_plugin_mgr.initialize(endpoint)
+        return webhook_plugin_mgr
+
+    def _create_error_response(self, webhook_data, e):
+        # Errors of batched payloads are handled after the calls, so the exception is logged explicitly.
+        error = e if isinstance(e, ERROR_BASE) else ERROR_UNKNOWN(message=str(e))
+
+        _LOGGER.error(f'[_create_error_response] Event parsing failed: {error.message}', exc_info=e)
+        return self._create_error_event(webhook_data['name'], error.message)
+
+    def _create_event(self, event_data, raw_data, webhook_data):
+        event_data = self._prepare_event_data(event_data, raw_data, webhook_data)
+        ingest_metrics.increment('events', event_type=event_data['event_type'])
+
+        alert_info = self._get_alert_info_by_key(event_data['event_key'], event_data['domain_id'])
+
+        if alert_info and alert_info['state'] != 'RESOLVED':
             # Resolve alert when receiving recovery event
             if event_data['event_type'] == 'RECOVERY':
-                self._update_alert_state(event_vo.alert)
-
-            event_data['alert_id'] = event_vo.alert_id
-            event_data['alert'] = event_vo.alert
+                ingest_metrics.increment('recoveries')
+                self._update_alert_state(self._get_alert(alert_info['alert_id'], event_data['domain_id']))
+            else:
+                ingest_metrics.increment('dedup_hits')
+
+            event_data['alert_id'] = alert_info['alert_id']
+            event_data['alert'] = alert_info['alert']
+
+            # Count repeats of the latest event instead of saving them
+            if event_data['event_type'] != 'RECOVERY' and self.event_mgr.get_coalescing_conf()['enabled']:
+                if self._coalesce_event(event_data):
+                    return None
         else:
             # Skip health event
             if event_data['event_type'] == 'RECOVERY':
@@ -220,16 +562,178 @@ class EventService(BaseService):
             event_data['alert_id'] = alert_vo.alert_id
             event_data['alert'] = alert_vo
 
-        self.event_mgr.create_event(event_data)
+        with ingest_metrics.timer('save_event'):
+            self.event_mgr.create_event(event_data)
+
+    def _create_events(self, events, webhook_data):
+        alert_mgr: AlertManager = self.locator.get_manager('AlertManager')
+
+        # event_key -> alert_info of the existing alert
+        alerts_by_key = {}
+        # event_key -> alert_data waiting for bulk insert
+        pending_alerts_by_key = {}
+        new_events_data = []
+        # (event_key, event_type, alert_id) -> latest event_data waiting for bulk insert
+        latest_events_by_key = {}
+        coalescing_enabled = self.event_mgr.get_coalescing_conf()['enabled']
+
+        def _flush_new_alerts():
+            with ingest_metrics.timer('create_alert'):
+                alert_vos = {alert_vo.alert_id: alert_vo
+                             for alert_vo in alert_mgr.create_alerts(list(pending_alerts_by_key.values()))}
+
+            ingest_metrics.increment('alerts_created', len(alert_vos))
+
+            for key, alert_data in pending_alerts_by_key.items():
+                alert_vo = alert_vos[alert_data['alert_id']]
+                alerts_by_key[key] = {
+                    'alert_id': alert_vo.alert_id,
+                    'alert': alert_vo.pk,
+                    'state': alert_vo.state
+                }
+
+            for new_event_data in new_events_data:
+                if isinstance(new_event_data['alert'], dict):
+                    new_event_data['alert'] = alert_vos[new_event_data['alert_id']]
+
+            for alert_vo in alert_vos.values():
+                self._create_notification(alert_vo, 'create_alert_notification')
+
+            pending_alerts_by_key.clear()
+
+        def _add_event(event_data, is_saved_alert):
+            if coalescing_enabled and event_data['event_type'] != 'RECOVERY':
+                coalescing_key = (event_data['event_key'], event_data['event_type'], event_data['alert_id'])
+
+                if coalescing_key in latest_events_by_key:
+                    self.event_mgr.merge_occurrence(latest_events_by_key[coalescing_key], event_data)
+                    ingest_metrics.increment('coalesced_events')
+                    return
+
+                if is_saved_alert and self._coalesce_event(event_data):
+                    return
+
+                latest_events_by_key[coalescing_key] = event_data
+
+            new_events_data.append(event_data)
+
+        for event_data, raw_data in events:
+            event_data = self._prepare_event_data(event_data, raw_data, webhook_data)
+            event_key = event_data['event_key']
+            domain_id = event_data['domain_id']
+            ingest_metrics.increment('events', event_type=event_data['event_type'])
+
+            if event_key in pending_alerts_by_key:
+                if event_data['event_type'] == 'RECOVERY':
+                    # The alert was created in this batch; save it before resolving it.
+                    _flush_new_alerts()
+                else:
+                    ingest_metrics.increment('dedup_hits')
+                    alert_data = pending_alerts_by_key[event_key]
+                    event_data['alert_id'] = alert_data['alert_id']
+                    event_data['alert'] = alert_data
+                    _add_event(event_data, False)
+                    continue
+
+            if event_key not in alerts_by_key:
+                alerts_by_key[event_key] = self._get_alert_info_by_key(event_key, domain_id)
+
+            alert_info = alerts_by_key[event_key]
+
+            if alert_info and alert_info['state'] != 'RESOLVED':
+                # Resolve alert when receiving recovery event
+                if event_data['event_type'] == 'RECOVERY':
+                    ingest_metrics.increment('recoveries')
+                    alert_vo: Alert = self._get_alert(alert_info['alert_id'], domain_id)
+                    self._update_alert_state(alert_vo)
+                    alert_info['state'] = alert_vo.state
+                else:
+                    ingest_metrics.increment('dedup_hits')
+
+                event_data['alert_id'] = alert_info['alert_id']
+                event_data['alert'] = alert_info['alert']
+                _add_event(event_data, True)
+            else:
+                # Skip health event
+                if event_data['event_type'] == 'RECOVERY':
+                    _LOGGER.debug(f'[_create_events] Skip health event: {event_data.get("title")} '
+                                  f'(event_type = RECOVERY)')
+                    continue
+
+                alert_data = self._make_alert_data(event_data)
+                alert_data['alert_id'] = utils.generate_id('alert')
+                pending_alerts_by_key[event_key] = alert_data
+
+                event_data['alert_id'] = alert_data['alert_id']
+                event_data['alert'] = alert_data
+                _add_event(event_data, False)
+
+        if pending_alerts_by_key:
+            _flush_new_alerts()
+
+        with ingest_metrics.timer('save_event'):
+            self.event_mgr.create_events(new_events_data)
+
+    def _get_alert_info_by_key(self, event_key, domain_id):
+        with ingest_metrics.timer('get_alert_by_key'):
+            alert_info = self.event_mgr.get_alert_by_key(event_key, domain_id)
+
+            if alert_info:
+                alert_mgr: AlertManager = self.locator.get_manager('AlertManager')
+                alert_info['state'] = alert_mgr.get_alert_state(alert_info['alert_id'], domain_id)
+
+        # The alert has been deleted
+        if alert_info and not alert_info['state']:
+            return None
+
+        return alert_info
+
+    def _coalesce_event(self, event_data):
+        with ingest_metrics.timer('coalesce_event'):
+            event_id = self.event_mgr.coalesce_event(event_data)
+
+        if event_id:
+            ingest_metrics.increment('coalesced_events')
+
+        return event_id
+
+    def _get_alert(self, alert_id, domain_id):
+        alert_mgr: AlertManager = self.locator.get_manager('AlertManager')
+        return alert_mgr.get_alert(alert_id, domain_id)
+
+    def _prepare_event_data(self, event_data, raw_data, webhook_data):
+        # The raw payload is shared by all events parsed from it and is never modified.
+        event_data['raw_data'] = raw_data
+        event_data['occurred_at'] = utils.iso8601_to_datetime(event_data.get('occurred_at'))
+        event_data['webhook_id'] = webhook_data['webhook_id']
+        event_data['project_id'] = webhook_data['project_id']
+        event_data['domain_id'] = webhook_data['domain_id']
+        event_data['severity'] = event_data.get('severity', 'NONE')
+
+        event_rule_mgr: EventRuleManager = self.locator.get_manager('EventRuleManager')
+
+        # Change event data by event rule
+        with ingest_metrics.timer('change_event_data'):
+            return event_rule_mgr.change_event_data(event_data, webhook_data['project_id'],
+                                                    webhook_data['domain_id'])
 
     def _create_alert(self, event_data):
         alert_mgr: AlertManager = self.locator.get_manager('AlertManager')
 
-        alert_data = copy.deepcopy(event_data)
+        alert_data = self._make_alert_data(event_data)
 
-        if 'urgency' in event_data:
-            alert_data['urgency'] = event_data['urgency']
-        else:
+        with ingest_metrics.timer('create_alert'):
+            alert_vo = alert_mgr.create_alert(alert_data)
+
+        ingest_metrics.increment('alerts_created')
+        self._create_notification(alert_vo, 'create_alert_notification')
+
+        return alert_vo
+
+    def _make_alert_data(self, event_data):
+        alert_data = {key: event_data[key] for key in _ALERT_FIELDS if key in event_data}
+
+        if 'urgency' not in event_data:
             alert_data['urgency'] = self._get_urgency_from_severity(event_data['severity'])
 
         escalation_policy_id, escalation_ttl = self._get_escalation_policy_info(event_data['project_id'],
@@ -247,11 +751,7 @@ class EventService(BaseService):
         if event_data.get('event_type', 'ERROR') == 'ERROR':
             alert_data['state'] = 'ERROR'
 
-        alert_vo = alert_mgr.create_alert(alert_data)
-
-        self._create_notification(alert_vo, 'create_alert_notification')
-
-        return alert_vo
+        return alert_data
 
     @staticmethod
     def _get_urgency_from_severity(severity):
@@ -260,12 +760,13 @@ class EventService(BaseService):
         else:
             return 'LOW'
 
-    @cache.cacheable(key='escalation-policy-info:{domain_id}:{project_id}', expire=300)
     def _get_escalation_policy_info(self, project_id, domain_id):
-        project_alert_config_vo: ProjectAlertConfig = self._get_project_alert_config(project_id, domain_id)
-        escalation_policy_vo: EscalationPolicy = project_alert_config_vo.escalation_policy
+        project_ingest_context: ProjectIngestContext = self._get_project_ingest_context(project_id, domain_id)
+
+        if not project_ingest_context.is_alert_activated:
+            raise ERROR_ALERT_FEATURE_IS_NOT_ACTIVATED(project_id=project_id)
 
-        return escalation_policy_vo.escalation_policy_id, escalation_policy_vo.repeat_count
+        return project_ingest_context.escalation_policy_id, project_ingest_context.escalation_repeat_count
 
     def _update_alert_state(self, alert_vo: Alert):
         if self._is_auto_recovery(alert_vo.project_id, alert_vo.domain_id) and alert_vo.state != 'RESOLVED':
@@ -274,29 +775,37 @@ class EventService(BaseService):
 
             self._create_notification(alert_vo, 'create_resolved_notification')
 
-    @cache.cacheable(key='auto-recovery:{domain_id}:{project_id}', expire=300)
     def _is_auto_recovery(self, project_id, domain_id):
-        project_alert_config_vo: ProjectAlertConfig = self._get_project_alert_config(project_id, domain_id)
-        return project_alert_config_vo.options.recovery_mode == 'AUTO'
+        project_ingest_context: ProjectIngestContext = self._get_project_ingest_context(project_id, domain_id)
+
+        if not project_ingest_context.is_alert_activated:
+            raise ERROR_ALERT_FEATURE_IS_NOT_ACTIVATED(project_id=project_id)
 
-    def _get_project_alert_config(self, project_id, domain_id):
-        project_alert_config_mgr: ProjectAlertConfigManager = self.locator.get_manager('ProjectAlertConfigManager')
-        return project_alert_config_mgr.get_project_alert_config(project_id, domain_id)
+        return project_ingest_context.recovery_mode == 'AUTO'
+
+    def _get_project_ingest_context(self, project_id, domain_id):
+        project_ingest_context_mgr: ProjectIngestContextManager = \
+            self.locator.get_manager('ProjectIngestContextManager')
+
+        with ingest_metrics.timer('project_ingest_context'):
+            return project_ingest_context_mgr.get_project_ingest_context(project_id, domain_id)
 
     def _create_notification(self, alert_vo: Alert, method):
         # if alert_vo.state != 'ERROR':
         self._set_transaction_token()
 
         job_mgr: JobManager = self.locator.get_manager('JobManager')
-        job_mgr.push_task(
-            'monitoring_alert_notification_from_webhook',
-            'JobService',
-            method,
-            {
-                'alert_id': alert_vo.alert_id,
-                'domain_id': alert_vo.domain_id
-            }
-        )
+
+        with ingest_metrics.timer('push_task'):
+            job_mgr.push_task(
+                'monitoring_alert_notification_from_webhook',
+                'JobService',
+                method,
+                {
+                    'alert_id': alert_vo.alert_id,
+                    'domain_id': alert_vo.domain_id
+                }
+            )
 
     def _set_transaction_token(self):
         self.transaction.set_meta('token', config.get_global('TOKEN'))
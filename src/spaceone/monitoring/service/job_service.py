@@ -1,12 +1,14 @@
 import copy
 import logging
 import time
-from typing import List, Union
-from datetime import timedelta, datetime
+from typing import List
+from datetime import datetime
 
 from spaceone.core.service import *
 from spaceone.core.error import *
 from spaceone.core import cache, config, utils
+from spaceone.monitoring.error.identity import *
+from spaceone.monitoring.lib import escalation
 from spaceone.monitoring.model.alert_model import Alert
 from spaceone.monitoring.model.project_alert_config_model import ProjectAlertConfig
 from spaceone.monitoring.model.escalation_policy_model import EscalationPolicy
@@ -21,6 +23,9 @@ from spaceone.monitoring.manager.job_manager import JobManager
 
 _LOGGER = logging.getLogger(__name__)
 
+_NAME_CACHE_EXPIRE = 300
+_NEGATIVE_NAME_CACHE_EXPIRE = 60
+
 
 @authentication_handler
 @authorization_handler
@@ -31,6 +36,8 @@ class JobService(BaseService):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.job_mgr: JobManager = self.locator.get_manager('JobManager')
+        # Names resolved in this task, kept even when the shared cache is not configured
+        self.resolved_names = {}
 
     @transaction(append_meta={'authorization.scope': 'SYSTEM'})
     def create_jobs_by_domain(self, params):
@@ -72,17 +79,22 @@ class JobService(BaseService):
             alert_vos, total_count = self._list_open_alerts(domain_id)
 
             if total_count > 0:
-                job_vo.update({'total_tasks': total_count, 'remained_tasks': total_count})
+                chunk_size = config.get_global('ESCALATION_TASK_CHUNK_SIZE', 500)
+                alert_ids = [alert_vo.alert_id for alert_vo in alert_vos]
+                alert_id_chunks = [alert_ids[i:i + chunk_size] for i in range(0, len(alert_ids), chunk_size)]
+
+                job_vo.update({'total_tasks': len(alert_id_chunks), 'remained_tasks': len(alert_id_chunks)})
 
-                for alert_vo in alert_vos:
-                    _LOGGER.debug(f'[create_job] Push task (JobService.create_notification): {alert_vo.alert_id}')
+                for alert_id_chunk in alert_id_chunks:
+                    _LOGGER.debug(f'[create_job] Push task (JobService.create_alert_notifications): '
+                                  f'{len(alert_id_chunk)} alerts')
                     self.job_mgr.push_task('monitoring_alert_notification_from_scheduler',
                                            'JobService',
-                                           'create_alert_notification',
+                                           'create_alert_notifications',
                                            {
                                                'job_id': job_vo.job_id,
-                                               'alert_id': alert_vo.alert_id,
-                                               'domain_id': alert_vo.domain_id
+                                               'alert_ids': alert_id_chunk,
+                                               'domain_id': domain_id
                                            })
             else:
                 job_vo.delete()
@@ -185,51 +197,177 @@ class JobService(BaseService):
         try:
             alert_mgr: AlertManager = self.locator.get_manager('AlertManager')
 
-            alert_vo: Alert = alert_mgr.get_alert(alert_id, domain_id)
-            project_id = alert_vo.project_id
-            escalation_policy_id = alert_vo.escalation_policy_id
+            errors = self._escalate_alerts(alert_mgr, [alert_id], domain_id)
+            if errors:
+                raise errors[0]
 
-            alert_options = self._get_project_alert_options(project_id, domain_id)
-            rules, finish_condition = self._get_escalation_policy_rules_and_finish_condition(escalation_policy_id,
-                                                                                             domain_id)
-            maintenance_window_state = self._get_project_maintenance_window_state(project_id, domain_id)
+            if job_id:
+                job_vo = self.job_mgr.get_job(job_id, domain_id)
+                job_mgr.decrease_remained_tasks(job_vo)
+        except Exception as e:
+            if job_id:
+                job_vo = self.job_mgr.get_job(job_id, domain_id)
+                job_mgr.change_error_status(job_vo, e)
 
-            # Check Notification Urgency and Finish Condition
-            if not (self._check_notification_options(alert_vo.urgency, alert_id, alert_options)
-                    and self._check_finish_condition(alert_vo.state, alert_id, finish_condition)
-                    and self._check_maintenance_window(project_id, alert_id, maintenance_window_state)):
-                alert_mgr.update_alert_by_vo({'escalation_ttl': 0}, alert_vo)
+            _LOGGER.error(f'[create_notification] Job Error: {e}', exc_info=True)
+            self.transaction.execute_rollback()
 
-            else:
-                # Escalate Alert
-                is_notify, alert_vo = self._check_escalation_time_and_escalate_alert(alert_mgr, alert_vo, rules)
-                if is_notify:
-                    title = f'[Alerting] {alert_vo.title}'
-                    current_rule = rules[alert_vo.escalation_step - 1]
-                    notification_level = current_rule['notification_level']
-
-                    notification_mgr: NotificationManager = self.locator.get_manager('NotificationManager')
-                    message = self._create_message(alert_vo, title, 'ERROR', notification_level=notification_level,
-                                                   has_callback=True, has_short_message=True)
-                    notification_mgr.create_notification(message)
-
-                    for project_id in alert_vo.project_dependencies:
-                        dependent_project_message = copy.deepcopy(message)
-                        dependent_project_message['resource_id'] = project_id
-                        del dependent_project_message['message']['callbacks']
-                        notification_mgr.create_notification(dependent_project_message)
+    @transaction(append_meta={'authorization.scope': 'SYSTEM'})
+    @check_required(['alert_ids', 'domain_id'])
+    def create_alert_notifications(self, params):
+        """ Create alert notifications of an alert chunk
+
+        Args:
+            params (dict): {
+                'job_id': 'str',
+                'alert_ids': 'list',
+                'domain_id': 'str'
+            }
+
+        Returns:
+            None
+        """
+
+        job_id = params.get('job_id')
+        alert_ids = params['alert_ids']
+        domain_id = params['domain_id']
+
+        job_mgr: JobManager = self.locator.get_manager('JobManager')
+
+        try:
+            alert_mgr: AlertManager = self.locator.get_manager('AlertManager')
+
+            errors = self._escalate_alerts(alert_mgr, alert_ids, domain_id)
 
             if job_id:
                 job_vo = self.job_mgr.get_job(job_id, domain_id)
+                if errors:
+                    job_mgr.change_error_status(job_vo, errors[0])
+
                 job_mgr.decrease_remained_tasks(job_vo)
         except Exception as e:
             if job_id:
                 job_vo = self.job_mgr.get_job(job_id, domain_id)
                 job_mgr.change_error_status(job_vo, e)
 
-            _LOGGER.error(f'[create_notification] Job Error: {e}', exc_info=True)
+            _LOGGER.error(f'[create_alert_notifications] Job Error: {e}', exc_info=True)
             self.transaction.execute_rollback()
 
+    def _escalate_alerts(self, alert_mgr: AlertManager, alert_ids: List[str], domain_id):
+        """Escalates alerts from their raw escalation fields with a single bulk update,
+        then sends the notifications of escalated alerts.
+
+        Alerts whose project or escalation policy cannot be looked up are skipped,
+        so that they do not block the other alerts of the chunk.
+
+        Returns:
+            errors (list)
+        """
+
+        rows = alert_mgr.list_alert_escalation_rows(alert_ids, domain_id)
+
+        escalation_policies = {}
+        alert_options = {}
+        maintenance_window_states = {}
+        errors = []
+
+        for escalation_policy_id in set(row['escalation_policy_id'] for row in rows):
+            try:
+                escalation_policies[escalation_policy_id] = \
+                    self._get_escalation_policy_rules_and_finish_condition(escalation_policy_id, domain_id)
+            except Exception as e:
+                _LOGGER.error(f'[_escalate_alerts] Failed to get escalation policy ({escalation_policy_id}): {e}',
+                              exc_info=True)
+                errors.append(e)
+
+        project_ids = set(row['project_id'] for row in rows)
+
+        maintenance_window_mgr: MaintenanceWindowManager = self.locator.get_manager('MaintenanceWindowManager')
+        projects_under_maintenance = maintenance_window_mgr.get_projects_under_maintenance(project_ids, domain_id)
+
+        for project_id in project_ids:
+            maintenance_window_states[project_id] = 'OPEN' if project_id in projects_under_maintenance else 'CLOSED'
+
+            try:
+                alert_options[project_id] = self._get_project_alert_options(project_id, domain_id)
+            except Exception as e:
+                _LOGGER.error(f'[_escalate_alerts] Failed to get project alert options ({project_id}): {e}',
+                              exc_info=True)
+                errors.append(e)
+
+        rows = [row for row in rows
+                if row['escalation_policy_id'] in escalation_policies and row['project_id'] in alert_options]
+
+        decisions = escalation.evaluate_escalations(rows, escalation_policies, alert_options,
+                                                    maintenance_window_states)
+
+        alert_mgr.update_alert_escalations([(decision.row, decision.update) for decision in decisions
+                                            if decision.update])
+
+        notification_levels = {}
+        for decision in decisions:
+            if decision.mute_reason:
+                _LOGGER.debug(f'[_escalate_alerts] Stop notifications. '
+                              f'(reason = {decision.mute_reason}, alert_id = {decision.row["alert_id"]})')
+            elif decision.is_notify:
+                notification_levels[decision.row['alert_id']] = decision.notification_level
+
+        if notification_levels:
+            errors += self._create_alerting_notifications(alert_mgr, notification_levels, domain_id)
+
+        return errors
+
+    def _create_alerting_notifications(self, alert_mgr: AlertManager, notification_levels, domain_id):
+        """Sends the notifications of escalated alerts.
+
+        The escalation of the chunk is already saved, so a failed alert is logged and skipped
+        instead of rolling back the alerts that are already notified.
+
+        Returns:
+            errors (list)
+        """
+
+        notification_mgr: NotificationManager = self.locator.get_manager('NotificationManager')
+        alert_vos, total_count = alert_mgr.list_alerts({
+            'filter': [
+                {
+                    'k': 'alert_id',
+                    'v': list(notification_levels.keys()),
+                    'o': 'in'
+                },
+                {
+                    'k': 'domain_id',
+                    'v': domain_id,
+                    'o': 'eq'
+                }
+            ]
+        })
+
+        alert_vos = list(alert_vos)
+        self._prefetch_names(alert_vos, domain_id)
+
+        errors = []
+        for alert_vo in alert_vos:
+            try:
+                title = f'[Alerting] {alert_vo.title}'
+                notification_level = notification_levels[alert_vo.alert_id]
+
+                message = self._create_message(alert_vo, title, 'ERROR', notification_level=notification_level,
+                                               has_callback=True, has_short_message=True)
+                notification_mgr.create_notification(message)
+
+                for project_id in alert_vo.project_dependencies:
+                    dependent_project_message = copy.deepcopy(message)
+                    dependent_project_message['resource_id'] = project_id
+                    del dependent_project_message['message']['callbacks']
+                    notification_mgr.create_notification(dependent_project_message)
+            except Exception as e:
+                _LOGGER.error(f'[_create_alerting_notifications] Failed to create notification '
+                              f'({alert_vo.alert_id}): {e}', exc_info=True)
+                errors.append(e)
+
+        return errors
+
     def _list_domains_of_alerts(self):
         alert_mgr: AlertManager = self.locator.get_manager('AlertManager')
         query = {
@@ -245,7 +383,8 @@ class JobService(BaseService):
                     'v': 0,
                     'o': 'gt'
                 }
-            ]
+            ],
+            'filter_or': self._make_due_escalation_filter()
         }
 
         response = alert_mgr.stat_alerts(query)
@@ -292,11 +431,29 @@ class JobService(BaseService):
                     'v': 0,
                     'o': 'gt'
                 }
-            ]
+            ],
+            'filter_or': self._make_due_escalation_filter(),
+            'only': ['alert_id']
         }
 
         return alert_mgr.list_alerts(query)
 
+    @staticmethod
+    def _make_due_escalation_filter():
+        # Alerts created before the due escalation index have no escalation time until they are checked once
+        return [
+            {
+                'k': 'next_escalation_at',
+                'v': datetime.utcnow(),
+                'o': 'lte'
+            },
+            {
+                'k': 'next_escalation_at',
+                'v': None,
+                'o': 'eq'
+            }
+        ]
+
     @cache.cacheable(key='project-alert-options:{domain_id}:{project_id}', expire=300)
     def _get_project_alert_options(self, project_id, domain_id):
         project_alert_config_mgr: ProjectAlertConfigManager = self.locator.get_manager('ProjectAlertConfigManager')
@@ -316,33 +473,10 @@ class JobService(BaseService):
 
         return rules, escalation_policy_vo.finish_condition
 
-    @cache.cacheable(key='maintenance-window-state:{domain_id}:{project_id}', expire=60)
     def _get_project_maintenance_window_state(self, project_id, domain_id):
-        query = {
-            'filter': [
-                {
-                    'k': 'projects',
-                    'v': project_id,
-                    'o': 'eq'
-                },
-                {
-                    'k': 'state',
-                    'v': 'OPEN',
-                    'o': 'eq'
-                },
-                {
-                    'k': 'domain_id',
-                    'v': domain_id,
-                    'o': 'eq'
-                }
-            ],
-            'count_only': True
-        }
-
         maintenance_window_mgr: MaintenanceWindowManager = self.locator.get_manager('MaintenanceWindowManager')
-        maintenance_window_vos, total_count = maintenance_window_mgr.list_maintenance_windows(query)
 
-        if total_count > 0:
+        if maintenance_window_mgr.is_project_under_maintenance(project_id, domain_id):
             return 'OPEN'
         else:
             return 'CLOSED'
@@ -351,25 +485,6 @@ class JobService(BaseService):
     def _get_current_escalation_rule(alert_vo: Alert, rules):
         return rules[alert_vo.escalation_step - 1]
 
-    @staticmethod
-    def _check_notification_options(alert_urgency, alert_id, alert_options):
-        if alert_options['notification_urgency'] == 'HIGH' and alert_urgency == 'LOW':
-            _LOGGER.debug(f'[_check_notification_options] Stop notifications. '
-                          f'(notification_urgency = HIGH, alert_urgency = LOW, alert_id = {alert_id})')
-            return False
-        else:
-            return True
-
-    @staticmethod
-    def _check_finish_condition(alert_state, alert_id, finish_condition):
-        if finish_condition == 'ACKNOWLEDGED' and alert_state == 'ACKNOWLEDGED':
-            _LOGGER.debug(f'[_check_finish_condition] Stop notifications. '
-                          f'(finish_condition = ACKNOWLEDGED, alert_state = ACKNOWLEDGED, '
-                          f'alert_id = {alert_id})')
-            return False
-        else:
-            return True
-
     @staticmethod
     def _check_maintenance_window(project_id, alert_id, maintenance_window_state):
         if maintenance_window_state == 'OPEN':
@@ -379,59 +494,6 @@ class JobService(BaseService):
         else:
             return True
 
-    @staticmethod
-    def _check_escalation_time_and_escalate_alert(alert_mgr: AlertManager, alert_vo: Alert, rules):
-        current_step = alert_vo.escalation_step
-        escalation_ttl = alert_vo.escalation_ttl
-        current_rule = rules[current_step - 1]
-        escalate_minutes = current_rule.get('escalate_minutes', 0)
-        escalated_at: Union[datetime, None] = alert_vo.escalated_at
-
-        # First triggered alert
-        if escalated_at is None:
-            escalated_alert_vo = alert_mgr.update_alert_by_vo({'escalated_at': datetime.utcnow()}, alert_vo)
-            return True, escalated_alert_vo
-        else:
-            now = datetime.utcnow()
-
-            # now > escalated_at + escalate_minutes
-            if now > (escalated_at + timedelta(minutes=escalate_minutes)):
-                # When the current step is the maximum
-                if len(rules) == current_step:
-                    if escalation_ttl == 1:
-                        _LOGGER.debug(f'[_check_escalation_time_and_escalate_alert] Max escalation step. '
-                                      f'(alert_id = {alert_vo.alert_id})')
-
-                        escalated_alert_vo = alert_mgr.update_alert_by_vo({
-                            'escalated_at': datetime.utcnow(),
-                            'escalation_ttl': escalation_ttl - 1
-                        }, alert_vo)
-
-                        return False, escalated_alert_vo
-                    else:
-                        _LOGGER.debug(f'[_check_escalation_time_and_escalate_alert] Repeat again from the first step. '
-                                      f'(alert_id = {alert_vo.alert_id})')
-
-                        escalated_alert_vo = alert_mgr.update_alert_by_vo({
-                            'escalated_at': datetime.utcnow(),
-                            'escalation_step': 1,
-                            'escalation_ttl': escalation_ttl - 1
-                        }, alert_vo)
-
-                        return True, escalated_alert_vo
-                else:
-                    _LOGGER.debug(f'[_check_escalation_time_and_escalate_alert] Escalate from {current_step} '
-                                  f'to {current_step + 1} steps. (alert_id = {alert_vo.alert_id})')
-
-                    escalated_alert_vo = alert_mgr.update_alert_by_vo({
-                        'escalated_at': datetime.utcnow(),
-                        'escalation_step': current_step + 1
-                    }, alert_vo)
-
-                    return True, escalated_alert_vo
-            else:
-                return False, alert_vo
-
     def _create_message(self, alert_vo: Alert, title: str, notification_type: str, notification_level='ALL',
                         has_callback=False, has_short_message=False, user_id=None):
 
@@ -544,46 +606,162 @@ class JobService(BaseService):
             'domain_id': domain_id
         }
 
-    @cache.cacheable(key='project-name:{domain_id}:{project_id}', expire=300)
+    def _prefetch_names(self, alert_vos: List[Alert], domain_id):
+        """Resolves the project, user and webhook names used in the messages of alerts
+        with one list query per resource type, instead of one request per name.
+
+        Names that are not found are cached for a shorter time, so that they are not requested for every alert.
+        """
+
+        project_ids = set()
+        user_ids = set()
+        webhook_ids = set()
+
+        for alert_vo in alert_vos:
+            project_ids.add(alert_vo.project_id)
+
+            if alert_vo.assignee:
+                user_ids.add(alert_vo.assignee)
+
+            if alert_vo.triggered_by and alert_vo.triggered_by.startswith('webhook-'):
+                webhook_ids.add(alert_vo.triggered_by)
+            elif alert_vo.triggered_by:
+                user_ids.add(alert_vo.triggered_by)
+
+        project_ids = self._filter_unresolved_names('project-name', project_ids, domain_id)
+        user_ids = self._filter_unresolved_names('user-name', user_ids, domain_id)
+        webhook_ids = self._filter_unresolved_names('triggered-by-name', webhook_ids, domain_id)
+
+        identity_mgr: IdentityManager = self.locator.get_manager('IdentityManager')
+
+        if project_ids:
+            try:
+                response = identity_mgr.list_projects(self._make_in_query('project_id', project_ids), domain_id)
+                project_names = {project_info['project_id']: self._make_project_name(project_info)
+                                 for project_info in response.get('results', [])}
+                self._set_resolved_names('project-name', project_ids, project_names, domain_id)
+            except ERROR_IDENTITY_SERVICE_UNAVAILABLE:
+                pass
+            except Exception as e:
+                _LOGGER.error(f'[_prefetch_names] Failed to list projects: {e}')
+
+        if user_ids:
+            try:
+                response = identity_mgr.list_users(self._make_in_query('user_id', user_ids), domain_id)
+                user_names = {user_info['user_id']: self._make_user_name(user_info)
+                              for user_info in response.get('results', [])}
+                self._set_resolved_names('user-name', user_ids, user_names, domain_id)
+            except ERROR_IDENTITY_SERVICE_UNAVAILABLE:
+                pass
+            except Exception as e:
+                _LOGGER.error(f'[_prefetch_names] Failed to list users: {e}')
+
+        if webhook_ids:
+            webhook_mgr: WebhookManager = self.locator.get_manager('WebhookManager')
+            query = self._make_in_query('webhook_id', webhook_ids)
+            query['filter'].append({'k': 'domain_id', 'v': domain_id, 'o': 'eq'})
+            query['only'] = ['webhook_id', 'name']
+
+            webhook_vos, total_count = webhook_mgr.list_webhooks(query)
+            webhook_names = {webhook_vo.webhook_id: webhook_vo.name for webhook_vo in webhook_vos}
+            self._set_resolved_names('triggered-by-name', webhook_ids, webhook_names, domain_id)
+
     def _get_project_name(self, project_id, domain_id):
-        try:
+        def _resolve():
             identity_mgr: IdentityManager = self.locator.get_manager('IdentityManager')
-            project_info = identity_mgr.get_project(project_id, domain_id)
-            return f'{project_info["project_group_info"]["name"]} > {project_info["name"]}'
-        except Exception as e:
-            _LOGGER.error(f'[_get_project_name] Failed to get project: {e}', exc_info=True)
+            return self._make_project_name(identity_mgr.get_project(project_id, domain_id))
 
-        return project_id
+        return self._get_name('project-name', project_id, domain_id, _resolve)
 
-    @cache.cacheable(key='triggered-by-name:{domain_id}:{triggered_by}', expire=300)
     def _get_triggered_by_name(self, triggered_by, domain_id):
         if triggered_by.startswith('webhook-'):
-            try:
+            def _resolve():
                 webhook_mgr: WebhookManager = self.locator.get_manager('WebhookManager')
-                webhook_info = webhook_mgr.get_webhook(triggered_by, domain_id)
+                return webhook_mgr.get_webhook(triggered_by, domain_id)['name']
 
-                return webhook_info['name']
-            except Exception as e:
-                _LOGGER.error(f'[_get_triggered_by_name] Failed to get webhook: {e}', exc_info=True)
+            return self._get_name('triggered-by-name', triggered_by, domain_id, _resolve)
         else:
             return self._get_user_name(triggered_by, domain_id)
 
-        return triggered_by
-
-    @cache.cacheable(key='user-name:{domain_id}:{user_id}', expire=300)
     def _get_user_name(self, user_id, domain_id):
-        try:
+        def _resolve():
             identity_mgr: IdentityManager = self.locator.get_manager('IdentityManager')
-            user_info = identity_mgr.get_user(user_id, domain_id)
+            return self._make_user_name(identity_mgr.get_user(user_id, domain_id))
 
-            if len(user_info.get('name', '').strip()) == 0:
-                return user_info['user_id']
-            else:
-                return f'{user_info["user_id"]} ({user_info["name"]})'
+        return self._get_name('user-name', user_id, domain_id, _resolve)
+
+    def _get_name(self, name_type, resource_id, domain_id, resolve):
+        """Returns the cached name of a resource, or its id when it cannot be resolved."""
+
+        name = self._get_cached_name(name_type, resource_id, domain_id)
+        if name is not None:
+            return name
+
+        try:
+            name = resolve()
+            expire = _NAME_CACHE_EXPIRE
+        except ERROR_IDENTITY_SERVICE_UNAVAILABLE:
+            # Not cached, so that the name is resolved again when the identity service is back
+            return resource_id
         except Exception as e:
-            _LOGGER.error(f'[_get_user_name] Failed to get user: {e}', exc_info=True)
+            _LOGGER.error(f'[_get_name] Failed to get {name_type} ({resource_id}): {e}')
+            name = resource_id
+            expire = _NEGATIVE_NAME_CACHE_EXPIRE
+
+        self._set_cached_name(name_type, resource_id, domain_id, name, expire)
+        return name
 
-        return user_id
+    def _filter_unresolved_names(self, name_type, resource_ids, domain_id):
+        return [resource_id for resource_id in resource_ids
+                if self._get_cached_name(name_type, resource_id, domain_id) is None]
+
+    def _set_resolved_names(self, name_type, resource_ids, names, domain_id):
+        for resource_id in resource_ids:
+            if resource_id in names:
+                self._set_cached_name(name_type, resource_id, domain_id, names[resource_id], _NAME_CACHE_EXPIRE)
+            else:
+                self._set_cached_name(name_type, resource_id, domain_id, resource_id, _NEGATIVE_NAME_CACHE_EXPIRE)
+
+    def _get_cached_name(self, name_type, resource_id, domain_id):
+        cache_key = f'{name_type}:{domain_id}:{resource_id}'
+
+        if cache_key in self.resolved_names:
+            return self.resolved_names[cache_key]
+
+        if cache.is_set():
+            return cache.get(cache_key)
+
+        return None
+
+    def _set_cached_name(self, name_type, resource_id, domain_id, name, expire):
+        cache_key = f'{name_type}:{domain_id}:{resource_id}'
+        self.resolved_names[cache_key] = name
+
+        if cache.is_set():
+            cache.set(cache_key, name, expire=expire)
+
+    @staticmethod
+    def _make_in_query(key, values):
+        return {
+            'filter': [
+                {
+                    'k': key,
+                    'v': list(values),
+                    'o': 'in'
+                }
+            ]
+        }
+
+    @staticmethod
+    def _make_project_name(project_info):
+        return f'{project_info["project_group_info"]["name"]} > {project_info["name"]}'
+
+    @staticmethod
+    def _make_user_name(user_info):
+        if len(user_info.get('name', '').strip()) == 0:
+            return user_info['user_id']
+        else:
+            return f'{user_info["user_id"]} ({user_info["name"]})'
 
     @staticmethod
     def _generate_access_key():
@@ -1,10 +1,7 @@
 import logging
-from typing import List
-from datetime import datetime
 
 from spaceone.core.service import *
 from spaceone.monitoring.error.maintenance_window import *
-from spaceone.monitoring.model.maintenance_window_model import MaintenanceWindow
 from spaceone.monitoring.manager.project_alert_config_manager import ProjectAlertConfigManager
 from spaceone.monitoring.manager.maintenance_window_manager import MaintenanceWindowManager
 
@@ -191,14 +188,7 @@ class MaintenanceWindowService(BaseService):
         Returns:
             None
         """
-        maintenance_window_mgr: MaintenanceWindowManager = self.locator.get_manager('MaintenanceWindowManager')
-        maintenance_window_vos: List[MaintenanceWindow] = maintenance_window_mgr.list_open_maintenance_windows()
+        closed_count = self.maintenance_window_mgr.close_expired_maintenance_windows()
 
-        current_time = datetime.utcnow()
-
-        for maintenance_window_vo in maintenance_window_vos:
-            if current_time > maintenance_window_vo.end_time:
-                _LOGGER.debug(f'[close_maintenance_window] Close out of time maintenance window '
-                              f'({maintenance_window_vo.maintenance_window_id}): '
-                              f'Current Time({current_time}) > End Time({maintenance_window_vo.end_time})')
-                maintenance_window_mgr.update_maintenance_window_by_vo({'state': 'CLOSED'}, maintenance_window_vo)
+        if closed_count > 0:
+            _LOGGER.debug(f'[close_maintenance_window] Close {closed_count} out of time maintenance windows')
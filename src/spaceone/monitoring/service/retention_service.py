@@ -0,0 +1,88 @@
+import logging
+from datetime import datetime, timedelta
+
+from spaceone.core.service import *
+from spaceone.monitoring.manager.alert_manager import AlertManager
+from spaceone.monitoring.manager.archive_manager import ArchiveManager
+from spaceone.monitoring.manager.job_manager import JobManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@authentication_handler
+@authorization_handler
+@mutation_handler
+@event_handler
+class RetentionService(BaseService):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.archive_mgr: ArchiveManager = self.locator.get_manager('ArchiveManager')
+
+    @transaction(append_meta={'authorization.scope': 'SYSTEM'})
+    def create_archive_tasks(self, params):
+        """ Create archive tasks by domain
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None
+        """
+
+        if not self.archive_mgr.retention_conf['enabled']:
+            return None
+
+        job_mgr: JobManager = self.locator.get_manager('JobManager')
+
+        for domain_id in self._list_domains_of_alerts():
+            _LOGGER.debug(f'[create_archive_tasks] Push task (RetentionService.archive): {domain_id}')
+            job_mgr.push_task('monitoring_event_retention', 'RetentionService', 'archive', {'domain_id': domain_id})
+
+    @transaction(append_meta={'authorization.scope': 'SYSTEM'})
+    @check_required(['domain_id'])
+    def archive(self, params):
+        """ Archive and delete expired alerts, events and notes of the domain
+
+        Args:
+            params (dict): {
+                'domain_id': 'str'
+            }
+
+        Returns:
+            archived_count (dict)
+        """
+
+        domain_id = params['domain_id']
+        retention_days = self.archive_mgr.get_retention_days(domain_id)
+        expired_at = datetime.utcnow() - timedelta(days=retention_days)
+
+        archived_count = self.archive_mgr.archive_expired_data(domain_id, expired_at)
+        _LOGGER.debug(f'[archive] {domain_id}: {archived_count} (retention_days = {retention_days})')
+
+        return archived_count
+
+    @transaction(append_meta={'authorization.scope': 'SYSTEM'})
+    @check_required(['file_path'])
+    def restore(self, params):
+        """ Restore an archive file
+
+        Args:
+            params (dict): {
+                'file_path': 'str'
+            }
+
+        Returns:
+            restored_count (int)
+        """
+
+        return self.archive_mgr.restore_archive(params['file_path'])
+
+    def _list_domains_of_alerts(self):
+        alert_mgr: AlertManager = self.locator.get_manager('AlertManager')
+        query = {
+            'distinct': 'domain_id'
+        }
+
+        response = alert_mgr.stat_alerts(query)
+        return response.get('results', [])
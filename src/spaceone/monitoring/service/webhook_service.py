@@ -1,7 +1,7 @@
 import logging
 
 from spaceone.core.service import *
-from spaceone.core import utils
+from spaceone.core import utils, cache
 
 from spaceone.monitoring.error import *
 from spaceone.monitoring.model.webhook_model import Webhook
@@ -228,6 +228,54 @@ class WebhookService(BaseService):
 
         return self.webhook_mgr.update_webhook_by_vo(params, webhook_vo)
 
+    @transaction(append_meta={'authorization.scope': 'SYSTEM'})
+    def refresh_plugin_endpoints(self, params):
+        """ Refresh cached plugin endpoints of enabled webhooks and apply AUTO upgrades
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None
+        """
+
+        query = {
+            'filter': [
+                {
+                    'k': 'state',
+                    'v': 'ENABLED',
+                    'o': 'eq'
+                }
+            ]
+        }
+
+        webhook_vos, total_count = self.webhook_mgr.list_webhooks(query)
+
+        endpoints = {}
+        for webhook_vo in webhook_vos:
+            plugin_info = webhook_vo.plugin_info.to_dict()
+            plugin_key = (plugin_info['plugin_id'], plugin_info.get('version'), plugin_info.get('upgrade_mode'),
+                          webhook_vo.domain_id)
+
+            try:
+                if plugin_key not in endpoints:
+                    endpoints[plugin_key] = self.webhook_plugin_mgr.refresh_webhook_plugin_endpoint(
+                        plugin_info, webhook_vo.domain_id)
+
+                endpoint, updated_version = endpoints[plugin_key]
+
+                if updated_version:
+                    _LOGGER.debug(f'[refresh_plugin_endpoints] upgrade plugin version: {webhook_vo.webhook_id} '
+                                  f'({plugin_info.get("version")} -> {updated_version})')
+                    self.webhook_plugin_mgr.upgrade_webhook_plugin_version(webhook_vo, endpoint, updated_version)
+
+                    if cache.is_set():
+                        cache.delete(f'webhook-data:{webhook_vo.webhook_id}')
+
+            except Exception as e:
+                _LOGGER.error(f'[refresh_plugin_endpoints] Failed to refresh plugin endpoint: '
+                              f'{webhook_vo.webhook_id} ({e})', exc_info=True)
+
     @transaction(append_meta={'authorization.scope': 'PROJECT'})
     @check_required(['webhook_id', 'domain_id'])
     def get(self, params):
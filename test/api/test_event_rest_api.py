@@ -0,0 +1,142 @@
+import asyncio
+import unittest
+from unittest.mock import patch, Mock
+
+from starlette.requests import Request
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core.error import *
+from spaceone.monitoring.error.webhook import ERROR_WEBHOOK_RATE_LIMIT_EXCEEDED
+from spaceone.monitoring.interface.rest.v1 import event
+
+
+def _make_request(chunks, content_type='application/json'):
+    messages = [{'type': 'http.request', 'body': chunk, 'more_body': True} for chunk in chunks]
+    messages.append({'type': 'http.request', 'body': b'', 'more_body': False})
+
+    async def _receive():
+        return messages.pop(0)
+
+    scope = {
+        'type': 'http',
+        'method': 'POST',
+        'path': '/',
+        'headers': [(b'content-type', content_type.encode('utf-8'))]
+    }
+
+    return Request(scope, _receive)
+
+
+class TestEventRestAPI(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        super().setUpClass()
+
+    def test_parse_batch_body(self):
+        request = _make_request([b'[{"key": "a"}, null]'])
+        self.assertEqual([{'key': 'a'}, {}], asyncio.run(event._parse_batch_body(request)))
+
+        request = _make_request([b'{"key": "a"}\n\n{"key": "b"}\n'], 'application/x-ndjson')
+        self.assertEqual([{'key': 'a'}, {'key': 'b'}], asyncio.run(event._parse_batch_body(request)))
+
+    def test_parse_batch_body_with_invalid_items(self):
+        for body in [b'[{"key": "a"}, 1, "x"]', b'[[]]', b'{"key": "a"}']:
+            request = _make_request([body])
+            self.assertRaises(ERROR_UNKNOWN, asyncio.run, event._parse_batch_body(request))
+
+        request = _make_request([b'{"key": "a"}\n[]\n'], 'application/x-ndjson')
+
+        with self.assertRaisesRegex(ERROR_UNKNOWN, 'Line 2'):
+            asyncio.run(event._parse_batch_body(request))
+
+    def test_iter_ndjson_batches(self):
+        # Lines are split across chunks and the last line has no line break
+        request = _make_request([b'{"key": "a"}\n{"ke', b'y": "b"}\n\n[1]\n', b'{"key": "c"}\n{"key": "d"}'],
+                                'application/x-ndjson')
+
+        async def _collect():
+            return [batch async for batch in event._iter_ndjson_batches(request, 2, 1024)]
+
+        batches = asyncio.run(_collect())
+
+        # Blank lines are skipped but still counted, and invalid lines are kept as None
+        self.assertEqual([
+            [(1, {'key': 'a'}), (2, {'key': 'b'})],
+            [(4, None), (5, {'key': 'c'})],
+            [(6, {'key': 'd'})]
+        ], batches)
+
+    def test_iter_ndjson_batches_with_long_line(self):
+        request = _make_request([b'{"key": "a"}\n', b'{"key": "' + b'a' * 100], 'application/x-ndjson')
+
+        async def _collect():
+            return [batch async for batch in event._iter_ndjson_batches(request, 10, 64)]
+
+        with self.assertRaisesRegex(ERROR_UNKNOWN, 'Line 2'):
+            asyncio.run(_collect())
+
+    def test_ingest_stream_batch(self):
+        event_service = Mock()
+        event_service.create_batch.side_effect = lambda params: [
+            {'index': index, 'status': 'SUCCESS', 'event_count': 1} for index in range(len(params['data_list']))
+        ]
+
+        batch = [(1, {'key': 'a'}), (2, None), (3, {'key': 'b'})]
+        results = asyncio.run(event._ingest_stream_batch(event_service, 'webhook-1', 'access-key', batch, 60))
+
+        # Invalid lines are reported by their index in the batch
+        self.assertEqual(['SUCCESS', 'FAILURE', 'SUCCESS'], [result['status'] for result in results])
+        self.assertEqual([0, 1, 2], [result['index'] for result in results])
+        self.assertEqual([{'key': 'a'}, {'key': 'b'}], event_service.create_batch.call_args[0][0]['data_list'])
+
+    def test_create_events_with_retry(self):
+        waits = []
+
+        async def _sleep(seconds):
+            waits.append(seconds)
+
+        rate_limit_error = ERROR_WEBHOOK_RATE_LIMIT_EXCEEDED(webhook_id='webhook-1', retry_after=2,
+                                                             _meta={'retry_after': 2})
+        event_service = Mock()
+        event_service.create_batch.side_effect = [rate_limit_error, rate_limit_error,
+                                                  [{'index': 0, 'status': 'SUCCESS'}]]
+
+        params = {'webhook_id': 'webhook-1', 'access_key': 'access-key', 'data_list': [{}]}
+
+        with patch.object(event.asyncio, 'sleep', new=_sleep):
+            results = asyncio.run(event._create_events_with_retry(event_service, params, 10))
+
+            self.assertEqual('SUCCESS', results[0]['status'])
+            self.assertEqual(3, event_service.create_batch.call_count)
+            self.assertEqual([2, 2], waits)
+
+            # Give up when the next wait exceeds max_retry_wait
+            waits.clear()
+            event_service.create_batch.side_effect = rate_limit_error
+
+            self.assertRaises(ERROR_WEBHOOK_RATE_LIMIT_EXCEEDED, asyncio.run,
+                              event._create_events_with_retry(event_service, params, 5))
+            self.assertEqual([2, 2], waits)
+
+    def test_create_events_with_retry_in_async_mode(self):
+        event_service = Mock()
+        event_service.accept.return_value = [{'index': 0, 'status': 'SUCCESS'}, {'index': 1, 'status': 'DUPLICATE'}]
+
+        config.set_global(EVENT_INGEST_MODE='ASYNC')
+
+        try:
+            params = {'webhook_id': 'webhook-1', 'access_key': 'access-key', 'data_list': [{}, {}]}
+            results = asyncio.run(event._create_events_with_retry(event_service, params, 10))
+        finally:
+            config.set_global(EVENT_INGEST_MODE='SYNC')
+
+        self.assertEqual(['SUCCESS', 'DUPLICATE'], [result['status'] for result in results])
+        event_service.create_batch.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,91 @@
+"""Memory allocated while building event and alert data for one large webhook payload.
+
+Compares the former deep copies (raw_data per event, event_data per alert) with the current
+shared raw payload and projected alert fields.
+
+Usage: python -m test.benchmark.benchmark_event_ingest_memory
+"""
+
+import copy
+import json
+import tracemalloc
+
+from spaceone.monitoring.service.event_service import _ALERT_FIELDS
+
+PAYLOAD_SIZE = 500 * 1024
+ALERT_COUNT = 50
+
+
+def _make_payload():
+    alerts = []
+    i = 0
+    while len(json.dumps({'alerts': alerts})) < PAYLOAD_SIZE:
+        alerts.append({
+            'status': 'firing',
+            'labels': {'alertname': f'HighCPU-{i}', 'instance': f'node-{i}:9100', 'severity': 'critical'},
+            'annotations': {'summary': 'CPU usage is too high', 'description': 'x' * 1000},
+            'startsAt': '2021-06-01T00:00:00Z',
+            'generatorURL': f'http://prometheus:9090/graph?g0.expr=cpu{i}'
+        })
+        i += 1
+
+    return {'receiver': 'spaceone', 'status': 'firing', 'alerts': alerts}
+
+
+def _parse_event(payload):
+    return [
+        {
+            'event_key': alert['labels']['alertname'],
+            'event_type': 'ALERT',
+            'title': alert['annotations']['summary'],
+            'description': alert['annotations']['description'],
+            'severity': 'CRITICAL',
+            'additional_info': dict(alert['labels']),
+            'webhook_id': 'webhook-1234',
+            'project_id': 'project-1234',
+            'domain_id': 'domain-1234'
+        } for alert in payload['alerts'][:ALERT_COUNT]
+    ]
+
+
+def _build_with_deepcopy(payload):
+    results = []
+    for event_data in _parse_event(payload):
+        event_data['raw_data'] = copy.deepcopy(payload)
+        alert_data = copy.deepcopy(event_data)
+        results.append((event_data, alert_data))
+
+    return results
+
+
+def _build_with_projection(payload):
+    results = []
+    for event_data in _parse_event(payload):
+        event_data['raw_data'] = payload
+        alert_data = {key: event_data[key] for key in _ALERT_FIELDS if key in event_data}
+        results.append((event_data, alert_data))
+
+    return results
+
+
+def _measure(func, payload):
+    tracemalloc.start()
+    results = func(payload)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return current, peak
+
+
+def main():
+    payload = _make_payload()
+    print(f'payload: {len(json.dumps(payload)) / 1024:.0f} KB, {ALERT_COUNT} events')
+    print(f'{"":>12} {"retained (KB)":>14} {"peak (KB)":>10}')
+
+    for name, func in [('deepcopy', _build_with_deepcopy), ('projection', _build_with_projection)]:
+        current, peak = _measure(func, payload)
+        print(f'{name:>12} {current / 1024:>14.0f} {peak / 1024:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
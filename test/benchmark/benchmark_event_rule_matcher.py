@@ -0,0 +1,74 @@
+"""Latency of global event rule matching: linear evaluation vs. IndexedEventRuleSet.
+
+Usage: python -m test.benchmark.benchmark_event_rule_matcher
+"""
+
+import random
+import timeit
+
+from spaceone.monitoring.lib.event_rule_matcher import EventRuleMatcher, IndexedEventRuleSet
+
+RULE_COUNTS = [10, 100, 1000]
+EVENT_COUNT = 100
+REPEAT = 5
+
+_WORDS = ['cpu', 'memory', 'disk', 'network', 'latency', 'error', 'timeout', 'database', 'queue', 'storage']
+_REGIONS = ['ap-northeast-2', 'us-east-1', 'us-west-2', 'eu-central-1']
+
+
+def _make_event_rules(rule_count):
+    event_rules = []
+    for i in range(rule_count):
+        word = f'{random.choice(_WORDS)}-{i}'
+        conditions = [
+            {'key': 'title', 'value': word, 'operator': 'contain'},
+            {'key': 'additional_info.region', 'value': random.choice(_REGIONS), 'operator': 'eq'}
+        ]
+
+        event_rules.append(EventRuleMatcher(f'er-{i}', i + 1, conditions, random.choice(['ALL', 'ANY']),
+                                            {'change_urgency': 'LOW'}, False))
+
+    return event_rules
+
+
+def _make_events(rule_count):
+    return [
+        {
+            'title': f'{random.choice(_WORDS)}-{random.randrange(rule_count)} is too HIGH',
+            'description': 'threshold exceeded',
+            'additional_info': {'region': random.choice(_REGIONS)}
+        } for _ in range(EVENT_COUNT)
+    ]
+
+
+def _linear_match(event_rules, events):
+    for event_data in events:
+        [i for i, event_rule in enumerate(event_rules) if event_rule.match(event_data)]
+
+
+def _indexed_match(event_rule_set, events):
+    for event_data in events:
+        event_rule_set.match(event_data)
+
+
+def main():
+    random.seed(0)
+    print(f'{"rules":>6} {"linear (us/event)":>18} {"indexed (us/event)":>19}')
+
+    for rule_count in RULE_COUNTS:
+        event_rules = _make_event_rules(rule_count)
+        event_rule_set = IndexedEventRuleSet(event_rules)
+        events = _make_events(rule_count)
+
+        for event_data in events:
+            expected = [i for i, event_rule in enumerate(event_rules) if event_rule.match(event_data)]
+            assert expected == event_rule_set.match(event_data)
+
+        linear = min(timeit.repeat(lambda: _linear_match(event_rules, events), number=1, repeat=REPEAT))
+        indexed = min(timeit.repeat(lambda: _indexed_match(event_rule_set, events), number=1, repeat=REPEAT))
+
+        print(f'{rule_count:>6} {linear / EVENT_COUNT * 1e6:>18.1f} {indexed / EVENT_COUNT * 1e6:>19.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,365 @@
+"""Webhook ingest throughput of EventService.create and the REST create_event route.
+
+Payloads are parsed by a local stub webhook plugin (test.benchmark.stub_webhook_plugin) and
+events are saved to mongomock or a local mongod. Each scenario reports events/sec, p50/p99
+request latency and Mongo operations per event. Results are saved as JSON, and a previous
+result file can be given as the baseline to compare commits.
+
+Usage:
+    python -m test.benchmark.benchmark_webhook_ingest
+    python -m test.benchmark.benchmark_webhook_ingest --mongo mongodb://localhost:27017 --latency 5 \\
+        --output ingest.json --baseline ingest-previous.json
+    python -m test.benchmark.benchmark_webhook_ingest --config '{"EVENT_WRITE_BUFFER": {"enabled": true}}'
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import subprocess
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from pymongo import monitoring
+
+from spaceone.core import config
+from spaceone.core.locator import Locator
+from spaceone.monitoring.lib import event_write_buffer
+from spaceone.monitoring.manager.job_manager import JobManager
+from spaceone.monitoring.manager.webhook_plugin_manager import WebhookPluginManager
+from spaceone.monitoring.model.alert_model import Alert
+from spaceone.monitoring.model.escalation_policy_model import EscalationPolicy
+from spaceone.monitoring.model.event_model import Event
+from spaceone.monitoring.model.event_raw_data_model import EventRawData
+from spaceone.monitoring.model.project_alert_config_model import ProjectAlertConfig
+from spaceone.monitoring.model.webhook_model import Webhook
+from test.benchmark import stub_webhook_plugin
+
+SCENARIOS = ['new_alert_storm', 'duplicate_flood', 'recovery_storm', 'large_payload']
+TARGETS = ['service', 'rest']
+
+DOMAIN_ID = 'domain-benchmark'
+PROJECT_ID = 'project-benchmark'
+ACCESS_KEY = 'benchmark-access-key'
+
+# Mongo commands that are not part of the ingest path
+_IGNORED_COMMANDS = ['createIndexes', 'listIndexes', 'endSessions', 'hello', 'ismaster', 'isMaster', 'ping',
+                     'buildInfo', 'saslStart', 'saslContinue']
+
+# mongomock collection methods counted as one Mongo operation
+_MONGOMOCK_OPERATIONS = ['find', 'find_one', 'insert_one', 'insert_many', 'update_one', 'update_many',
+                         'replace_one', 'delete_one', 'delete_many', 'find_one_and_update', 'count_documents',
+                         'aggregate', 'bulk_write', 'distinct', 'estimated_document_count']
+
+
+class MongoOpsCounter(monitoring.CommandListener):
+
+    def __init__(self):
+        self.count = 0
+
+    def started(self, event):
+        if event.command_name not in _IGNORED_COMMANDS:
+            self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+    def patch_mongomock(self):
+        """mongomock does not publish command events, so its collection methods are counted instead."""
+        for name in _MONGOMOCK_OPERATIONS:
+            method = getattr(mongomock.collection.Collection, name, None)
+
+            if method:
+                setattr(mongomock.collection.Collection, name, self._make_counted_method(method))
+
+    def _make_counted_method(self, method):
+        def wrapped(*args, **kwargs):
+            self.count += 1
+            return method(*args, **kwargs)
+
+        return wrapped
+
+
+def _make_payloads(scenario, request_count, events_per_request, payload_kb, run_id):
+    """Returns (setup payloads, measured payloads)"""
+
+    def _events(key_func, event_type='ALERT'):
+        return [{'key': key_func(i), 'type': event_type} for i in range(events_per_request)]
+
+    if scenario == 'new_alert_storm':
+        return [], [{'events': _events(lambda i: f'storm-{run_id}-{n}-{i}')} for n in range(request_count)]
+
+    elif scenario == 'duplicate_flood':
+        return [], [{'events': _events(lambda i: f'flood-{run_id}-{i}')} for n in range(request_count)]
+
+    elif scenario == 'recovery_storm':
+        setup_payloads = [{'events': _events(lambda i: f'recovery-{run_id}-{n}-{i}')} for n in range(request_count)]
+        payloads = [{'events': _events(lambda i: f'recovery-{run_id}-{n}-{i}', 'RECOVERY')}
+                    for n in range(request_count)]
+        return setup_payloads, payloads
+
+    elif scenario == 'large_payload':
+        # Random text so that compression does not hide the payload size
+        return [], [{
+            'events': _events(lambda i: f'large-{run_id}-{n}-{i}'),
+            'message': os.urandom(payload_kb * 512).hex()
+        } for n in range(request_count)]
+
+    else:
+        raise ValueError(f'Unknown scenario: {scenario}')
+
+
+def _create_webhook(plugin_id):
+    escalation_policy_vo = EscalationPolicy.create({'name': 'benchmark', 'repeat_count': 0, 'scope': 'GLOBAL',
+                                                    'domain_id': DOMAIN_ID})
+    project_alert_config_vo = ProjectAlertConfig.create({
+        'project_id': PROJECT_ID,
+        'options': {'recovery_mode': 'AUTO'},
+        'escalation_policy': escalation_policy_vo,
+        'escalation_policy_id': escalation_policy_vo.escalation_policy_id,
+        'domain_id': DOMAIN_ID
+    })
+
+    return Webhook.create({
+        'name': 'benchmark',
+        'access_key': ACCESS_KEY,
+        'plugin_info': {'plugin_id': plugin_id, 'version': '1.0', 'upgrade_mode': 'MANUAL'},
+        'project': project_alert_config_vo,
+        'project_id': PROJECT_ID,
+        'domain_id': DOMAIN_ID
+    })
+
+
+def _reset_events():
+    for model in [Event, Alert, EventRawData]:
+        model.objects.filter(domain_id=DOMAIN_ID).delete()
+
+
+def _make_service_sender(webhook_id):
+    locator = Locator()
+
+    def _send(payload):
+        event_service = locator.get_service('EventService')
+        event_service.create({'webhook_id': webhook_id, 'access_key': ACCESS_KEY, 'data': payload})
+
+    return _send
+
+
+def _make_rest_sender(webhook_id):
+    from spaceone.monitoring.interface.rest.router import app
+
+    path = f'/monitoring/v1/webhook/{webhook_id}/{ACCESS_KEY}/events'
+    loop = asyncio.new_event_loop()
+
+    async def _post(body):
+        messages = [{'type': 'http.request', 'body': body, 'more_body': False}]
+        response = {}
+
+        async def receive():
+            return messages.pop(0) if messages else {'type': 'http.disconnect'}
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                response['status'] = message['status']
+
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'POST',
+            'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'root_path': '', 'query_string': b'',
+            'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())],
+            'client': ('127.0.0.1', 0), 'server': ('127.0.0.1', 8000)
+        }
+
+        await app(scope, receive, send)
+        return response.get('status')
+
+    def _send(payload):
+        status = loop.run_until_complete(_post(json.dumps(payload).encode('utf-8')))
+
+        if status != 200:
+            raise Exception(f'REST create_event failed: HTTP {status}')
+
+    return _send
+
+
+def _percentile(values, percent):
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, int(round(percent / 100 * len(values))) - 1))
+    return values[index]
+
+
+def _run_scenario(send, scenario, ops_counter, args, run_id):
+    setup_payloads, payloads = _make_payloads(scenario, args.requests, args.events, args.payload_kb, run_id)
+
+    _reset_events()
+
+    for payload in setup_payloads:
+        send(payload)
+
+    event_write_buffer.flush()
+
+    event_count_before = Event.objects.filter(domain_id=DOMAIN_ID).count()
+    ops_count_before = ops_counter.count
+    latencies = []
+
+    started_at = time.perf_counter()
+
+    for payload in payloads:
+        request_started_at = time.perf_counter()
+        send(payload)
+        latencies.append((time.perf_counter() - request_started_at) * 1000)
+
+    # Events queued in the write-behind buffer are part of the run
+    event_write_buffer.flush()
+
+    elapsed = time.perf_counter() - started_at
+
+    # The event count query itself is excluded
+    ops_count = ops_counter.count - ops_count_before
+    event_count = Event.objects.filter(domain_id=DOMAIN_ID).count() - event_count_before
+    received_count = sum(len(payload['events']) for payload in payloads)
+
+    return {
+        'requests': len(payloads),
+        'events': received_count,
+        'saved_events': event_count,
+        'events_per_sec': round(received_count / elapsed, 1),
+        'p50_ms': round(_percentile(latencies, 50), 2),
+        'p99_ms': round(_percentile(latencies, 99), 2),
+        'mongo_ops_per_event': round(ops_count / received_count, 2)
+    }
+
+
+def _get_git_commit():
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL)
+        return commit.decode().strip()
+    except Exception:
+        return None
+
+
+def _print_results(results, baseline):
+    baseline_results = (baseline or {}).get('results', {})
+
+    print(f'{"target":>8} {"scenario":>16} {"events/s":>10} {"p50 (ms)":>9} {"p99 (ms)":>9} {"ops/event":>10}'
+          f'{"   vs baseline" if baseline else ""}')
+
+    for target, scenario_results in results.items():
+        for scenario, result in scenario_results.items():
+            line = (f'{target:>8} {scenario:>16} {result["events_per_sec"]:>10.1f} {result["p50_ms"]:>9.2f} '
+                    f'{result["p99_ms"]:>9.2f} {result["mongo_ops_per_event"]:>10.2f}')
+
+            baseline_result = baseline_results.get(target, {}).get(scenario)
+            if baseline_result:
+                ratio = result['events_per_sec'] / baseline_result['events_per_sec']
+                line += (f'   {ratio:.2f}x events/s '
+                         f'(baseline {baseline_result["mongo_ops_per_event"]:.2f} ops/event)')
+
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mongo', default='mongomock://localhost', help='mongomock://localhost or mongod URI')
+    parser.add_argument('--latency', type=float, default=0, help='parse latency of the stub plugin (ms)')
+    parser.add_argument('--requests', type=int, default=200, help='requests per scenario')
+    parser.add_argument('--events', type=int, default=1, help='events per request')
+    parser.add_argument('--payload-kb', type=int, default=256, help='payload size of large_payload (KB)')
+    parser.add_argument('--scenarios', nargs='+', default=SCENARIOS, choices=SCENARIOS)
+    parser.add_argument('--targets', nargs='+', default=TARGETS, choices=TARGETS)
+    parser.add_argument('--output', help='JSON result file')
+    parser.add_argument('--baseline', help='JSON result file of a previous run to compare with')
+    parser.add_argument('--config', type=json.loads, default={},
+                        help='global config to override as a JSON object, e.g. \'{"EVENT_WRITE_BUFFER": {...}}\'')
+    parser.add_argument('--verbose', action='store_true', help='show the service logs')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        # Request and debug logs of every event would dominate the measurement
+        logging.disable(logging.INFO)
+
+    ops_counter = MongoOpsCounter()
+    monitoring.register(ops_counter)
+
+    config.init_conf(package='spaceone.monitoring')
+    config.set_service_config()
+
+    if args.mongo.startswith('mongomock://'):
+        config.set_global(MOCK_MODE=True)
+        connect('benchmark', host=args.mongo)
+        ops_counter.patch_mongomock()
+    else:
+        config.set_global(DATABASES={'default': {'db': 'monitoring_benchmark', 'host': args.mongo}})
+
+    config.set_global(**args.config)
+
+    server, port, event_servicer = stub_webhook_plugin.start_server(latency_ms=args.latency)
+    webhook_vo = _create_webhook('plugin-benchmark')
+
+    results = {}
+
+    try:
+        with patch.object(WebhookPluginManager, 'get_cached_webhook_plugin_endpoint',
+                          return_value=f'grpc://127.0.0.1:{port}'), \
+                patch.object(JobManager, 'push_task', return_value=None):
+
+            for target in args.targets:
+                if target == 'service':
+                    send = _make_service_sender(webhook_vo.webhook_id)
+                else:
+                    send = _make_rest_sender(webhook_vo.webhook_id)
+
+                results[target] = {}
+                for scenario in args.scenarios:
+                    results[target][scenario] = _run_scenario(send, scenario, ops_counter, args,
+                                                              run_id=f'{target}-{int(time.time())}')
+    finally:
+        _reset_events()
+        webhook_vo.delete()
+        ProjectAlertConfig.objects.filter(domain_id=DOMAIN_ID).delete()
+        EscalationPolicy.objects.filter(domain_id=DOMAIN_ID).delete()
+        server.stop(0)
+
+        if args.mongo.startswith('mongomock://'):
+            disconnect()
+
+    report = {
+        'commit': _get_git_commit(),
+        'created_at': datetime.utcnow().isoformat(),
+        'python': platform.python_version(),
+        'options': {
+            'mongo': 'mongomock' if args.mongo.startswith('mongomock://') else 'mongod',
+            'latency_ms': args.latency,
+            'requests': args.requests,
+            'events_per_request': args.events,
+            'payload_kb': args.payload_kb,
+            'config': args.config
+        },
+        'results': results
+    }
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    print(f'commit: {report["commit"]}, mongo: {report["options"]["mongo"]}, plugin latency: {args.latency} ms, '
+          f'plugin calls: {event_servicer.call_count}')
+    _print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+        print(f'saved: {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Local stand-in for a webhook plugin with a configurable parse latency.
+
+Payloads have the form {'events': [{'key': 'str', 'type': 'ALERT | RECOVERY', 'severity': 'str'}]}.
+Each item becomes one event of the parse response.
+
+Usage: python -m test.benchmark.stub_webhook_plugin --port 50051 --latency 5
+"""
+
+import argparse
+import time
+from concurrent import futures
+
+import grpc
+from google.protobuf.empty_pb2 import Empty
+from google.protobuf.json_format import MessageToDict
+from grpc_reflection.v1alpha import reflection
+from spaceone.api.monitoring.plugin import event_pb2, event_pb2_grpc, webhook_pb2, webhook_pb2_grpc
+
+
+class StubEventServicer(event_pb2_grpc.EventServicer):
+
+    def __init__(self, latency_ms=0):
+        self.latency_ms = latency_ms
+        self.call_count = 0
+
+    def parse(self, request, context):
+        self.call_count += 1
+
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+        data = MessageToDict(request.data, preserving_proto_field_name=True)
+
+        return event_pb2.EventsInfo(results=[
+            event_pb2.EventInfo(
+                event_key=event['key'],
+                event_type=event.get('type', 'ALERT'),
+                title=f'{event["key"]} is too HIGH',
+                description=event.get('description', ''),
+                severity=event.get('severity', 'CRITICAL'),
+                rule='stub-rule'
+            ) for event in data.get('events', [])
+        ])
+
+
+class StubWebhookServicer(webhook_pb2_grpc.WebhookServicer):
+
+    def init(self, request, context):
+        return webhook_pb2.WebhookPluginInfo()
+
+    def verify(self, request, context):
+        return Empty()
+
+
+def start_server(port=0, latency_ms=0, max_workers=32):
+    """Starts the stub plugin and returns (server, bound port, event servicer)."""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+    event_servicer = StubEventServicer(latency_ms)
+
+    event_pb2_grpc.add_EventServicer_to_server(event_servicer, server)
+    webhook_pb2_grpc.add_WebhookServicer_to_server(StubWebhookServicer(), server)
+
+    # The plugin client finds the services through server reflection
+    reflection.enable_server_reflection([
+        event_pb2.DESCRIPTOR.services_by_name['Event'].full_name,
+        webhook_pb2.DESCRIPTOR.services_by_name['Webhook'].full_name,
+        reflection.SERVICE_NAME
+    ], server)
+
+    bound_port = server.add_insecure_port(f'127.0.0.1:{port}')
+    server.start()
+
+    return server, bound_port, event_servicer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=50051)
+    parser.add_argument('--latency', type=float, default=0, help='parse latency (ms)')
+    args = parser.parse_args()
+
+    server, port, _ = start_server(args.port, args.latency)
+    print(f'stub webhook plugin: 127.0.0.1:{port} (latency = {args.latency} ms)')
+    server.wait_for_termination()
+
+
+if __name__ == '__main__':
+    main()
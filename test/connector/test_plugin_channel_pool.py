@@ -0,0 +1,121 @@
+import threading
+import unittest
+from unittest.mock import patch, Mock
+
+import grpc
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core.error import *
+from spaceone.monitoring.connector import plugin_channel_pool
+
+
+class TestPluginChannelPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True)
+        super().setUpClass()
+
+    def setUp(self) -> None:
+        self.created_count = plugin_channel_pool.get_stats()['created']
+
+    def tearDown(self, *args) -> None:
+        plugin_channel_pool.close_all()
+        config.set_global(PLUGIN_CHANNEL_POOL={})
+
+    @patch.object(plugin_channel_pool, '_GRPCClient')
+    @patch.object(grpc, 'insecure_channel')
+    def test_get_client(self, mock_insecure_channel, mock_grpc_client):
+        mock_insecure_channel.side_effect = lambda *args, **kwargs: Mock()
+        mock_grpc_client.side_effect = lambda *args, **kwargs: Mock()
+
+        client = plugin_channel_pool.get_client('plugin-a:50051', version='plugin')
+
+        for i in range(3):
+            self.assertIs(client, plugin_channel_pool.get_client('plugin-a:50051', version='plugin'))
+
+        plugin_channel_pool.get_client('plugin-b:50051', version='plugin')
+
+        self.assertEqual(2, mock_insecure_channel.call_count)
+
+        options = dict(mock_insecure_channel.call_args[1]['options'])
+        self.assertEqual(30000, options['grpc.keepalive_time_ms'])
+
+        stats = plugin_channel_pool.get_stats()
+        self.assertEqual(2, stats['open_channels'])
+        self.assertEqual(3, stats['endpoints']['plugin-a:50051']['reuse_count'])
+
+    @patch.object(plugin_channel_pool, '_GRPCClient')
+    @patch.object(grpc, 'insecure_channel')
+    def test_reconnect_and_evict(self, mock_insecure_channel, mock_grpc_client):
+        mock_insecure_channel.side_effect = lambda *args, **kwargs: Mock()
+        mock_grpc_client.side_effect = lambda *args, **kwargs: Mock()
+
+        client = plugin_channel_pool.get_client('plugin-a:50051')
+
+        # Channel connectivity callback reports a failure
+        pooled_channel = plugin_channel_pool._POOL['plugin-a:50051']
+        pooled_channel._on_state_changed(grpc.ChannelConnectivity.TRANSIENT_FAILURE)
+
+        reconnected_client = plugin_channel_pool.get_client('plugin-a:50051')
+        self.assertIsNot(client, reconnected_client)
+        pooled_channel.channel.close.assert_called_once()
+
+        config.set_global(PLUGIN_CHANNEL_POOL={'idle_timeout': -1})
+        plugin_channel_pool.get_client('plugin-b:50051')
+
+        stats = plugin_channel_pool.get_stats()
+        self.assertEqual(['plugin-b:50051'], list(stats['endpoints'].keys()))
+
+    @patch.object(plugin_channel_pool, '_GRPCClient')
+    @patch.object(grpc, 'insecure_channel')
+    def test_get_client_with_slow_endpoint(self, mock_insecure_channel, mock_grpc_client):
+        mock_insecure_channel.side_effect = lambda *args, **kwargs: Mock()
+        is_connecting = threading.Event()
+        is_released = threading.Event()
+
+        def _create_client(channel, client_opts, endpoint):
+            if endpoint == 'plugin-slow:50051':
+                is_connecting.set()
+                is_released.wait(5)
+
+            return Mock()
+
+        mock_grpc_client.side_effect = _create_client
+
+        slow_clients = []
+        slow_threads = [
+            threading.Thread(target=lambda: slow_clients.append(plugin_channel_pool.get_client('plugin-slow:50051')))
+            for i in range(2)
+        ]
+
+        for thread in slow_threads:
+            thread.start()
+
+        self.assertTrue(is_connecting.wait(5))
+
+        # Other endpoints are not blocked while the slow endpoint is connecting
+        thread = threading.Thread(target=plugin_channel_pool.get_client, args=('plugin-a:50051',))
+        thread.start()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+
+        is_released.set()
+        for thread in slow_threads:
+            thread.join(5)
+
+        # The slow endpoint is connected only once
+        self.assertIs(slow_clients[0], slow_clients[1])
+        self.assertEqual(2, plugin_channel_pool.get_stats()['created'] - self.created_count)
+
+    @patch.object(plugin_channel_pool, '_GRPCClient', side_effect=Exception('failed to connect to all addresses'))
+    @patch.object(grpc, 'insecure_channel')
+    def test_get_client_with_connection_error(self, *args):
+        self.assertRaises(ERROR_GRPC_CONNECTION, plugin_channel_pool.get_client, 'plugin-a:50051')
+        self.assertEqual(0, plugin_channel_pool.get_stats()['open_channels'])
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
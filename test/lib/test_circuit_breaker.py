@@ -0,0 +1,34 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.monitoring.lib import circuit_breaker
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def tearDown(self, *args) -> None:
+        circuit_breaker.reset()
+
+    def test_circuit_breaker(self):
+        for i in range(2):
+            self.assertFalse(circuit_breaker.record_failure('identity', failure_threshold=3))
+
+        self.assertTrue(circuit_breaker.allow('identity', reset_timeout=30))
+        self.assertTrue(circuit_breaker.record_failure('identity', failure_threshold=3))
+        self.assertEqual('OPEN', circuit_breaker.get_state('identity'))
+        self.assertFalse(circuit_breaker.allow('identity', reset_timeout=30))
+
+        # One trial call is let through after the reset timeout
+        with patch.object(time, 'time', return_value=time.time() + 31):
+            self.assertTrue(circuit_breaker.allow('identity', reset_timeout=30))
+            self.assertFalse(circuit_breaker.allow('identity', reset_timeout=30))
+
+        circuit_breaker.record_success('identity')
+        self.assertEqual('CLOSED', circuit_breaker.get_state('identity'))
+        self.assertTrue(circuit_breaker.allow('identity', reset_timeout=30))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
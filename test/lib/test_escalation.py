@@ -0,0 +1,98 @@
+import unittest
+from datetime import datetime, timedelta
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.monitoring.lib import escalation
+
+
+class TestEscalation(unittest.TestCase):
+
+    def setUp(self):
+        self.now = datetime(2021, 6, 1, 12, 0, 0)
+        self.rules = [
+            {'notification_level': 'LV1', 'escalate_minutes': 10},
+            {'notification_level': 'ALL', 'escalate_minutes': 30}
+        ]
+        self.escalation_policies = {'ep-1': (self.rules, 'RESOLVED')}
+        self.alert_options = {'project-1': {'notification_urgency': 'ALL'}}
+        self.maintenance_window_states = {'project-1': 'CLOSED'}
+
+    def _make_row(self, **kwargs):
+        row = {
+            'alert_id': 'alert-1',
+            'project_id': 'project-1',
+            'escalation_policy_id': 'ep-1',
+            'state': 'TRIGGERED',
+            'urgency': 'HIGH',
+            'is_snoozed': False,
+            'escalation_step': 1,
+            'escalation_ttl': 2,
+            'escalated_at': None
+        }
+        row.update(kwargs)
+        return row
+
+    def _evaluate(self, row):
+        return escalation.evaluate_escalations([row], self.escalation_policies, self.alert_options,
+                                               self.maintenance_window_states, now=self.now)[0]
+
+    def test_evaluate_escalations(self):
+        # First triggered alert
+        decision = self._evaluate(self._make_row())
+        self.assertTrue(decision.is_notify)
+        self.assertEqual('LV1', decision.notification_level)
+        self.assertEqual(self.now + timedelta(minutes=10), decision.update['next_escalation_at'])
+
+        # Escalate to the next step
+        decision = self._evaluate(self._make_row(escalated_at=self.now - timedelta(minutes=11)))
+        self.assertTrue(decision.is_notify)
+        self.assertEqual('ALL', decision.notification_level)
+        self.assertEqual(2, decision.update['escalation_step'])
+        self.assertEqual(self.now + timedelta(minutes=30), decision.update['next_escalation_at'])
+
+        # Repeat again from the first step
+        decision = self._evaluate(self._make_row(escalation_step=2, escalated_at=self.now - timedelta(minutes=31)))
+        self.assertTrue(decision.is_notify)
+        self.assertEqual(1, decision.update['escalation_step'])
+        self.assertEqual(1, decision.update['escalation_ttl'])
+
+        # Max escalation step
+        decision = self._evaluate(self._make_row(escalation_step=2, escalation_ttl=1,
+                                                 escalated_at=self.now - timedelta(minutes=31)))
+        self.assertFalse(decision.is_notify)
+        self.assertEqual(0, decision.update['escalation_ttl'])
+        self.assertIsNone(decision.update['next_escalation_at'])
+
+        # Not due yet
+        escalated_at = self.now - timedelta(minutes=5)
+        decision = self._evaluate(self._make_row(escalated_at=escalated_at))
+        self.assertFalse(decision.is_notify)
+        self.assertEqual({'next_escalation_at': escalated_at + timedelta(minutes=10)}, decision.update)
+
+        decision = self._evaluate(self._make_row(escalated_at=escalated_at,
+                                                 next_escalation_at=escalated_at + timedelta(minutes=10)))
+        self.assertIsNone(decision.update)
+
+    def test_evaluate_muted_escalations(self):
+        snoozed_end_time = self.now + timedelta(hours=1)
+        decision = self._evaluate(self._make_row(is_snoozed=True, snoozed_end_time=snoozed_end_time))
+        self.assertEqual('SNOOZED', decision.mute_reason)
+        self.assertEqual({'next_escalation_at': snoozed_end_time}, decision.update)
+
+        self.escalation_policies['ep-1'] = (self.rules, 'ACKNOWLEDGED')
+        decision = self._evaluate(self._make_row(state='ACKNOWLEDGED'))
+        self.assertEqual('FINISH_CONDITION', decision.mute_reason)
+        self.assertEqual(0, decision.update['escalation_ttl'])
+
+        self.alert_options['project-1']['notification_urgency'] = 'HIGH'
+        decision = self._evaluate(self._make_row(urgency='LOW'))
+        self.assertEqual('NOTIFICATION_URGENCY', decision.mute_reason)
+        self.assertFalse(decision.is_notify)
+
+        self.maintenance_window_states['project-1'] = 'OPEN'
+        decision = self._evaluate(self._make_row())
+        self.assertEqual('MAINTENANCE_WINDOW', decision.mute_reason)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
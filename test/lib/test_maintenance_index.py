@@ -0,0 +1,46 @@
+import unittest
+from datetime import datetime, timedelta
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.monitoring.lib.maintenance_index import MaintenanceIndex
+
+
+class TestMaintenanceIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.now = datetime(2021, 6, 1, 12, 0, 0)
+
+    def _hours(self, hours):
+        return self.now + timedelta(hours=hours)
+
+    def test_is_under_maintenance(self):
+        maintenance_index = MaintenanceIndex()
+        maintenance_index.add('mw-1', ['project-1', 'project-2'], self._hours(0), self._hours(2))
+        maintenance_index.add('mw-2', ['project-1'], self._hours(1), self._hours(3))
+        maintenance_index.add('mw-3', ['project-1'], self._hours(5), self._hours(6))
+
+        # Overlapping windows are merged and end times are exclusive
+        self.assertFalse(maintenance_index.is_under_maintenance('project-1', self._hours(-1)))
+        self.assertTrue(maintenance_index.is_under_maintenance('project-1', self._hours(0)))
+        self.assertTrue(maintenance_index.is_under_maintenance('project-1', self._hours(2.5)))
+        self.assertFalse(maintenance_index.is_under_maintenance('project-1', self._hours(3)))
+        self.assertTrue(maintenance_index.is_under_maintenance('project-1', self._hours(5.5)))
+        self.assertFalse(maintenance_index.is_under_maintenance('project-3', self._hours(1)))
+
+        self.assertEqual({'project-1', 'project-2'},
+                         maintenance_index.get_projects_under_maintenance(['project-1', 'project-2', 'project-3'],
+                                                                          self._hours(1)))
+
+        # Updated and closed windows
+        maintenance_index.add('mw-2', ['project-2'], self._hours(1), self._hours(3))
+        self.assertFalse(maintenance_index.is_under_maintenance('project-1', self._hours(2.5)))
+        self.assertTrue(maintenance_index.is_under_maintenance('project-2', self._hours(2.5)))
+
+        maintenance_index.remove('mw-1')
+        maintenance_index.remove('mw-2')
+        self.assertFalse(maintenance_index.is_under_maintenance('project-1', self._hours(1)))
+        self.assertFalse(maintenance_index.is_under_maintenance('project-2', self._hours(1)))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,50 @@
+import unittest
+from unittest.mock import patch
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.monitoring.lib import rate_limiter
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def tearDown(self, *args) -> None:
+        rate_limiter.reset()
+
+    def test_consume(self):
+        self.assertEqual(0, rate_limiter.consume('webhook:1', rate=0.01, burst=2))
+        self.assertEqual(0, rate_limiter.consume('webhook:1', rate=0.01, burst=2))
+        self.assertGreater(rate_limiter.consume('webhook:1', rate=0.01, burst=2), 0)
+
+    @patch.object(rate_limiter.time, 'time')
+    def test_consume_large_batch(self, mock_time):
+        mock_time.return_value = 1000.0
+
+        # A batch larger than the bucket is admitted when the bucket is full, but is charged in full
+        self.assertEqual(0, rate_limiter.consume('webhook:1', rate=1, burst=2, count=5))
+
+        # The bucket is refilled to 2 tokens, but the debt of the batch is not paid off yet
+        mock_time.return_value = 1002.0
+        self.assertEqual(3, rate_limiter.consume('webhook:1', rate=1, burst=2, count=5))
+        self.assertEqual(2, rate_limiter.consume('webhook:1', rate=1, burst=2, count=1))
+
+        mock_time.return_value = 1005.0
+        self.assertEqual(0, rate_limiter.consume('webhook:1', rate=1, burst=2, count=5))
+
+    def test_consume_without_limit(self):
+        for i in range(10):
+            self.assertEqual(0, rate_limiter.consume('webhook:1', rate=0, burst=2))
+            self.assertEqual(0, rate_limiter.consume('webhook:2', rate=1, burst=0))
+
+    def test_consume_all(self):
+        limits = [('webhook:1', 0.01, 10), ('domain:1', 0.01, 2)]
+
+        self.assertEqual(0, rate_limiter.consume_all(limits, count=2))
+        self.assertGreater(rate_limiter.consume_all(limits, count=1), 0)
+
+        # Tokens of the webhook are not spent by the shed payload
+        self.assertEqual(0, rate_limiter.consume('webhook:1', rate=0.01, burst=10, count=8))
+        self.assertGreater(rate_limiter.consume('webhook:1', rate=0.01, burst=10, count=1), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
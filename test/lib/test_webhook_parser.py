@@ -0,0 +1,166 @@
+import json
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.monitoring.lib import webhook_parser
+
+
+class TestWebhookParser(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True)
+        super().setUpClass()
+
+    def tearDown(self, *args) -> None:
+        config.set_global(WEBHOOK_NATIVE_PARSERS={})
+
+    def test_find_parser(self):
+        self.assertIsNone(webhook_parser.find_parser('plugin-1234', {}))
+
+        config.set_global(WEBHOOK_NATIVE_PARSERS={'plugin-1234': 'alertmanager'})
+        self.assertEqual('alertmanager', webhook_parser.find_parser('plugin-1234', {}).name)
+
+        # The webhook option takes precedence
+        self.assertEqual('grafana', webhook_parser.find_parser('plugin-1234', {'native_parser': 'grafana'}).name)
+        self.assertIsNone(webhook_parser.find_parser('plugin-1234', {'native_parser': 'unknown'}))
+
+    def test_parse_alertmanager(self):
+        data = {
+            'version': '4',
+            'groupKey': '{}:{alertname="HighCPU"}',
+            'status': 'firing',
+            'alerts': [
+                {
+                    'status': 'firing',
+                    'labels': {'alertname': 'HighCPU', 'severity': 'critical', 'instance': 'node-1:9100'},
+                    'annotations': {'summary': 'CPU is too high', 'description': 'cpu > 90%'},
+                    'startsAt': '2021-03-04T10:00:00.123456789Z',
+                    'endsAt': '0001-01-01T00:00:00Z',
+                    'fingerprint': 'c6a1f2e3'
+                },
+                {
+                    'status': 'resolved',
+                    'labels': {'alertname': 'DiskFull'},
+                    'annotations': {},
+                    'startsAt': '2021-03-04T09:00:00Z',
+                    'endsAt': '2021-03-04T10:00:00Z'
+                }
+            ]
+        }
+
+        results = webhook_parser.get_parser('alertmanager').parse({}, data)['results']
+
+        self.assertEqual('c6a1f2e3', results[0]['event_key'])
+        self.assertEqual('ALERT', results[0]['event_type'])
+        self.assertEqual('CRITICAL', results[0]['severity'])
+        self.assertEqual('CPU is too high', results[0]['title'])
+        self.assertEqual('node-1:9100', results[0]['resource']['resource_id'])
+        self.assertEqual('2021-03-04T10:00:00.123456789Z', results[0]['occurred_at'])
+
+        self.assertEqual('RECOVERY', results[1]['event_type'])
+        self.assertEqual('DiskFull', results[1]['title'])
+        self.assertEqual('2021-03-04T10:00:00Z', results[1]['occurred_at'])
+
+        self.assertIsNone(webhook_parser.get_parser('alertmanager').parse({}, {'message': 'unknown'}))
+
+    def test_parse_grafana(self):
+        parser = webhook_parser.get_parser('grafana')
+
+        data = {
+            'title': '[Alerting] Memory usage',
+            'ruleId': 1,
+            'ruleName': 'Memory usage',
+            'ruleUrl': 'http://grafana/d/abc',
+            'state': 'alerting',
+            'message': 'Memory usage is too high',
+            'evalMatches': [{'metric': 'mem', 'value': 95, 'tags': {}}],
+            'tags': {'severity': 'warning'}
+        }
+
+        alert_event = parser.parse({}, data)['results'][0]
+        self.assertEqual('ALERT', alert_event['event_type'])
+        self.assertEqual('WARNING', alert_event['severity'])
+        self.assertEqual('mem=95', alert_event['additional_info']['eval_matches'])
+
+        data['state'] = 'ok'
+        recovery_event = parser.parse({}, data)['results'][0]
+        self.assertEqual('RECOVERY', recovery_event['event_type'])
+        self.assertEqual(alert_event['event_key'], recovery_event['event_key'])
+
+        data['state'] = 'paused'
+        self.assertEqual([], parser.parse({}, data)['results'])
+
+        unified_data = {
+            'receiver': 'spaceone',
+            'status': 'firing',
+            'orgId': 1,
+            'alerts': [
+                {
+                    'status': 'firing',
+                    'labels': {'alertname': 'Memory usage'},
+                    'annotations': {},
+                    'startsAt': '2021-03-04T10:00:00Z',
+                    'fingerprint': 'a1b2',
+                    'panelURL': 'http://grafana/d/abc?viewPanel=1'
+                }
+            ]
+        }
+
+        unified_event = parser.parse({}, unified_data)['results'][0]
+        self.assertEqual('a1b2', unified_event['event_key'])
+        self.assertEqual('http://grafana/d/abc?viewPanel=1', unified_event['additional_info']['panel_url'])
+
+    def test_parse_aws_sns(self):
+        parser = webhook_parser.get_parser('aws_sns')
+
+        message = {
+            'AlarmName': 'High CPU',
+            'AWSAccountId': '123456789012',
+            'NewStateValue': 'ALARM',
+            'NewStateReason': 'Threshold Crossed',
+            'StateChangeTime': '2021-03-04T10:00:00.000+0000',
+            'Region': 'Asia Pacific (Seoul)',
+            'AlarmArn': 'arn:aws:cloudwatch:ap-northeast-2:123456789012:alarm:High CPU',
+            'Trigger': {
+                'MetricName': 'CPUUtilization',
+                'Namespace': 'AWS/EC2',
+                'Dimensions': [{'name': 'InstanceId', 'value': 'i-1234'}]
+            }
+        }
+
+        data = {
+            'Type': 'Notification',
+            'MessageId': 'message-1',
+            'TopicArn': 'arn:aws:sns:ap-northeast-2:123456789012:alarms',
+            'Subject': 'ALARM: "High CPU"',
+            'Message': json.dumps(message),
+            'Timestamp': '2021-03-04T10:00:01.000Z'
+        }
+
+        alarm_event = parser.parse({}, data)['results'][0]
+        self.assertEqual('ALERT', alarm_event['event_type'])
+        self.assertEqual('High CPU', alarm_event['title'])
+        self.assertEqual('i-1234', alarm_event['resource']['resource_id'])
+        self.assertEqual('i-1234', alarm_event['additional_info']['dimension.InstanceId'])
+
+        message['NewStateValue'] = 'OK'
+        data['Message'] = json.dumps(message)
+        recovery_event = parser.parse({}, data)['results'][0]
+        self.assertEqual('RECOVERY', recovery_event['event_type'])
+        self.assertEqual(alarm_event['event_key'], recovery_event['event_key'])
+
+        data['Message'] = 'Plain text message'
+        notification_event = parser.parse({}, data)['results'][0]
+        self.assertEqual('INFO', notification_event['severity'])
+        self.assertEqual('Plain text message', notification_event['description'])
+
+        # Subscription confirmations are handled by the plugin
+        self.assertIsNone(parser.parse({}, {'Type': 'SubscriptionConfirmation', 'TopicArn': data['TopicArn']}))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
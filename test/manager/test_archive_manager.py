@@ -0,0 +1,112 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.transaction import Transaction
+from spaceone.monitoring.manager.archive_manager import ArchiveManager
+from spaceone.monitoring.manager.event_manager import EventManager
+from spaceone.monitoring.model.alert_model import Alert
+from spaceone.monitoring.model.event_model import Event
+from spaceone.monitoring.model.event_raw_data_model import EventRawData
+from spaceone.monitoring.model.note_model import Note
+
+
+class TestArchiveManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True)
+        connect('test', host='mongomock://localhost')
+
+        cls.domain_id = utils.generate_id('domain')
+        cls.transaction = Transaction({
+            'service': 'monitoring',
+            'api_class': 'Event'
+        })
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self):
+        self.archive_path = tempfile.mkdtemp()
+        config.set_global(EVENT_RETENTION={'enabled': True, 'archive_path': self.archive_path, 'chunk_size': 2})
+
+    def tearDown(self, *args) -> None:
+        print()
+        print('(tearDown) ==> Delete all alerts, events and notes')
+        Alert.objects.filter().delete()
+        Event.objects.filter().delete()
+        EventRawData.objects.filter().delete()
+        Note.objects.filter().delete()
+        shutil.rmtree(self.archive_path)
+        config.set_global(EVENT_RETENTION={})
+
+    def _create_alert(self, state, created_at, event_count):
+        alert_vo = Alert.create({'title': 'CPU Utilization is too HIGH', 'state': state, 'domain_id': self.domain_id})
+        Alert.objects.filter(pk=alert_vo.pk).update(created_at=created_at)
+
+        event_mgr = EventManager(transaction=self.transaction)
+        for i in range(event_count):
+            event_vo = event_mgr.create_event({
+                'event_key': 'cpu',
+                'title': 'CPU Utilization is too HIGH',
+                'raw_data': {'alert_id': alert_vo.alert_id, 'index': i},
+                'alert': alert_vo,
+                'alert_id': alert_vo.alert_id,
+                'domain_id': self.domain_id
+            })
+            Event.objects.filter(pk=event_vo.pk).update(created_at=created_at)
+
+        Note.create({'note': 'checked', 'alert': alert_vo, 'alert_id': alert_vo.alert_id, 'domain_id': self.domain_id})
+        return alert_vo
+
+    def test_archive_expired_data(self):
+        expired_datetime = datetime.utcnow() - timedelta(days=100)
+        resolved_alert_vo = self._create_alert('RESOLVED', expired_datetime, 3)
+        open_alert_vo = self._create_alert('TRIGGERED', expired_datetime, 2)
+        new_alert_vo = self._create_alert('RESOLVED', datetime.utcnow(), 1)
+
+        self.transaction.method = 'archive'
+        archive_mgr = ArchiveManager(transaction=self.transaction)
+        expired_at = datetime.utcnow() - timedelta(days=archive_mgr.get_retention_days(self.domain_id))
+        archived_count = archive_mgr.archive_expired_data(self.domain_id, expired_at)
+
+        self.assertEqual({'event': 5, 'alert': 1, 'note': 1}, {key: archived_count[key]
+                                                               for key in ['event', 'alert', 'note']})
+        self.assertEqual({open_alert_vo.alert_id, new_alert_vo.alert_id},
+                         set(Alert.objects.filter().distinct('alert_id')))
+        self.assertEqual(1, Event.objects.filter().count())
+        self.assertEqual(2, Note.objects.filter().count())
+
+        archive_files = sorted(os.listdir(os.path.join(self.archive_path, self.domain_id)))
+        self.assertEqual(['alert', 'event', 'note'], [file_name.split('-')[0] for file_name in archive_files])
+
+        for archive_file in archive_files:
+            archive_mgr.restore_archive(os.path.join(self.archive_path, self.domain_id, archive_file))
+
+        self.assertEqual(3, Alert.objects.filter().count())
+        self.assertEqual(6, Event.objects.filter().count())
+
+        # Archived events keep their raw data inline
+        event_vo = Event.objects.filter(alert_id=resolved_alert_vo.alert_id).first()
+        self.assertEqual(resolved_alert_vo.alert_id, event_vo.raw_data['alert_id'])
+
+        # Restoring again skips existing documents
+        restored_count = archive_mgr.restore_archive(os.path.join(self.archive_path, self.domain_id,
+                                                                  archive_files[0]))
+        self.assertEqual(0, restored_count)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -1,4 +1,7 @@
+import os
+import tempfile
 import unittest
+from bson import ObjectId
 from datetime import datetime, timedelta
 from unittest.mock import patch
 from mongoengine import connect, disconnect
@@ -8,8 +11,11 @@ from spaceone.core.unittest.runner import RichTestRunner
 from spaceone.core import config
 from spaceone.core import utils
 from spaceone.core.transaction import Transaction
+from spaceone.monitoring.lib import event_write_buffer
+from spaceone.monitoring.lib.archive import iter_archive_chunks, restore_documents
 from spaceone.monitoring.manager.event_manager import EventManager
 from spaceone.monitoring.model.event_model import *
+from spaceone.monitoring.model.event_raw_data_model import EventRawData
 from test.factory.event_factory import EventFactory
 
 
@@ -39,6 +45,7 @@ class TestEventManager(unittest.TestCase):
         print('(tearDown) ==> Delete all data_sources')
         event_vos = Event.objects.filter()
         event_vos.delete()
+        EventRawData.objects.filter().delete()
 
     def test_update_event_by_vo(self):
         test_event = EventFactory(alert_id='alert-400c20b10a5c',  domain_id='domain-58010aa2e451', event_type='ALERT')
@@ -51,6 +58,92 @@ class TestEventManager(unittest.TestCase):
 
         self.assertEqual(merge_to, updated_event_info.alert_id)
 
+    def test_create_events_with_raw_data(self):
+        raw_data = {'alerts': [{'labels': {'alertname': 'cpu'}}, {'labels': {'alertname': 'memory'}}]}
+        events_data = [
+            {
+                'event_key': alert['labels']['alertname'],
+                'title': alert['labels']['alertname'],
+                'raw_data': raw_data,
+                'domain_id': self.domain_id
+            } for alert in raw_data['alerts']
+        ]
+
+        self.transaction.method = 'create'
+        event_mgr = EventManager(transaction=self.transaction)
+        event_vos = event_mgr.create_events(events_data)
+
+        # The payload is stored once and referenced by both events
+        self.assertEqual(1, EventRawData.objects.filter(domain_id=self.domain_id).count())
+        self.assertEqual(1, len(set([event_vo.raw_data_id for event_vo in event_vos])))
+
+        event_vo = event_mgr.get_event(event_vos[0].event_id, self.domain_id)
+        self.assertEqual({}, event_vo.raw_data)
+
+        event_vo = event_mgr.load_raw_data(event_vo)
+        self.assertEqual(raw_data, event_vo.raw_data)
+
+        # Same payload is not stored again
+        event_mgr.create_event({'event_key': 'cpu', 'title': 'cpu', 'raw_data': dict(raw_data),
+                                'domain_id': self.domain_id})
+        self.assertEqual(1, EventRawData.objects.filter(domain_id=self.domain_id).count())
+
+    def test_create_event_with_write_buffer(self):
+        config.set_global(EVENT_WRITE_BUFFER={'enabled': True, 'max_documents': 100, 'flush_interval_ms': 60000})
+
+        alert = ObjectId()
+        event_mgr = EventManager(transaction=self.transaction)
+
+        try:
+            for i in range(3):
+                event_mgr.create_event({
+                    'event_key': 'cpu',
+                    'event_type': 'ALERT',
+                    'title': 'cpu',
+                    'alert': alert,
+                    'alert_id': 'alert-1234',
+                    'domain_id': self.domain_id
+                })
+
+            # Events are written by the buffer, but repeated events can already find their alert
+            self.assertEqual(0, Event.objects.filter(domain_id=self.domain_id).count())
+            self.assertEqual({'alert_id': 'alert-1234', 'alert': alert},
+                             event_mgr.get_alert_by_key('cpu', self.domain_id))
+
+            self.assertEqual(3, event_write_buffer.flush())
+            self.assertEqual(3, Event.objects.filter(domain_id=self.domain_id).count())
+            self.assertIsNone(event_write_buffer.get_pending_alert('cpu', self.domain_id))
+            self.assertEqual('alert-1234', event_mgr.get_alert_by_key('cpu', self.domain_id)['alert_id'])
+        finally:
+            config.set_global(EVENT_WRITE_BUFFER={'enabled': False})
+
+    def test_write_buffer_dead_letter(self):
+        dead_letter_path = tempfile.mkdtemp()
+        config.set_global(EVENT_WRITE_BUFFER={'enabled': True, 'max_documents': 100, 'flush_interval_ms': 60000,
+                                              'max_retries': 1, 'dead_letter_path': dead_letter_path})
+
+        event_mgr = EventManager(transaction=self.transaction)
+
+        try:
+            with patch('mongomock.collection.Collection.insert_many', side_effect=Exception('connection error')):
+                event_mgr.create_event({'event_key': 'cpu', 'title': 'cpu', 'domain_id': self.domain_id})
+
+                # Retried once and then saved to the dead letter file
+                self.assertEqual(0, event_write_buffer.flush())
+                self.assertEqual(1, event_write_buffer.get_stats()['pending'])
+                self.assertEqual(0, event_write_buffer.flush())
+                self.assertEqual(0, event_write_buffer.get_stats()['pending'])
+
+            file_names = os.listdir(dead_letter_path)
+            self.assertEqual(1, len(file_names))
+
+            for documents in iter_archive_chunks(os.path.join(dead_letter_path, file_names[0])):
+                restore_documents(Event, documents)
+
+            self.assertEqual(1, Event.objects.filter(domain_id=self.domain_id, event_key='cpu').count())
+        finally:
+            config.set_global(EVENT_WRITE_BUFFER={'enabled': False})
+
 
 if __name__ == "__main__":
     unittest.main(testRunner=RichTestRunner)
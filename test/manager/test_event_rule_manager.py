@@ -0,0 +1,165 @@
+import unittest
+from unittest.mock import patch
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.transaction import Transaction
+from spaceone.monitoring.manager.event_rule_manager import EventRuleManager
+from spaceone.monitoring.model.event_rule_model import EventRule
+
+
+class TestEventRuleManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True)
+        connect('test', host='mongomock://localhost')
+
+        cls.domain_id = utils.generate_id('domain')
+        cls.project_id = utils.generate_id('project')
+        cls.transaction = Transaction({
+            'service': 'monitoring',
+            'api_class': 'EventRule'
+        })
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def tearDown(self, *args) -> None:
+        print()
+        print('(tearDown) ==> Delete all event rules')
+        EventRule.objects.filter().delete()
+        EventRuleManager.reset_compiled_event_rules(self.project_id, self.domain_id)
+        EventRuleManager.reset_compiled_event_rules(None, self.domain_id)
+
+    def _create_event_rule(self, event_rule_mgr, order, conditions, conditions_policy, actions, **kwargs):
+        params = {
+            'order': order,
+            'conditions': conditions,
+            'conditions_policy': conditions_policy,
+            'actions': actions,
+            'scope': 'PROJECT',
+            'project_id': self.project_id,
+            'domain_id': self.domain_id
+        }
+        params.update(kwargs)
+        return event_rule_mgr.create_event_rule(params)
+
+    def _make_event_data(self, **kwargs):
+        event_data = {
+            'title': 'CPU Utilization is too HIGH',
+            'description': 'cpu > 90%',
+            'additional_info': {'region': 'ap-northeast-2'},
+            'project_id': self.project_id,
+            'domain_id': self.domain_id
+        }
+        event_data.update(kwargs)
+        return event_data
+
+    def test_change_event_data(self):
+        event_rule_mgr = EventRuleManager(transaction=self.transaction)
+
+        self._create_event_rule(event_rule_mgr, 1, [
+            {'key': 'title', 'value': 'cpu', 'operator': 'contain'},
+            {'key': 'additional_info.region', 'value': 'ap-northeast-2', 'operator': 'eq'}
+        ], 'ALL', {'change_urgency': 'LOW'})
+
+        self._create_event_rule(event_rule_mgr, 2, [
+            {'key': 'title', 'value': 'memory', 'operator': 'contain'},
+            {'key': 'description', 'value': 'cpu', 'operator': 'contain'}
+        ], 'ANY', {'change_assignee': 'admin'}, options={'stop_processing': True})
+
+        self._create_event_rule(event_rule_mgr, 3, [
+            {'key': 'title', 'value': 'cpu', 'operator': 'not_contain'}
+        ], 'ANY', {'no_notification': True})
+
+        event_data = event_rule_mgr.change_event_data(self._make_event_data(), self.project_id, self.domain_id)
+
+        self.assertEqual('LOW', event_data['urgency'])
+        self.assertEqual('admin', event_data['assignee'])
+        self.assertNotIn('no_notification', event_data)
+
+        event_data = event_rule_mgr.change_event_data(self._make_event_data(title='Disk Full', description=''),
+                                                      self.project_id, self.domain_id)
+
+        self.assertNotIn('urgency', event_data)
+        self.assertNotIn('assignee', event_data)
+        self.assertTrue(event_data['no_notification'])
+
+    def test_compiled_event_rules_cache(self):
+        event_rule_mgr = EventRuleManager(transaction=self.transaction)
+
+        self._create_event_rule(event_rule_mgr, 1, [
+            {'key': 'title', 'value': 'cpu', 'operator': 'contain'}
+        ], 'ALL', {'change_urgency': 'LOW'})
+
+        with patch.object(EventRuleManager, 'list_project_event_rules',
+                          wraps=event_rule_mgr.list_project_event_rules) as mock_get_project_event_rules:
+            for i in range(3):
+                event_rule_mgr.change_event_data(self._make_event_data(), self.project_id, self.domain_id)
+
+            self.assertEqual(1, mock_get_project_event_rules.call_count)
+
+            event_rule_vo = self._create_event_rule(event_rule_mgr, 2, [
+                {'key': 'title', 'value': 'cpu', 'operator': 'contain'}
+            ], 'ALL', {'change_assignee': 'admin'})
+
+            event_data = event_rule_mgr.change_event_data(self._make_event_data(), self.project_id, self.domain_id)
+
+            self.assertEqual(2, mock_get_project_event_rules.call_count)
+            self.assertEqual('admin', event_data['assignee'])
+
+            event_rule_mgr.delete_event_rule_by_vo(event_rule_vo)
+            event_data = event_rule_mgr.change_event_data(self._make_event_data(), self.project_id, self.domain_id)
+
+            self.assertEqual(3, mock_get_project_event_rules.call_count)
+            self.assertNotIn('assignee', event_data)
+
+    def test_change_event_data_by_global_event_rules(self):
+        event_rule_mgr = EventRuleManager(transaction=self.transaction)
+        other_project_id = utils.generate_id('project')
+
+        self._create_event_rule(event_rule_mgr, 1, [
+            {'key': 'title', 'value': 'cpu', 'operator': 'contain'}
+        ], 'ALL', {'change_project': other_project_id}, scope='GLOBAL', project_id=None)
+
+        self._create_event_rule(event_rule_mgr, 2, [
+            {'key': 'project_id', 'value': other_project_id, 'operator': 'eq'},
+            {'key': 'additional_info.region', 'value': 'us-east-1', 'operator': 'not'}
+        ], 'ALL', {'change_urgency': 'LOW'}, scope='GLOBAL', project_id=None)
+
+        self._create_event_rule(event_rule_mgr, 3, [
+            {'key': 'description', 'value': 'disk', 'operator': 'contain'},
+            {'key': 'title', 'value': 'disk', 'operator': 'contain'}
+        ], 'ANY', {'no_notification': True}, scope='GLOBAL', project_id=None, options={'stop_processing': True})
+
+        self._create_event_rule(event_rule_mgr, 4, [], 'ALL', {'change_assignee': 'admin'},
+                                scope='GLOBAL', project_id=None)
+
+        # Rule 2 matches the project changed by rule 1
+        event_data = event_rule_mgr.change_event_data(self._make_event_data(), self.project_id, self.domain_id)
+
+        self.assertEqual(other_project_id, event_data['project_id'])
+        self.assertEqual('LOW', event_data['urgency'])
+        self.assertNotIn('no_notification', event_data)
+        self.assertEqual('admin', event_data['assignee'])
+
+        # Rule 3 stops processing before rule 4
+        event_data = event_rule_mgr.change_event_data(self._make_event_data(title='Disk Full', description=''),
+                                                      self.project_id, self.domain_id)
+
+        self.assertEqual(self.project_id, event_data['project_id'])
+        self.assertNotIn('urgency', event_data)
+        self.assertTrue(event_data['no_notification'])
+        self.assertNotIn('assignee', event_data)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
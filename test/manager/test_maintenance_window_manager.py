@@ -0,0 +1,87 @@
+import unittest
+from datetime import datetime, timedelta
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.transaction import Transaction
+from spaceone.monitoring.manager.maintenance_window_manager import MaintenanceWindowManager
+from spaceone.monitoring.model.maintenance_window_model import MaintenanceWindow
+
+
+class TestMaintenanceWindowManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True)
+        connect('test', host='mongomock://localhost')
+
+        cls.domain_id = utils.generate_id('domain')
+        cls.transaction = Transaction({
+            'service': 'monitoring',
+            'api_class': 'MaintenanceWindow'
+        })
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def tearDown(self, *args) -> None:
+        print()
+        print('(tearDown) ==> Delete all maintenance windows')
+        MaintenanceWindow.objects.filter().delete()
+        MaintenanceWindowManager.reset_maintenance_index(self.domain_id)
+
+    def _create_maintenance_window(self, projects, start_time, end_time):
+        maintenance_window_mgr = MaintenanceWindowManager(transaction=self.transaction)
+        return maintenance_window_mgr.create_maintenance_window({
+            'title': utils.random_string(),
+            'projects': projects,
+            'start_time': start_time,
+            'end_time': end_time,
+            'domain_id': self.domain_id
+        })
+
+    def test_maintenance_index(self):
+        now = datetime.utcnow()
+        maintenance_window_mgr = MaintenanceWindowManager(transaction=self.transaction)
+
+        maintenance_window_vo = self._create_maintenance_window(['project-1'], now - timedelta(hours=1),
+                                                                now + timedelta(hours=1))
+        self._create_maintenance_window(['project-2'], now + timedelta(hours=1), now + timedelta(hours=2))
+
+        self.assertEqual({'project-1'},
+                         maintenance_window_mgr.get_projects_under_maintenance(['project-1', 'project-2'],
+                                                                               self.domain_id))
+
+        # The loaded index is changed in place by updates
+        maintenance_window_mgr.update_maintenance_window_by_vo({'projects': ['project-1', 'project-3']},
+                                                               maintenance_window_vo)
+        self.assertTrue(maintenance_window_mgr.is_project_under_maintenance('project-3', self.domain_id))
+
+        maintenance_window_mgr.close_maintenance_window(maintenance_window_vo.maintenance_window_id, self.domain_id)
+        self.assertFalse(maintenance_window_mgr.is_project_under_maintenance('project-1', self.domain_id))
+        self.assertTrue(maintenance_window_mgr.is_project_under_maintenance('project-2', self.domain_id,
+                                                                            now + timedelta(hours=1.5)))
+
+    def test_close_expired_maintenance_windows(self):
+        now = datetime.utcnow()
+        maintenance_window_mgr = MaintenanceWindowManager(transaction=self.transaction)
+
+        for i in range(3):
+            self._create_maintenance_window(['project-1'], now - timedelta(hours=2), now - timedelta(hours=1))
+
+        self._create_maintenance_window(['project-2'], now - timedelta(hours=1), now + timedelta(hours=1))
+
+        self.assertEqual(3, maintenance_window_mgr.close_expired_maintenance_windows())
+        self.assertEqual(1, MaintenanceWindow.objects.filter(state='OPEN').count())
+        self.assertEqual(3, MaintenanceWindow.objects.filter(state='CLOSED', closed_at__ne=None).count())
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
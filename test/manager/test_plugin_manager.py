@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import patch
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core.transaction import Transaction
+from spaceone.monitoring.manager import plugin_manager
+from spaceone.monitoring.manager.plugin_manager import PluginManager
+
+
+class TestPluginManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True)
+
+        cls.transaction = Transaction({
+            'service': 'monitoring',
+            'api_class': 'Webhook'
+        })
+        super().setUpClass()
+
+    def tearDown(self, *args) -> None:
+        plugin_manager._ENDPOINTS.clear()
+
+    @patch.object(PluginManager, 'get_plugin_endpoint', return_value=('grpc://plugin:50051', None))
+    def test_get_cached_plugin_endpoint(self, mock_get_plugin_endpoint):
+        plugin_info = {'plugin_id': 'plugin-1', 'version': '1.0'}
+        plugin_mgr = PluginManager(transaction=self.transaction)
+
+        for i in range(3):
+            endpoint, updated_version = plugin_mgr.get_cached_plugin_endpoint(plugin_info, 'domain-1')
+            self.assertEqual('grpc://plugin:50051', endpoint)
+
+        # Resolved once without the default cache
+        self.assertEqual(1, mock_get_plugin_endpoint.call_count)
+
+        plugin_mgr.get_cached_plugin_endpoint(plugin_info, 'domain-2')
+        self.assertEqual(2, mock_get_plugin_endpoint.call_count)
+
+        # Expired endpoints are resolved again
+        config.set_global(PLUGIN_ENDPOINT_CACHE_TTL=-1)
+        try:
+            plugin_mgr.refresh_plugin_endpoint(plugin_info, 'domain-1')
+        finally:
+            config.set_global(PLUGIN_ENDPOINT_CACHE_TTL=600)
+
+        plugin_mgr.get_cached_plugin_endpoint(plugin_info, 'domain-1')
+        self.assertEqual(4, mock_get_plugin_endpoint.call_count)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
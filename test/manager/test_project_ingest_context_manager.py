@@ -0,0 +1,148 @@
+import unittest
+from unittest.mock import patch
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.transaction import Transaction
+from spaceone.monitoring.manager.escalation_policy_manager import EscalationPolicyManager
+from spaceone.monitoring.manager.event_rule_manager import EventRuleManager
+from spaceone.monitoring.manager.project_alert_config_manager import ProjectAlertConfigManager
+from spaceone.monitoring.manager.project_ingest_context_manager import ProjectIngestContextManager
+from spaceone.monitoring.model.escalation_policy_model import EscalationPolicy
+from spaceone.monitoring.model.event_rule_model import EventRule
+from spaceone.monitoring.model.project_alert_config_model import ProjectAlertConfig
+
+
+class TestProjectIngestContextManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True)
+        connect('test', host='mongomock://localhost')
+
+        cls.domain_id = utils.generate_id('domain')
+        cls.project_id = utils.generate_id('project')
+        cls.transaction = Transaction({
+            'service': 'monitoring',
+            'api_class': 'ProjectAlertConfig'
+        })
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def tearDown(self, *args) -> None:
+        print()
+        print('(tearDown) ==> Delete all project alert configs, escalation policies and event rules')
+        ProjectAlertConfig.objects.filter().delete()
+        EscalationPolicy.objects.filter().delete()
+        EventRule.objects.filter().delete()
+        ProjectIngestContextManager.reset_project_ingest_context(self.project_id, self.domain_id)
+
+    def _create_project_alert_config(self, repeat_count=1):
+        escalation_policy_mgr = EscalationPolicyManager(transaction=self.transaction)
+        escalation_policy_vo = escalation_policy_mgr.create_escalation_policy({
+            'name': utils.random_string(),
+            'rules': [{'notification_level': 'ALL', 'escalate_minutes': 0}],
+            'repeat_count': repeat_count,
+            'scope': 'GLOBAL',
+            'domain_id': self.domain_id
+        })
+
+        project_alert_config_mgr = ProjectAlertConfigManager(transaction=self.transaction)
+        project_alert_config_mgr.create_project_alert_config({
+            'project_id': self.project_id,
+            'escalation_policy': escalation_policy_vo,
+            'escalation_policy_id': escalation_policy_vo.escalation_policy_id,
+            'domain_id': self.domain_id
+        })
+
+        return escalation_policy_vo
+
+    def test_get_project_ingest_context(self):
+        escalation_policy_vo = self._create_project_alert_config()
+
+        event_rule_mgr = EventRuleManager(transaction=self.transaction)
+        event_rule_mgr.create_event_rule({
+            'order': 1,
+            'conditions': [{'key': 'title', 'value': 'cpu', 'operator': 'contain'}],
+            'conditions_policy': 'ALL',
+            'actions': {'change_urgency': 'LOW'},
+            'scope': 'PROJECT',
+            'project_id': self.project_id,
+            'domain_id': self.domain_id
+        })
+
+        project_ingest_context_mgr = ProjectIngestContextManager(transaction=self.transaction)
+
+        with patch.object(ProjectAlertConfigManager, 'get_project_alert_config',
+                          wraps=ProjectAlertConfigManager(transaction=self.transaction).get_project_alert_config) \
+                as mock_get_project_alert_config:
+            for i in range(3):
+                context = project_ingest_context_mgr.get_project_ingest_context(self.project_id, self.domain_id)
+
+            self.assertEqual(1, mock_get_project_alert_config.call_count)
+
+        self.assertTrue(context.is_alert_activated)
+        self.assertEqual('MANUAL', context.recovery_mode)
+        self.assertEqual(escalation_policy_vo.escalation_policy_id, context.escalation_policy_id)
+        self.assertEqual(1, context.escalation_repeat_count)
+        self.assertEqual(1, len(context.event_rules))
+
+        with self.assertRaises(AttributeError):
+            context.recovery_mode = 'AUTO'
+
+    def test_reset_project_ingest_context(self):
+        escalation_policy_vo = self._create_project_alert_config()
+        project_ingest_context_mgr = ProjectIngestContextManager(transaction=self.transaction)
+
+        # Alert options are changed by ProjectAlertConfigService.update
+        project_alert_config_mgr = ProjectAlertConfigManager(transaction=self.transaction)
+        project_alert_config_mgr.update_project_alert_config({
+            'project_id': self.project_id,
+            'options': {'recovery_mode': 'AUTO'},
+            'domain_id': self.domain_id
+        })
+
+        context = project_ingest_context_mgr.get_project_ingest_context(self.project_id, self.domain_id)
+        self.assertEqual('AUTO', context.recovery_mode)
+
+        # Escalation policy is changed by EscalationPolicyService.update
+        escalation_policy_mgr = EscalationPolicyManager(transaction=self.transaction)
+        escalation_policy_mgr.update_escalation_policy_by_vo({'repeat_count': 3}, escalation_policy_vo)
+
+        context = project_ingest_context_mgr.get_project_ingest_context(self.project_id, self.domain_id)
+        self.assertEqual(3, context.escalation_repeat_count)
+
+        # Event rules are changed by EventRuleService.create
+        event_rule_mgr = EventRuleManager(transaction=self.transaction)
+        event_rule_mgr.create_event_rule({
+            'order': 1,
+            'conditions': [{'key': 'title', 'value': 'memory', 'operator': 'contain'}],
+            'conditions_policy': 'ALL',
+            'actions': {'change_urgency': 'LOW'},
+            'scope': 'PROJECT',
+            'project_id': self.project_id,
+            'domain_id': self.domain_id
+        })
+
+        context = project_ingest_context_mgr.get_project_ingest_context(self.project_id, self.domain_id)
+        self.assertEqual(1, len(context.event_rules))
+
+        # Alert feature is deactivated by ProjectAlertConfigService.delete
+        project_alert_config_mgr.delete_project_alert_config(self.project_id, self.domain_id)
+
+        context = project_ingest_context_mgr.get_project_ingest_context(self.project_id, self.domain_id)
+        self.assertFalse(context.is_alert_activated)
+        self.assertIsNone(context.escalation_policy_id)
+        self.assertEqual(1, len(context.event_rules))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,56 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core.transaction import Transaction
+from spaceone.monitoring.connector.webhook_plugin_connector import WebhookPluginConnector
+from spaceone.monitoring.manager.webhook_plugin_manager import WebhookPluginManager
+
+
+class TestWebhookPluginManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True)
+
+        cls.transaction = Transaction({
+            'service': 'monitoring',
+            'api_class': 'Event'
+        })
+        super().setUpClass()
+
+    @patch.object(WebhookPluginConnector, 'parse_event')
+    def test_parse_events(self, mock_parse_event):
+        thread_ids = set()
+
+        def _parse_event(options, data):
+            thread_ids.add(threading.get_ident())
+            time.sleep(0.01)
+
+            if data.get('invalid'):
+                raise Exception('Invalid payload')
+
+            return {'results': [{'event_key': data['key']}]}
+
+        mock_parse_event.side_effect = _parse_event
+
+        webhook_plugin_mgr = WebhookPluginManager(transaction=self.transaction)
+        data_list = [{'key': f'event-{i}'} for i in range(10)]
+        data_list[3] = {'invalid': True}
+
+        responses = webhook_plugin_mgr.parse_events({}, data_list)
+
+        # Responses map back to their payloads
+        self.assertEqual(10, len(responses))
+        self.assertIsInstance(responses[3], Exception)
+        self.assertEqual('event-9', responses[9]['results'][0]['event_key'])
+        self.assertGreater(len(thread_ids), 1)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
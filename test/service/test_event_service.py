@@ -0,0 +1,537 @@
+import unittest
+from datetime import timedelta
+from unittest.mock import patch, Mock
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.transaction import Transaction
+from spaceone.core.error import *
+from spaceone.monitoring.error.webhook import ERROR_WEBHOOK_RATE_LIMIT_EXCEEDED
+from spaceone.monitoring.lib import idempotency, ingest_metrics, rate_limiter
+from spaceone.monitoring.service.event_service import EventService
+from spaceone.monitoring.manager.job_manager import JobManager
+from spaceone.monitoring.manager.event_rule_manager import EventRuleManager
+from spaceone.monitoring.manager.webhook_manager import WebhookManager
+from spaceone.monitoring.manager.webhook_plugin_manager import WebhookPluginManager
+from spaceone.monitoring.manager.project_alert_config_manager import ProjectAlertConfigManager
+from spaceone.monitoring.manager.project_ingest_context_manager import ProjectIngestContextManager
+from spaceone.monitoring.model.alert_model import Alert
+from spaceone.monitoring.model.event_model import Event
+
+
+def _change_event_data(event_data, project_id, domain_id):
+    return event_data
+
+
+class TestEventService(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True)
+        connect('test', host='mongomock://localhost')
+
+        cls.domain_id = utils.generate_id('domain')
+        cls.project_id = utils.generate_id('project')
+        cls.webhook_vo = Mock(webhook_id=utils.generate_id('webhook'), project_id=cls.project_id,
+                              domain_id=cls.domain_id, state='ENABLED', access_key='access-key')
+        cls.webhook_vo.name = 'test-webhook'
+        cls.webhook_vo.plugin_info = Mock(plugin_id=utils.generate_id('plugin'), version='1.0',
+                                          upgrade_mode='MANUAL', options={})
+        cls.project_alert_config_vo = Mock()
+        cls.project_alert_config_vo.escalation_policy = Mock(escalation_policy_id='ep-1234', repeat_count=1)
+        cls.project_alert_config_vo.options = Mock(recovery_mode='AUTO')
+        cls.transaction = Transaction({
+            'service': 'monitoring',
+            'api_class': 'Event'
+        })
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def tearDown(self, *args) -> None:
+        print()
+        print('(tearDown) ==> Delete all events and alerts')
+        Event.objects.filter().delete()
+        Alert.objects.filter().delete()
+        ProjectIngestContextManager.reset_project_ingest_context(self.project_id, self.domain_id)
+
+    @staticmethod
+    def _parse_event(options, data):
+        if data.get('invalid'):
+            raise Exception('Invalid payload')
+
+        return {
+            'results': [
+                {
+                    'event_key': event['key'],
+                    'event_type': event.get('type', 'ALERT'),
+                    'title': event['key'],
+                    'severity': 'CRITICAL'
+                } for event in data['events']
+            ]
+        }
+
+    @patch.object(JobManager, 'push_task', return_value=None)
+    @patch.object(EventRuleManager, 'change_event_data', side_effect=_change_event_data)
+    @patch.object(ProjectAlertConfigManager, 'get_project_alert_config')
+    @patch.object(WebhookPluginManager, 'get_cached_webhook_plugin_endpoint', return_value='grpc://plugin:50051')
+    @patch.object(WebhookPluginManager, 'initialize', return_value=None)
+    @patch.object(WebhookPluginManager, 'parse_event')
+    @patch.object(WebhookManager, 'get_webhook_by_id')
+    def test_create_batch(self, mock_get_webhook_by_id, mock_parse_event, mock_initialize,
+                          mock_get_cached_webhook_plugin_endpoint, mock_get_project_alert_config, *args):
+        mock_get_webhook_by_id.return_value = self.webhook_vo
+        mock_parse_event.side_effect = self._parse_event
+        mock_get_project_alert_config.return_value = self.project_alert_config_vo
+
+        params = {
+            'webhook_id': self.webhook_vo.webhook_id,
+            'access_key': 'access-key',
+            'data_list': [
+                {'events': [{'key': 'cpu'}, {'key': 'memory'}]},
+                {'events': [{'key': 'cpu'}]},
+                {'invalid': True}
+            ]
+        }
+
+        self.transaction.method = 'create_batch'
+        event_svc = EventService(transaction=self.transaction)
+
+        results = event_svc.create_batch(params.copy())
+
+        self.assertEqual(['SUCCESS', 'SUCCESS', 'FAILURE'], [result['status'] for result in results])
+        self.assertEqual(4, Event.objects.filter(domain_id=self.domain_id).count())
+
+        # Repeated 'cpu' events are merged into one alert
+        self.assertEqual(3, Alert.objects.filter(domain_id=self.domain_id).count())
+
+        cpu_alert_ids = Event.objects.filter(event_key='cpu').distinct('alert_id')
+        self.assertEqual(1, len(cpu_alert_ids))
+
+    @patch.object(JobManager, 'push_task', return_value=None)
+    @patch.object(EventRuleManager, 'change_event_data', side_effect=_change_event_data)
+    @patch.object(ProjectAlertConfigManager, 'get_project_alert_config')
+    @patch.object(WebhookPluginManager, 'get_cached_webhook_plugin_endpoint', return_value='grpc://plugin:50051')
+    @patch.object(WebhookPluginManager, 'initialize', return_value=None)
+    @patch.object(WebhookPluginManager, 'parse_event')
+    @patch.object(WebhookManager, 'get_webhook_by_id')
+    def test_create_with_same_event_key(self, mock_get_webhook_by_id, mock_parse_event, mock_initialize,
+                                        mock_get_cached_webhook_plugin_endpoint, mock_get_project_alert_config, *args):
+        mock_get_webhook_by_id.return_value = self.webhook_vo
+        mock_parse_event.side_effect = self._parse_event
+        mock_get_project_alert_config.return_value = self.project_alert_config_vo
+
+        self.transaction.method = 'create'
+        event_svc = EventService(transaction=self.transaction)
+
+        def _create(event_type):
+            event_svc.create({
+                'webhook_id': self.webhook_vo.webhook_id,
+                'access_key': 'access-key',
+                'data': {'events': [{'key': 'cpu', 'type': event_type}]}
+            })
+
+        _create('ALERT')
+        _create('ALERT')
+
+        self.assertEqual(2, Event.objects.filter(event_key='cpu').count())
+        self.assertEqual(1, Alert.objects.filter(domain_id=self.domain_id).count())
+
+        # Resolve the alert (recovery_mode = AUTO)
+        _create('RECOVERY')
+
+        alert_vo = Alert.objects.get(domain_id=self.domain_id)
+        self.assertEqual('RESOLVED', alert_vo.state)
+        self.assertEqual(3, Event.objects.filter(alert_id=alert_vo.alert_id).count())
+
+        # A new alert is created after the alert is resolved
+        _create('ALERT')
+
+        self.assertEqual(2, Alert.objects.filter(domain_id=self.domain_id).count())
+
+    @patch.object(JobManager, 'push_task', return_value=None)
+    @patch.object(WebhookPluginManager, 'parse_event')
+    @patch.object(WebhookManager, 'get_webhook_by_id')
+    def test_accept(self, mock_get_webhook_by_id, mock_parse_event, mock_push_task, *args):
+        mock_get_webhook_by_id.return_value = self.webhook_vo
+
+        params = {
+            'webhook_id': self.webhook_vo.webhook_id,
+            'access_key': 'access-key',
+            'data': {'events': [{'key': 'cpu'}]}
+        }
+
+        self.transaction.method = 'accept'
+        event_svc = EventService(transaction=self.transaction)
+        event_svc.accept(params.copy())
+
+        task_name, class_name, method, task_params = mock_push_task.call_args[0]
+        self.assertEqual('create_accepted', method)
+        self.assertEqual({'webhook_id', 'access_key', 'data'}, set(task_params.keys()))
+        self.assertEqual(params['data'], task_params['data'])
+        mock_parse_event.assert_not_called()
+        self.assertEqual(0, Event.objects.filter(domain_id=self.domain_id).count())
+
+        params['access_key'] = 'invalid-access-key'
+        self.assertRaises(ERROR_PERMISSION_DENIED, event_svc.accept, params.copy())
+
+    @patch.object(JobManager, 'push_task', return_value=None)
+    @patch.object(EventRuleManager, 'change_event_data', side_effect=_change_event_data)
+    @patch.object(ProjectAlertConfigManager, 'get_project_alert_config')
+    @patch.object(WebhookPluginManager, 'get_cached_webhook_plugin_endpoint', return_value='grpc://plugin:50051')
+    @patch.object(WebhookPluginManager, 'initialize', return_value=None)
+    @patch.object(WebhookPluginManager, 'parse_event')
+    @patch.object(WebhookManager, 'get_webhook_by_id')
+    def test_create_with_rate_limit(self, mock_get_webhook_by_id, mock_parse_event, mock_initialize,
+                                    mock_get_cached_webhook_plugin_endpoint, mock_get_project_alert_config,
+                                    mock_change_event_data, mock_push_task):
+        mock_get_webhook_by_id.return_value = self.webhook_vo
+        mock_parse_event.side_effect = self._parse_event
+        mock_get_project_alert_config.return_value = self.project_alert_config_vo
+
+        config.set_global(WEBHOOK_RATE_LIMIT={
+            'enabled': True,
+            'webhook': {'rate': 0.01, 'burst': 2},
+            'domain': {'rate': 100, 'burst': 100}
+        })
+        rate_limiter.reset()
+
+        params = {
+            'webhook_id': self.webhook_vo.webhook_id,
+            'access_key': 'access-key',
+            'data': {'events': [{'key': 'cpu'}]}
+        }
+
+        try:
+            self.transaction.method = 'create'
+            event_svc = EventService(transaction=self.transaction)
+            event_svc.create(params.copy())
+            event_svc.create(params.copy())
+
+            with self.assertRaises(ERROR_WEBHOOK_RATE_LIMIT_EXCEEDED) as cm:
+                event_svc.create(params.copy())
+
+            # Shed payloads are not parsed
+            self.assertEqual(2, mock_parse_event.call_count)
+            self.assertGreater(cm.exception.meta['retry_after'], 0)
+            self.assertEqual({self.webhook_vo.webhook_id: 1}, rate_limiter.get_shed_counts())
+
+            # Callers of the API cannot skip the rate limit
+            self.assertRaises(ERROR_WEBHOOK_RATE_LIMIT_EXCEEDED, event_svc.create,
+                              dict(params, rate_limit_checked=True))
+
+            # Payloads accepted in ASYNC mode are not counted again by the worker
+            rate_limiter.reset()
+            transaction = Transaction({'service': 'monitoring', 'api_class': 'Event'})
+            transaction.method = 'accept'
+            EventService(transaction=transaction).accept(params.copy())
+
+            task_params = [call[0][3] for call in mock_push_task.call_args_list
+                           if call[0][2] == 'create_accepted'][-1]
+            transaction.method = 'create_accepted'
+            EventService(transaction=transaction).create_accepted(task_params)
+
+            transaction.method = 'create'
+            event_svc = EventService(transaction=transaction)
+            event_svc.create(params.copy())
+
+            self.assertEqual(4, mock_parse_event.call_count)
+            self.assertEqual({}, rate_limiter.get_shed_counts())
+        finally:
+            config.set_global(WEBHOOK_RATE_LIMIT={'enabled': False})
+            rate_limiter.reset()
+
+    @patch.object(JobManager, 'push_task', return_value=None)
+    @patch.object(EventRuleManager, 'change_event_data', side_effect=_change_event_data)
+    @patch.object(ProjectAlertConfigManager, 'get_project_alert_config')
+    @patch.object(WebhookPluginManager, 'get_cached_webhook_plugin_endpoint', return_value='grpc://plugin:50051')
+    @patch.object(WebhookPluginManager, 'initialize', return_value=None)
+    @patch.object(WebhookPluginManager, 'parse_event')
+    @patch.object(WebhookManager, 'get_webhook_by_id')
+    def test_create_with_idempotency(self, mock_get_webhook_by_id, mock_parse_event, mock_initialize,
+                                     mock_get_cached_webhook_plugin_endpoint, mock_get_project_alert_config,
+                                     mock_change_event_data, mock_push_task):
+        mock_get_webhook_by_id.return_value = self.webhook_vo
+        mock_parse_event.side_effect = self._parse_event
+        mock_get_project_alert_config.return_value = self.project_alert_config_vo
+
+        config.set_global(WEBHOOK_IDEMPOTENCY={'enabled': True, 'ttl': 300, 'max_size': 100})
+        idempotency.reset()
+
+        params = {
+            'webhook_id': self.webhook_vo.webhook_id,
+            'access_key': 'access-key',
+            'data': {'events': [{'key': 'cpu', 'type': 'ALERT'}]}
+        }
+
+        try:
+            self.transaction.method = 'create'
+            event_svc = EventService(transaction=self.transaction)
+            event_svc.create(params.copy())
+
+            # The same payload with a different key order is a re-delivery
+            event_svc.create(dict(params, data={'events': [{'type': 'ALERT', 'key': 'cpu'}]}))
+            self.assertEqual(1, mock_parse_event.call_count)
+            self.assertEqual(1, Event.objects.filter(webhook_id=self.webhook_vo.webhook_id).count())
+
+            # The idempotency key of the sender is used instead of the payload
+            event_svc.create(dict(params, idempotency_key='delivery-1'))
+            event_svc.create(dict(params, idempotency_key='delivery-1', data={'events': [{'key': 'memory'}]}))
+            self.assertEqual(2, mock_parse_event.call_count)
+
+            results = event_svc.create_batch({
+                'webhook_id': self.webhook_vo.webhook_id,
+                'access_key': 'access-key',
+                'data_list': [{'events': [{'key': 'cpu', 'type': 'ALERT'}]}, {'events': [{'key': 'disk'}]}]
+            })
+
+            self.assertEqual(['DUPLICATE', 'SUCCESS'], [result['status'] for result in results])
+            self.assertEqual(3, mock_parse_event.call_count)
+
+            # Payloads accepted in ASYNC mode are not checked again by the worker
+            transaction = Transaction({'service': 'monitoring', 'api_class': 'Event'})
+            transaction.method = 'accept'
+            results = EventService(transaction=transaction).accept(dict(params, data={'events': [{'key': 'network'}]}))
+            self.assertEqual('SUCCESS', results[0]['status'])
+
+            results = EventService(transaction=transaction).accept(dict(params, data={'events': [{'key': 'network'}]}))
+            self.assertEqual('DUPLICATE', results[0]['status'])
+
+            create_tasks = [call[0][3] for call in mock_push_task.call_args_list if call[0][2] == 'create_accepted']
+            self.assertEqual(1, len(create_tasks))
+
+            transaction.method = 'create_accepted'
+            EventService(transaction=transaction).create_accepted(create_tasks[0])
+            self.assertEqual(4, mock_parse_event.call_count)
+        finally:
+            config.set_global(WEBHOOK_IDEMPOTENCY={'enabled': False})
+            idempotency.reset()
+
+    @patch.object(JobManager, 'push_task', return_value=None)
+    @patch.object(EventRuleManager, 'change_event_data', side_effect=_change_event_data)
+    @patch.object(ProjectAlertConfigManager, 'get_project_alert_config')
+    @patch.object(WebhookPluginManager, 'get_cached_webhook_plugin_endpoint', return_value='grpc://plugin:50051')
+    @patch.object(WebhookPluginManager, 'initialize', return_value=None)
+    @patch.object(WebhookPluginManager, 'parse_event')
+    @patch.object(WebhookManager, 'get_webhook_by_id')
+    def test_create_with_coalescing(self, mock_get_webhook_by_id, mock_parse_event, mock_initialize,
+                                    mock_get_cached_webhook_plugin_endpoint, mock_get_project_alert_config, *args):
+        mock_get_webhook_by_id.return_value = self.webhook_vo
+        mock_parse_event.side_effect = self._parse_event
+        mock_get_project_alert_config.return_value = self.project_alert_config_vo
+
+        config.set_global(EVENT_COALESCING={'enabled': True, 'window': 600, 'max_occurrences': 3})
+
+        try:
+            self.transaction.method = 'create'
+            event_svc = EventService(transaction=self.transaction)
+
+            for i in range(3):
+                event_svc.create({
+                    'webhook_id': self.webhook_vo.webhook_id,
+                    'access_key': 'access-key',
+                    'data': {'events': [{'key': 'cpu'}]}
+                })
+
+            event_vo = Event.objects.get(event_key='cpu')
+            self.assertEqual(3, event_vo.occurrence_count)
+            self.assertEqual(3, len(event_vo.occurrences))
+
+            # Repeats in a batch are merged before insert or counted on the saved event
+            self.transaction.method = 'create_batch'
+            event_svc = EventService(transaction=self.transaction)
+            event_svc.create_batch({
+                'webhook_id': self.webhook_vo.webhook_id,
+                'access_key': 'access-key',
+                'data_list': [
+                    {'events': [{'key': 'cpu'}, {'key': 'memory'}]},
+                    {'events': [{'key': 'memory'}, {'key': 'memory'}]},
+                    {'events': [{'key': 'memory', 'type': 'RECOVERY'}]}
+                ]
+            })
+
+            event_vo.reload()
+            self.assertEqual(1, Event.objects.filter(event_key='cpu').count())
+            self.assertEqual(4, event_vo.occurrence_count)
+            self.assertEqual(3, len(event_vo.occurrences))
+            self.assertEqual(event_vo.occurrences[-1], event_vo.last_occurred_at)
+
+            memory_event_vo = Event.objects.get(event_key='memory', event_type='ALERT')
+            self.assertEqual(3, memory_event_vo.occurrence_count)
+
+            # Recovery events are never coalesced
+            self.assertEqual(1, Event.objects.filter(event_key='memory', event_type='RECOVERY').count())
+        finally:
+            config.set_global(EVENT_COALESCING={'enabled': False})
+
+    @patch.object(JobManager, 'push_task', return_value=None)
+    @patch.object(EventRuleManager, 'change_event_data', side_effect=_change_event_data)
+    @patch.object(ProjectAlertConfigManager, 'get_project_alert_config')
+    @patch.object(WebhookPluginManager, 'get_cached_webhook_plugin_endpoint', return_value='grpc://plugin:50051')
+    @patch.object(WebhookPluginManager, 'initialize', return_value=None)
+    @patch.object(WebhookPluginManager, 'parse_event')
+    @patch.object(WebhookManager, 'get_webhook_by_id')
+    def test_create_with_coalescing_across_windows(self, mock_get_webhook_by_id, mock_parse_event, mock_initialize,
+                                                   mock_get_cached_webhook_plugin_endpoint,
+                                                   mock_get_project_alert_config, *args):
+        mock_get_webhook_by_id.return_value = self.webhook_vo
+        mock_parse_event.side_effect = self._parse_event
+        mock_get_project_alert_config.return_value = self.project_alert_config_vo
+
+        config.set_global(EVENT_COALESCING={'enabled': True, 'window': 600, 'max_occurrences': 10},
+                          SAME_EVENT_TIME=600)
+
+        params = {
+            'webhook_id': self.webhook_vo.webhook_id,
+            'access_key': 'access-key',
+            'data': {'events': [{'key': 'cpu'}]}
+        }
+
+        try:
+            self.transaction.method = 'create'
+            event_svc = EventService(transaction=self.transaction)
+
+            for i in range(4):
+                # 400 seconds pass between repeats, so the first event is older than the window
+                for event_vo in Event.objects.filter(event_key='cpu'):
+                    Event.objects.filter(pk=event_vo.pk).update(
+                        created_at=event_vo.created_at - timedelta(seconds=400),
+                        last_seen_at=event_vo.last_seen_at - timedelta(seconds=400)
+                    )
+
+                event_svc.create(params.copy())
+
+            self.assertEqual(1, Alert.objects.filter(domain_id=self.domain_id).count())
+            self.assertEqual(4, Event.objects.get(event_key='cpu').occurrence_count)
+        finally:
+            config.set_global(EVENT_COALESCING={'enabled': False})
+
+    @patch.object(JobManager, 'push_task', return_value=None)
+    @patch.object(EventRuleManager, 'change_event_data', side_effect=_change_event_data)
+    @patch.object(ProjectAlertConfigManager, 'get_project_alert_config')
+    @patch.object(WebhookPluginManager, 'get_cached_webhook_plugin_endpoint', return_value='grpc://plugin:50051')
+    @patch.object(WebhookPluginManager, 'initialize', return_value=None)
+    @patch.object(WebhookPluginManager, 'parse_event')
+    @patch.object(WebhookManager, 'get_webhook_by_id')
+    def test_create_batch_with_native_parser(self, mock_get_webhook_by_id, mock_parse_event, mock_initialize,
+                                             mock_get_cached_webhook_plugin_endpoint, mock_get_project_alert_config,
+                                             *args):
+        mock_get_webhook_by_id.return_value = self.webhook_vo
+        mock_parse_event.side_effect = self._parse_event
+        mock_get_project_alert_config.return_value = self.project_alert_config_vo
+
+        config.set_global(WEBHOOK_NATIVE_PARSERS={self.webhook_vo.plugin_info.plugin_id: 'alertmanager'})
+
+        alertmanager_data = {
+            'groupKey': '{}:{alertname="HighCPU"}',
+            'alerts': [
+                {
+                    'status': 'firing',
+                    'labels': {'alertname': 'HighCPU', 'severity': 'critical'},
+                    'annotations': {'summary': 'CPU is too high'},
+                    'startsAt': '2021-03-04T10:00:00Z',
+                    'fingerprint': 'c6a1f2e3'
+                }
+            ]
+        }
+
+        try:
+            self.transaction.method = 'create_batch'
+            event_svc = EventService(transaction=self.transaction)
+            event_svc.create_batch({
+                'webhook_id': self.webhook_vo.webhook_id,
+                'access_key': 'access-key',
+                'data_list': [alertmanager_data, alertmanager_data]
+            })
+
+            # The plugin is not called for payloads parsed natively
+            mock_initialize.assert_not_called()
+            mock_parse_event.assert_not_called()
+
+            event_vos = Event.objects.filter(event_key='c6a1f2e3')
+            self.assertEqual(2, event_vos.count())
+            self.assertEqual('CRITICAL', event_vos[0].severity)
+
+            # Unknown payloads fall back to the plugin
+            event_svc.create_batch({
+                'webhook_id': self.webhook_vo.webhook_id,
+                'access_key': 'access-key',
+                'data_list': [{'events': [{'key': 'cpu'}]}, alertmanager_data]
+            })
+
+            self.assertEqual(1, mock_initialize.call_count)
+            self.assertEqual(1, mock_parse_event.call_count)
+            self.assertEqual(3, Event.objects.filter(event_key='c6a1f2e3').count())
+        finally:
+            config.set_global(WEBHOOK_NATIVE_PARSERS={})
+
+    @patch.object(JobManager, 'push_task', return_value=None)
+    @patch.object(EventRuleManager, 'change_event_data', side_effect=_change_event_data)
+    @patch.object(ProjectAlertConfigManager, 'get_project_alert_config')
+    @patch.object(WebhookPluginManager, 'get_cached_webhook_plugin_endpoint', return_value='grpc://plugin:50051')
+    @patch.object(WebhookPluginManager, 'initialize', return_value=None)
+    @patch.object(WebhookPluginManager, 'parse_event')
+    @patch.object(WebhookManager, 'get_webhook_by_id')
+    def test_create_with_ingest_metrics(self, mock_get_webhook_by_id, mock_parse_event, mock_initialize,
+                                        mock_get_cached_webhook_plugin_endpoint, mock_get_project_alert_config,
+                                        *args):
+        mock_get_webhook_by_id.return_value = self.webhook_vo
+        mock_parse_event.side_effect = self._parse_event
+        mock_get_project_alert_config.return_value = self.project_alert_config_vo
+
+        self.transaction.method = 'create'
+        event_svc = EventService(transaction=self.transaction)
+
+        def _create(event_type):
+            event_svc.create({
+                'webhook_id': self.webhook_vo.webhook_id,
+                'access_key': 'access-key',
+                'data': {'events': [{'key': 'cpu', 'type': event_type}]}
+            })
+
+        # Nothing is recorded when disabled
+        ingest_metrics.reset()
+        _create('ALERT')
+        self.assertEqual('\n', ingest_metrics.render_prometheus())
+
+        config.set_global(INGEST_METRICS={'enabled': True, 'buckets': [0.01, 0.1, 1]})
+
+        try:
+            _create('ALERT')
+            _create('RECOVERY')
+
+            metrics = ingest_metrics.render_prometheus()
+
+            for stage in ['webhook_data', 'plugin_endpoint', 'parse_event', 'change_event_data', 'get_alert_by_key',
+                          'save_event']:
+                self.assertIn(f'spaceone_monitoring_ingest_stage_seconds_count{{stage="{stage}"}} 2', metrics)
+
+            self.assertIn('spaceone_monitoring_ingest_stage_seconds_bucket{stage="parse_event",le="+Inf"} 2',
+                          metrics)
+            self.assertIn('spaceone_monitoring_ingest_events_total{event_type="ALERT"} 1', metrics)
+            self.assertIn('spaceone_monitoring_ingest_events_total{event_type="RECOVERY"} 1', metrics)
+            self.assertIn('spaceone_monitoring_ingest_dedup_hits_total 1', metrics)
+            self.assertIn('spaceone_monitoring_ingest_recoveries_total 1', metrics)
+            self.assertNotIn('alerts_created', metrics)
+
+            # Unknown event types of the plugins are counted as one label value
+            for i in range(3):
+                ingest_metrics.increment('events', event_type=f'UNKNOWN-{i}')
+
+            metrics = ingest_metrics.render_prometheus()
+            self.assertIn('spaceone_monitoring_ingest_events_total{event_type="other"} 3', metrics)
+            self.assertNotIn('UNKNOWN', metrics)
+        finally:
+            config.set_global(INGEST_METRICS={'enabled': False})
+            ingest_metrics.reset()
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,267 @@
+import unittest
+from unittest.mock import patch
+from datetime import datetime, timedelta
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.transaction import Transaction
+from spaceone.monitoring.lib import escalation
+from spaceone.monitoring.manager.alert_manager import AlertManager
+from spaceone.monitoring.manager.escalation_policy_manager import EscalationPolicyManager
+from spaceone.monitoring.manager.identity_manager import IdentityManager
+from spaceone.monitoring.manager.job_manager import JobManager
+from spaceone.monitoring.manager.notification_manager import NotificationManager
+from spaceone.monitoring.manager.project_alert_config_manager import ProjectAlertConfigManager
+from spaceone.monitoring.model.alert_model import Alert
+from spaceone.monitoring.model.escalation_policy_model import EscalationPolicy
+from spaceone.monitoring.model.job_model import Job
+from spaceone.monitoring.model.project_alert_config_model import ProjectAlertConfig
+from spaceone.monitoring.model.webhook_model import Webhook
+from spaceone.monitoring.service.job_service import JobService
+from test.factory.alert_factory import AlertFactory
+
+
+class TestJobService(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True)
+        connect('test', host='mongomock://localhost')
+
+        cls.domain_id = utils.generate_id('domain')
+        cls.project_id = utils.generate_id('project')
+        cls.transaction = Transaction({
+            'service': 'monitoring',
+            'api_class': 'Job'
+        })
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def tearDown(self, *args) -> None:
+        print()
+        print('(tearDown) ==> Delete all alerts, project alert configs and escalation policies')
+        Alert.objects.filter().delete()
+        ProjectAlertConfig.objects.filter().delete()
+        EscalationPolicy.objects.filter().delete()
+        Job.objects.filter().delete()
+        Webhook.objects.filter().delete()
+
+    def _create_escalation_policy(self):
+        escalation_policy_mgr = EscalationPolicyManager(transaction=self.transaction)
+        escalation_policy_vo = escalation_policy_mgr.create_escalation_policy({
+            'name': utils.random_string(),
+            'rules': [
+                {'notification_level': 'LV1', 'escalate_minutes': 10},
+                {'notification_level': 'ALL', 'escalate_minutes': 30}
+            ],
+            'repeat_count': 0,
+            'scope': 'GLOBAL',
+            'domain_id': self.domain_id
+        })
+
+        project_alert_config_mgr = ProjectAlertConfigManager(transaction=self.transaction)
+        project_alert_config_mgr.create_project_alert_config({
+            'project_id': self.project_id,
+            'escalation_policy': escalation_policy_vo,
+            'escalation_policy_id': escalation_policy_vo.escalation_policy_id,
+            'domain_id': self.domain_id
+        })
+
+        return escalation_policy_vo
+
+    def test_list_due_alerts(self):
+        escalation_policy_vo = self._create_escalation_policy()
+        escalation_policy_id = escalation_policy_vo.escalation_policy_id
+        rules = [dict(rule.to_dict()) for rule in escalation_policy_vo.rules]
+
+        alert_mgr = AlertManager(transaction=self.transaction)
+        new_alert_vo = alert_mgr.create_alert({
+            'title': utils.random_string(),
+            'escalation_policy_id': escalation_policy_id,
+            'escalation_ttl': 1,
+            'project_id': self.project_id,
+            'domain_id': self.domain_id
+        })
+
+        # Alert created before the due escalation index
+        legacy_alert_vo = AlertFactory(escalation_policy_id=escalation_policy_id, escalation_ttl=1,
+                                       escalated_at=datetime.utcnow(), next_escalation_at=None,
+                                       project_id=self.project_id, domain_id=self.domain_id)
+
+        AlertFactory(escalation_policy_id=escalation_policy_id, escalation_ttl=1,
+                     escalated_at=datetime.utcnow(), next_escalation_at=datetime.utcnow() + timedelta(minutes=10),
+                     project_id=self.project_id, domain_id=self.domain_id)
+
+        AlertFactory(state='RESOLVED', escalation_policy_id=escalation_policy_id, escalation_ttl=0,
+                     next_escalation_at=None, project_id=self.project_id, domain_id=self.domain_id)
+
+        job_svc = JobService(transaction=self.transaction)
+
+        alert_vos, total_count = job_svc._list_open_alerts(self.domain_id)
+        self.assertEqual({new_alert_vo.alert_id, legacy_alert_vo.alert_id},
+                         set(alert_vo.alert_id for alert_vo in alert_vos))
+
+        rows = alert_mgr.list_alert_escalation_rows([new_alert_vo.alert_id, legacy_alert_vo.alert_id], self.domain_id)
+        decisions = escalation.evaluate_escalations(rows, {escalation_policy_id: (rules, 'RESOLVED')},
+                                                    {self.project_id: {'notification_urgency': 'ALL'}},
+                                                    {self.project_id: 'CLOSED'})
+        alert_mgr.update_alert_escalations([(decision.row, decision.update) for decision in decisions])
+
+        new_alert_vo = Alert.objects.get(alert_id=new_alert_vo.alert_id)
+        self.assertEqual(new_alert_vo.escalated_at + timedelta(minutes=10), new_alert_vo.next_escalation_at)
+        self.assertIsNotNone(Alert.objects.get(alert_id=legacy_alert_vo.alert_id).next_escalation_at)
+
+        alert_vos, total_count = job_svc._list_open_alerts(self.domain_id)
+        self.assertEqual(0, total_count)
+
+        # Rules are changed by EscalationPolicyService.update, and the change is reverted on failure
+        transaction = Transaction({'service': 'monitoring', 'api_class': 'EscalationPolicy'})
+        AlertManager(transaction=transaction).reset_escalation_time_by_policy(escalation_policy_id, self.domain_id)
+
+        alert_vos, total_count = job_svc._list_open_alerts(self.domain_id)
+        self.assertEqual(3, total_count)
+
+        transaction.execute_rollback()
+
+        alert_vos, total_count = job_svc._list_open_alerts(self.domain_id)
+        self.assertEqual(0, total_count)
+
+        alert_mgr.reset_escalation_time_by_policy(escalation_policy_id, self.domain_id)
+
+        alert_vos, total_count = job_svc._list_open_alerts(self.domain_id)
+        self.assertEqual(3, total_count)
+
+        new_alert_vo = alert_mgr.update_alert_by_vo({'state': 'RESOLVED', 'escalation_ttl': 0}, new_alert_vo)
+        self.assertIsNone(new_alert_vo.next_escalation_at)
+
+        alert_vos, total_count = job_svc._list_open_alerts(self.domain_id)
+        self.assertEqual(2, total_count)
+
+    @patch.object(NotificationManager, 'create_notification')
+    @patch.object(JobManager, 'push_task')
+    def test_create_alert_notifications(self, mock_push_task, mock_create_notification):
+        escalation_policy_vo = self._create_escalation_policy()
+
+        alert_mgr = AlertManager(transaction=self.transaction)
+        for i in range(5):
+            alert_mgr.create_alert({
+                'title': utils.random_string(),
+                'escalation_policy_id': escalation_policy_vo.escalation_policy_id,
+                'escalation_ttl': 1,
+                'project_id': self.project_id,
+                'domain_id': self.domain_id
+            })
+
+        config.set_global(ESCALATION_TASK_CHUNK_SIZE=2)
+
+        try:
+            job_svc = JobService(transaction=self.transaction)
+            job_svc.create_job({'domain_id': self.domain_id})
+        finally:
+            config.set_global(ESCALATION_TASK_CHUNK_SIZE=500)
+
+        job_vo = Job.objects.get(domain_id=self.domain_id)
+        self.assertEqual(3, job_vo.total_tasks)
+        self.assertEqual(3, mock_push_task.call_count)
+
+        # JobService is wrapped by the service handlers, so the message is patched on the class of the instance
+        with patch.object(type(job_svc), '_create_message', return_value={'message': {'callbacks': []}}):
+            for call in mock_push_task.call_args_list:
+                job_svc.create_alert_notifications(call.args[3])
+
+        self.assertEqual(5, mock_create_notification.call_count)
+        self.assertEqual(0, Job.objects.get(job_id=job_vo.job_id).remained_tasks)
+
+        for alert_vo in Alert.objects.filter(domain_id=self.domain_id):
+            self.assertEqual(alert_vo.escalated_at + timedelta(minutes=10), alert_vo.next_escalation_at)
+
+    @patch.object(NotificationManager, 'create_notification')
+    def test_create_alert_notifications_with_failed_notification(self, mock_create_notification):
+        escalation_policy_vo = self._create_escalation_policy()
+
+        alert_mgr = AlertManager(transaction=self.transaction)
+        alert_vos = [alert_mgr.create_alert({
+            'title': f'alert-{i}',
+            'escalation_policy_id': escalation_policy_vo.escalation_policy_id,
+            'escalation_ttl': 1,
+            'project_id': self.project_id,
+            'domain_id': self.domain_id
+        }) for i in range(3)]
+
+        def _create_notification(message):
+            if message['alert_id'] == alert_vos[1].alert_id:
+                raise Exception('Notification service is unavailable')
+
+        mock_create_notification.side_effect = _create_notification
+
+        job_svc = JobService(transaction=self.transaction)
+        job_vo = JobManager(transaction=self.transaction).create_job(self.domain_id)
+        job_vo.update({'total_tasks': 1, 'remained_tasks': 1})
+
+        with patch.object(type(job_svc), '_create_message',
+                          side_effect=lambda alert_vo, *args, **kwargs: {'alert_id': alert_vo.alert_id,
+                                                                         'message': {'callbacks': []}}):
+            job_svc.create_alert_notifications({
+                'job_id': job_vo.job_id,
+                'alert_ids': [alert_vo.alert_id for alert_vo in alert_vos],
+                'domain_id': self.domain_id
+            })
+
+            # Escalated alerts are not rolled back, so they are not notified again on the next run
+            job_svc.create_alert_notifications({
+                'alert_ids': [alert_vo.alert_id for alert_vo in alert_vos],
+                'domain_id': self.domain_id
+            })
+
+        notified_alert_ids = [call.args[0]['alert_id'] for call in mock_create_notification.call_args_list]
+        self.assertEqual(sorted(alert_vo.alert_id for alert_vo in alert_vos), sorted(notified_alert_ids))
+
+        for alert_vo in Alert.objects.filter(domain_id=self.domain_id):
+            self.assertIsNotNone(alert_vo.escalated_at)
+
+        job_vo = Job.objects.get(job_id=job_vo.job_id)
+        self.assertEqual('ERROR', job_vo.status)
+        self.assertEqual(0, job_vo.remained_tasks)
+
+    @patch.object(IdentityManager, 'get_user')
+    @patch.object(IdentityManager, 'get_project')
+    @patch.object(IdentityManager, 'list_users', return_value={'results': [{'user_id': 'user-1', 'name': 'Alice'}]})
+    @patch.object(IdentityManager, 'list_projects', return_value={'results': [
+        {'project_id': 'project-1', 'name': 'Web', 'project_group_info': {'name': 'Service'}}
+    ]})
+    def test_prefetch_names(self, mock_list_projects, mock_list_users, mock_get_project, mock_get_user):
+        webhook_vo = Webhook.create({'name': 'Prometheus', 'project_id': 'project-1', 'domain_id': self.domain_id})
+
+        alert_vos = [
+            AlertFactory(project_id='project-1', triggered_by='user-1', assignee='user-2', domain_id=self.domain_id),
+            AlertFactory(project_id='project-2', triggered_by=webhook_vo.webhook_id, domain_id=self.domain_id),
+            AlertFactory(project_id='project-1', triggered_by=webhook_vo.webhook_id, domain_id=self.domain_id)
+        ]
+
+        job_svc = JobService(transaction=self.transaction)
+        job_svc._prefetch_names(alert_vos, self.domain_id)
+
+        self.assertEqual(1, mock_list_projects.call_count)
+        self.assertEqual(1, mock_list_users.call_count)
+
+        self.assertEqual('Service > Web', job_svc._get_project_name('project-1', self.domain_id))
+        self.assertEqual('user-1 (Alice)', job_svc._get_triggered_by_name('user-1', self.domain_id))
+        self.assertEqual('Prometheus', job_svc._get_triggered_by_name(webhook_vo.webhook_id, self.domain_id))
+
+        # Names that are not found fall back to their ids without another request
+        self.assertEqual('project-2', job_svc._get_project_name('project-2', self.domain_id))
+        self.assertEqual('user-2', job_svc._get_user_name('user-2', self.domain_id))
+        mock_get_project.assert_not_called()
+        mock_get_user.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)